@@ -0,0 +1,110 @@
+"""
+Admission Control — Bounds how many resume analyses run at once and how many may wait.
+
+Requests beyond the running limit wait in a bounded queue. When the queue is
+full, a request is turned away immediately (429). A queued request that is
+not admitted within the queue timeout gets a 503. Both carry a Retry-After
+estimate based on recent service times, so under a spike a few users get a
+fast answer to retry instead of everyone timing out, and admitted requests
+keep their normal latency.
+"""
+
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Overloaded(Exception):
+    """Raised when a request is shed; carries the HTTP status and a Retry-After hint in seconds."""
+
+    def __init__(self, message, status, retry_after):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Concurrency limiter with a bounded wait queue."""
+
+    def __init__(self, max_concurrent, max_queue, queue_timeout=10.0):
+        self.max_concurrent = max(int(max_concurrent), 1)
+        self.max_queue = max(int(max_queue), 0)
+        self.queue_timeout = queue_timeout
+        self.running = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.shed_queue_full = 0
+        self.shed_timeout = 0
+        self._avg_service = 1.0  # seconds, exponentially weighted
+        self._cond = threading.Condition()
+
+    def retry_after(self):
+        """Seconds until a slot is likely to free up for a new request."""
+        backlog = (self.waiting + self.running) / self.max_concurrent
+        return min(max(math.ceil(backlog * self._avg_service), 1), 60)
+
+    def busy(self):
+        """True while requests are waiting for a slot (callers may shed optional work)."""
+        return self.waiting > 0
+
+    def _enter(self):
+        with self._cond:
+            if self.running < self.max_concurrent and not self.waiting:
+                self.running += 1
+                self.admitted += 1
+                return
+            if self.waiting >= self.max_queue:
+                self.shed_queue_full += 1
+                raise Overloaded("Server is busy, please retry shortly", 429, self.retry_after())
+
+            self.waiting += 1
+            try:
+                admitted = self._cond.wait_for(lambda: self.running < self.max_concurrent, self.queue_timeout)
+            finally:
+                self.waiting -= 1
+            if not admitted:
+                self.shed_timeout += 1
+                raise Overloaded("Server is overloaded, please retry shortly", 503, self.retry_after())
+            self.running += 1
+            self.admitted += 1
+
+    def _exit(self, elapsed):
+        with self._cond:
+            self.running -= 1
+            self._avg_service = 0.8 * self._avg_service + 0.2 * elapsed
+            self._cond.notify()
+
+    @contextmanager
+    def admit(self):
+        """Hold one slot for the duration of the block. Raises Overloaded if the request is shed."""
+        self._enter()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._exit(time.perf_counter() - start)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "running": self.running,
+                "queue_depth": self.waiting,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "admitted": self.admitted,
+                "shed_queue_full": self.shed_queue_full,
+                "shed_timeout": self.shed_timeout,
+                "avg_service_ms": round(self._avg_service * 1000, 1),
+            }
+
+
+def controller_from_env():
+    """AdmissionController configured by MAX_CONCURRENT_ANALYSES, MAX_ANALYSIS_QUEUE and ANALYSIS_QUEUE_TIMEOUT."""
+    max_concurrent = int(os.environ.get("MAX_CONCURRENT_ANALYSES", os.cpu_count() or 1))
+    return AdmissionController(
+        max_concurrent,
+        int(os.environ.get("MAX_ANALYSIS_QUEUE", 2 * max_concurrent)),
+        float(os.environ.get("ANALYSIS_QUEUE_TIMEOUT", 10)),
+    )
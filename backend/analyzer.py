@@ -3,14 +3,41 @@ Analysis Engine — Computes ATS scores, skill comparisons, role matching,
 risk assessment, and generates learning roadmaps from parsed resume data.
 """
 
-from skills_db import JOB_ROLES
+import time
+
+from taxonomy import current
+from metrics import metrics
+from tracing import span
+from matcher import SkillMatcher, get_role_matcher, get_vocabulary_matcher, role_skill_set
+from resume_parser import normalize_text
+from timeline import stale_skills
+from prerequisites import get_skill_graph
+
+
+def get_role_data(parsed_data):
+    """
+    Role definition the resume was parsed against: an ad-hoc profile
+    (e.g. derived from a job description) if present, else the taxonomy's JOB_ROLES entry.
+    """
+    return parsed_data.get("role_profile") or current().job_roles.get(parsed_data["job_role"], {})
+
+
+def get_all_roles(parsed_data):
+    """
+    All roles to match against: the taxonomy's JOB_ROLES plus the ad-hoc profile, if any
+    (named apart from JOB_ROLES, see job_description.jd_role_name, so it never replaces one).
+    """
+    job_roles = current().job_roles
+    if parsed_data.get("role_profile"):
+        return {**job_roles, parsed_data["job_role"]: parsed_data["role_profile"]}
+    return job_roles
 
 
 def compute_ats_score(parsed_data):
     """
     Compute overall ATS score as percentage of required ATS keywords found.
     """
-    role_data = JOB_ROLES.get(parsed_data["job_role"], {})
+    role_data = get_role_data(parsed_data)
     ats_keywords = set(role_data.get("ats_keywords", []))
 
     if not ats_keywords:
@@ -26,7 +53,7 @@ def compute_section_scores(parsed_data):
     Compute ATS compatibility scores per resume section.
     """
     sections = parsed_data["sections"]
-    role_data = JOB_ROLES.get(parsed_data["job_role"], {})
+    role_data = get_role_data(parsed_data)
     tech_skills = set(role_data.get("technical_skills", []))
     found_skills = set(parsed_data["found_skills"])
 
@@ -121,7 +148,7 @@ def compute_keyword_density(parsed_data):
     """
     Compute keyword density for top ATS keywords.
     """
-    role_data = JOB_ROLES.get(parsed_data["job_role"], {})
+    role_data = get_role_data(parsed_data)
     ats_keywords = role_data.get("ats_keywords", [])
     keyword_counts = parsed_data["keyword_counts"]
 
@@ -154,54 +181,222 @@ def compute_keyword_density(parsed_data):
     return results, missing_keywords[:6]
 
 
-def compute_role_matches(parsed_data):
+class RoleIndex:
+    """
+    Precomputed ATS keyword -> roles map.
+    Role match scores for a set of skills, and the effect of adding one more
+    skill, are computed from the posting lists instead of re-intersecting
+    every role's keyword list.
+    """
+
+    def __init__(self, roles):
+        self.roles = []
+        self.sizes = {}
+        self.keyword_roles = {}
+        for role_name, role_data in roles.items():
+            ats_keywords = set(role_data.get("ats_keywords", []))
+            if not ats_keywords:
+                continue
+            self.roles.append(role_name)
+            self.sizes[role_name] = len(ats_keywords)
+            for keyword in ats_keywords:
+                self.keyword_roles.setdefault(keyword, []).append(role_name)
+
+    def matched_counts(self, found_skills):
+        """role -> number of its ATS keywords present in found_skills."""
+        counts = dict.fromkeys(self.roles, 0)
+        for skill in found_skills:
+            for role_name in self.keyword_roles.get(skill, ()):
+                counts[role_name] += 1
+        return counts
+
+    def score(self, role_name, matched):
+        return min(int((matched / self.sizes[role_name]) * 100), 100)
+
+    def scores(self, found_skills):
+        """role -> ATS match score, in role definition order."""
+        return {role_name: self.score(role_name, matched)
+                for role_name, matched in self.matched_counts(found_skills).items()}
+
+
+def get_role_index(parsed_data):
+    """RoleIndex over JOB_ROLES (built once per taxonomy version), or over JOB_ROLES plus an ad-hoc role profile."""
+    if parsed_data.get("role_profile"):
+        return RoleIndex(get_all_roles(parsed_data))
+    taxonomy = current()
+    return taxonomy.cached("role_index", lambda: RoleIndex(taxonomy.job_roles))
+
+
+def warm_taxonomy(taxonomy):
+    """Build a taxonomy's role matchers, vocabulary matcher, role index, course index and skill graph before it is swapped in."""
+    from courses import get_course_index
+
+    for job_role in taxonomy.job_roles:
+        get_role_matcher(job_role, taxonomy)
+    get_vocabulary_matcher(taxonomy)
+    taxonomy.cached("role_index", lambda: RoleIndex(taxonomy.job_roles))
+    get_course_index(taxonomy)
+    get_skill_graph(taxonomy)
+
+
+def _role_icon(score):
+    if score >= 75:
+        return "✔"
+    elif score >= 50:
+        return "⚠"
+    else:
+        return "✖"
+
+
+def compute_role_matches(parsed_data, found_skills=None):
     """
     Compute ATS match scores against all available job roles.
     """
-    found_skills = set(parsed_data["found_skills"])
-    results = []
+    if found_skills is None:
+        found_skills = parsed_data["found_skills"]
+    scores = get_role_index(parsed_data).scores(found_skills)
 
-    for role_name, role_data in JOB_ROLES.items():
-        ats_keywords = set(role_data.get("ats_keywords", []))
-        if not ats_keywords:
-            continue
+    results = [{"role": role_name, "score": score, "icon": _role_icon(score)}
+               for role_name, score in scores.items()]
 
-        matched = found_skills & ats_keywords
-        score = int((len(matched) / len(ats_keywords)) * 100)
-        score = min(score, 100)
+    results.sort(key=lambda x: x["score"], reverse=True)
+    return results
 
-        if score >= 75:
-            icon = "✔"
-        elif score >= 50:
-            icon = "⚠"
+
+def simulate_added_skills(parsed_data, skills, matcher=None):
+    """
+    Return parsed_data as it would look if `skills` were written as one more line
+    in the Skills section. Only skills the role's detector tracks can change the result.
+    keyword_counts are updated by running the role's compiled matcher over the new line,
+    so aliases and multi-skill phrases count exactly as a re-parse would count them.
+    """
+    role_data = get_role_data(parsed_data)
+    if matcher is None:
+        if parsed_data.get("role_profile"):
+            matcher = SkillMatcher(role_skill_set(role_data))
         else:
-            icon = "✖"
+            matcher = get_role_matcher(parsed_data["job_role"])
+
+    added_line = ", ".join(skills)
+    _, added_counts = matcher.match(normalize_text(added_line))
+
+    keyword_counts = dict(parsed_data["keyword_counts"])
+    for skill, count in added_counts.items():
+        keyword_counts[skill] = keyword_counts.get(skill, 0) + count
+    found = set(parsed_data["found_skills"]) | set(added_counts)
+
+    sections = dict(parsed_data["sections"])
+    sections["Skills"] = (sections.get("Skills", "") + "\n" + added_line).strip()
 
+    tech_skills = set(role_data.get("technical_skills", []))
+    soft_skills = set(role_data.get("soft_skills", []))
+
+    simulated = dict(parsed_data)
+    simulated.update({
+        "found_skills": sorted(found),
+        "missing_skills": sorted(set(parsed_data["missing_skills"]) - found),
+        "found_technical": sorted(found & tech_skills),
+        "found_soft": sorted(found & soft_skills),
+        "missing_technical": sorted(tech_skills - found),
+        "missing_soft": sorted(soft_skills - found),
+        "keyword_counts": keyword_counts,
+        "sections": sections,
+    })
+    return simulated
+
+
+def rank_next_keywords(parsed_data, n=5):
+    """
+    Rank the role's missing skills by how much adding each one would raise scores.
+    Gains come from the RoleIndex posting lists: the target role's ATS score first,
+    then the best improvement to any role's match score, then how many roles improve.
+    Returns up to n dicts with the keyword, its gains and the cumulative target score.
+    """
+    index = get_role_index(parsed_data)
+    target = parsed_data["job_role"]
+    tech_skills = set(get_role_data(parsed_data).get("technical_skills", []))
+    matched = index.matched_counts(parsed_data["found_skills"])
+
+    candidates = []
+    for keyword in parsed_data["missing_skills"]:
+        role_gains = {}
+        for role_name in index.keyword_roles.get(keyword, ()):
+            gain = index.score(role_name, matched[role_name] + 1) - index.score(role_name, matched[role_name])
+            if gain:
+                role_gains[role_name] = gain
+        target_gain = role_gains.get(target, 0)
+        candidates.append((
+            (-target_gain, -max(role_gains.values(), default=0), -len(role_gains), keyword not in tech_skills, keyword),
+            keyword, target_gain, role_gains,
+        ))
+
+    candidates.sort()
+    results = []
+    target_matched = matched.get(target, 0)
+    for _, keyword, target_gain, role_gains in candidates[:n]:
+        if target in index.sizes and target_gain:
+            target_matched += 1
         results.append({
-            "role": role_name,
-            "score": score,
-            "icon": icon
+            "keyword": keyword,
+            "ats_gain": target_gain,
+            "ats_score_after": index.score(target, target_matched) if target in index.sizes else 0,
+            "roles_improved": sorted(role_gains, key=lambda r: -role_gains[r]),
         })
-
-    results.sort(key=lambda x: x["score"], reverse=True)
     return results
 
 
-def compute_ats_simulator(ats_score, missing_keywords):
+def canonical_skill_names(role_data):
+    """Casefolded skill name or alias -> canonical skill, for the role's skills and the taxonomy aliases."""
+    names = {skill.casefold(): skill for skill in role_skill_set(role_data)}
+    for alias, canonical in current().skill_aliases.items():
+        names.setdefault(alias.casefold(), canonical)
+    return names
+
+
+def simulate_what_if(parsed_data, skills):
+    """
+    Exact what-if scores after adding `skills`: ATS score, role matches,
+    section scores and the recommended role, computed from the cached parse.
+    """
+    simulated = simulate_added_skills(parsed_data, skills)
+    ats_score = compute_ats_score(simulated)
+    role_matches = compute_role_matches(simulated)
+    recommended = compute_recommended_role(simulated, role_matches)
+    # Requested names are matched like resume text: case-insensitively and through the aliases
+    names = canonical_skill_names(get_role_data(parsed_data))
+    found = set(simulated["found_skills"])
+    tracked = [s for s in skills if names.get(s.strip().casefold()) in found]
+    return {
+        "skills_added": tracked,
+        "skills_not_tracked": [s for s in skills if s not in tracked],
+        "ats_score": ats_score,
+        "role_matches": role_matches,
+        "section_scores": compute_section_scores(simulated),
+        "recommended_role": {"role": recommended["role"], "score": recommended["score"]} if recommended else None,
+    }
+
+
+def compute_ats_simulator(parsed_data, ats_score, top_n=3):
     """
-    Simulate ATS score improvement if top missing keywords are added.
+    Simulate the ATS score after adding the best next missing keywords.
+    The keywords come from rank_next_keywords and the scores are recomputed exactly.
     """
-    # Each missing keyword could add ~3-5% improvement
-    simulated_boost = min(len(missing_keywords[:3]) * 5, 20)
-    simulated_score = min(ats_score + simulated_boost, 98)
+    best = rank_next_keywords(parsed_data, n=max(top_n, 5))
+    chosen = [item["keyword"] for item in best[:top_n]]
+    what_if = simulate_what_if(parsed_data, chosen) if chosen else None
+    simulated_score = what_if["ats_score"] if what_if else ats_score
 
-    keywords_text = " + ".join(missing_keywords[:3]) if missing_keywords else "N/A"
+    keywords_text = " + ".join(chosen) if chosen else "N/A"
 
     return {
         "original_score": ats_score,
         "simulated_score": simulated_score,
         "keywords_added": keywords_text,
-        "insight": f"Incorporating missing keywords and highlighting a project related to {keywords_text} will increase your ATS score."
+        "insight": f"Incorporating missing keywords and highlighting a project related to {keywords_text} will increase your ATS score.",
+        "role_matches": what_if["role_matches"] if what_if else [],
+        "section_scores": what_if["section_scores"] if what_if else [],
+        "recommended_role": what_if["recommended_role"] if what_if else None,
+        "next_best_keywords": best,
     }
 
 
@@ -209,7 +404,7 @@ def compute_skill_comparison(parsed_data):
     """
     Compute skill breakdown comparing resume to industry averages.
     """
-    role_data = JOB_ROLES.get(parsed_data["job_role"], {})
+    role_data = get_role_data(parsed_data)
     industry_avg = role_data.get("industry_avg", {"technical": 75, "soft": 70, "projects": 72})
 
     tech_skills = set(role_data.get("technical_skills", []))
@@ -257,6 +452,10 @@ def compute_skill_comparison(parsed_data):
     else:
         profile = "General"
 
+    # Per-skill recency from dated roles (see timeline.extract_timeline)
+    timeline = parsed_data.get("experience_timeline") or {}
+    recency = timeline.get("skill_recency", {})
+
     return {
         "technical": {"resume": tech_score, "industry": industry_avg["technical"]},
         "soft": {"resume": soft_score, "industry": industry_avg["soft"]},
@@ -265,20 +464,24 @@ def compute_skill_comparison(parsed_data):
         "experience_level": parsed_data["experience_level"],
         "strengths": ", ".join(strengths[:3]) if strengths else "N/A",
         "weaknesses": ", ".join(weaknesses[:3]) if weaknesses else "N/A",
+        "total_experience_years": timeline.get("total_years", 0),
+        "skill_recency": {s: recency[s] for s in sorted(found_tech | found_soft) if s in recency},
+        "stale_skills": stale_skills(timeline, found_tech),
     }
 
 
-def compute_recommended_role(parsed_data):
+def compute_recommended_role(parsed_data, role_matches=None):
     """
     Determine the best-fit job role and provide reasons.
     """
-    role_matches = compute_role_matches(parsed_data)
+    if role_matches is None:
+        role_matches = compute_role_matches(parsed_data)
     if not role_matches:
         return None
 
     best_role = role_matches[0]
     role_name = best_role["role"]
-    role_data = JOB_ROLES.get(role_name, {})
+    role_data = get_all_roles(parsed_data).get(role_name, {})
 
     found_skills = set(parsed_data["found_skills"])
     tech_skills = set(role_data.get("technical_skills", []))
@@ -331,13 +534,16 @@ def compute_learning_roadmap(parsed_data):
 
     missing_technical.sort(key=priority_sort)
 
+    # Then make every skill come after the missing skills it builds on (e.g. Kubernetes after Docker)
+    missing_technical, requires = get_skill_graph().schedule(missing_technical)
+
     # Split into 3 phases
     phase_1_skills = missing_technical[:3]  # Most critical gaps
     phase_2_skills = missing_technical[3:6]
     phase_3_skills = missing_technical[6:9]
 
     # Compute progress for found skills in each category
-    role_data = JOB_ROLES.get(parsed_data["job_role"], {})
+    role_data = get_role_data(parsed_data)
     all_tech = set(role_data.get("technical_skills", []))
 
     # Classify found skills into proficiency levels based on mention count
@@ -352,20 +558,26 @@ def compute_learning_roadmap(parsed_data):
         else:
             return 0
 
+    def roadmap_item(skill, progress):
+        item = {"skill": skill, "status": "pending", "progress": progress}
+        if skill in requires:
+            item["requires"] = requires[skill]
+        return item
+
     # Phase 1: Core Skills (Days 1-30) — focus on strengthening existing + top gaps
     phase1_items = []
     strong_skills = [s for s in found_skills if keyword_counts.get(s, 0) >= 3 and s in all_tech][:2]
     for s in strong_skills:
         phase1_items.append({"skill": s, "status": "done", "progress": skill_progress(s)})
     for s in phase_1_skills[:2]:
-        phase1_items.append({"skill": s, "status": "pending", "progress": max(skill_progress(s), 10)})
+        phase1_items.append(roadmap_item(s, max(skill_progress(s), 10)))
 
     phase1_overall = int(sum(item["progress"] for item in phase1_items) / max(len(phase1_items), 1))
 
     # Phase 2: Intermediate (Days 31-60)
     phase2_items = []
     for s in phase_2_skills[:3]:
-        phase2_items.append({"skill": s, "status": "pending", "progress": max(skill_progress(s), 5)})
+        phase2_items.append(roadmap_item(s, max(skill_progress(s), 5)))
 
     if not phase2_items:
         # Use some missing soft skills
@@ -377,7 +589,7 @@ def compute_learning_roadmap(parsed_data):
     # Phase 3: Advanced (Days 61-90)
     phase3_items = []
     for s in phase_3_skills[:3]:
-        phase3_items.append({"skill": s, "status": "pending", "progress": 0})
+        phase3_items.append(roadmap_item(s, 0))
 
     if not phase3_items:
         phase3_items.append({"skill": "Build Portfolio Project", "status": "pending", "progress": 0})
@@ -426,42 +638,148 @@ def generate_ai_insight(parsed_data, ats_score):
     return insight
 
 
-def run_full_analysis(parsed_data):
+def summarize_parsed_data(parsed_data):
     """
-    Run the complete analysis pipeline and return all results.
+    The subset of parsed data stored alongside the analysis results.
     """
-    ats_score = compute_ats_score(parsed_data)
-    section_scores = compute_section_scores(parsed_data)
-    risk = compute_risk_assessment(ats_score)
+    summary = {
+        "found_skills": parsed_data["found_skills"],
+        "missing_skills": parsed_data["missing_skills"],
+        "found_technical": parsed_data["found_technical"],
+        "found_soft": parsed_data["found_soft"],
+        "missing_technical": parsed_data["missing_technical"],
+        "missing_soft": parsed_data["missing_soft"],
+        "experience_level": parsed_data["experience_level"],
+        "job_role": parsed_data["job_role"],
+        "sections_detected": list(parsed_data["sections"].keys()),
+    }
+    if "fuzzy_hits" in parsed_data:
+        summary["fuzzy_hits"] = parsed_data["fuzzy_hits"]
+    if "experience_timeline" in parsed_data:
+        timeline = parsed_data["experience_timeline"]
+        summary["experience_timeline"] = {"total_years": timeline["total_years"], "roles": timeline["roles"]}
+    return summary
+
+
+def _keyword_density_stage(parsed_data, analysis):
     keyword_density, missing_keywords = compute_keyword_density(parsed_data)
-    role_matches = compute_role_matches(parsed_data)
-    simulator = compute_ats_simulator(ats_score, missing_keywords)
-    skill_comparison = compute_skill_comparison(parsed_data)
-    recommended_role = compute_recommended_role(parsed_data)
-    roadmap = compute_learning_roadmap(parsed_data)
-    insight = generate_ai_insight(parsed_data, ats_score)
+    return {"keyword_density": keyword_density, "missing_keywords": missing_keywords}
+
+
+# Analysis stages in execution order: (name, inputs, compute).
+# Inputs are parsed_data fields or outputs of earlier stages; compute returns a dict of outputs.
+# The job role (and any ad-hoc role profile) is fixed for a session, so it is not listed.
+ANALYSIS_STAGES = [
+    ("ats_score", {"found_skills"},
+     lambda p, a: {"ats_score": compute_ats_score(p)}),
+    ("section_scores", {"found_skills", "keyword_counts", "sections"},
+     lambda p, a: {"section_scores": compute_section_scores(p)}),
+    ("risk_assessment", {"ats_score"},
+     lambda p, a: {"risk_assessment": compute_risk_assessment(a["ats_score"])}),
+    ("keyword_density", {"keyword_counts"},
+     _keyword_density_stage),
+    ("role_matches", {"found_skills"},
+     lambda p, a: {"role_matches": compute_role_matches(p)}),
+    ("simulator", {"ats_score", "found_skills", "keyword_counts", "sections"},
+     lambda p, a: {"simulator": compute_ats_simulator(p, a["ats_score"])}),
+    ("skill_comparison", {"found_skills", "sections", "experience_level", "experience_timeline"},
+     lambda p, a: {"skill_comparison": compute_skill_comparison(p)}),
+    ("recommended_role", {"role_matches", "found_skills", "sections"},
+     lambda p, a: {"recommended_role": compute_recommended_role(p, a["role_matches"])}),
+    ("learning_roadmap", {"found_skills", "keyword_counts"},
+     lambda p, a: {"learning_roadmap": compute_learning_roadmap(p)}),
+    ("ai_insight", {"found_skills", "ats_score"},
+     lambda p, a: {"ai_insight": generate_ai_insight(p, a["ats_score"])}),
+    ("parsed_data", {"found_skills", "sections", "experience_level", "fuzzy_hits", "experience_timeline"},
+     lambda p, a: {"parsed_data": summarize_parsed_data(p)}),
+]
+
+
+# Stages every analysis includes. The others are optional: under a latency budget or load they are
+# skipped, listed in analysis["degraded"] and computed later on demand (see fill_analysis).
+ESSENTIAL_STAGES = {"ats_score", "section_scores", "risk_assessment", "keyword_density", "parsed_data"}
+
+_STAGE_NAMES = {name for name, _, _ in ANALYSIS_STAGES}
+
+
+def stage_fits(name, deadline):
+    """True if stage `name` is expected to finish before deadline (a time.perf_counter() value, or None)."""
+    if deadline is None:
+        return True
+    return time.perf_counter() + metrics.average("stage." + name) <= deadline
+
+
+def _run_stage(name, compute, parsed_data, analysis):
+    start = time.perf_counter()
+    with span("stage." + name):
+        outputs = compute(parsed_data, analysis)
+    metrics.observe("stage." + name, time.perf_counter() - start)
+    return outputs
+
+
+def run_full_analysis(parsed_data, deadline=None, degrade=False):
+    """
+    Run the complete analysis pipeline and return all results.
+    Essential stages always run. Optional ones are skipped when degrade is set or
+    when their usual duration no longer fits before deadline; skipped stages
+    (and stages depending on them) are listed in analysis["degraded"].
+    """
+    analysis = {}
+    degraded = []
+    for name, inputs, compute in ANALYSIS_STAGES:
+        if name not in ESSENTIAL_STAGES and (degrade or inputs & set(degraded) or not stage_fits(name, deadline)):
+            degraded.append(name)
+            continue
+        analysis.update(_run_stage(name, compute, parsed_data, analysis))
+    analysis["taxonomy_version"] = parsed_data.get("taxonomy_version") or current().version
+    if degraded:
+        analysis["degraded"] = degraded
+    return analysis
 
-    return {
-        "ats_score": ats_score,
-        "section_scores": section_scores,
-        "risk_assessment": risk,
-        "keyword_density": keyword_density,
-        "missing_keywords": missing_keywords,
-        "role_matches": role_matches,
-        "simulator": simulator,
-        "skill_comparison": skill_comparison,
-        "recommended_role": recommended_role,
-        "learning_roadmap": roadmap,
-        "ai_insight": insight,
-        "parsed_data": {
-            "found_skills": parsed_data["found_skills"],
-            "missing_skills": parsed_data["missing_skills"],
-            "found_technical": parsed_data["found_technical"],
-            "found_soft": parsed_data["found_soft"],
-            "missing_technical": parsed_data["missing_technical"],
-            "missing_soft": parsed_data["missing_soft"],
-            "experience_level": parsed_data["experience_level"],
-            "job_role": parsed_data["job_role"],
-            "sections_detected": list(parsed_data["sections"].keys()),
-        }
-    }
+
+def fill_analysis(parsed_data, analysis, names):
+    """
+    Compute the degraded stages among `names` (plus the degraded stages they depend on).
+    Returns a new analysis dict; `analysis` is not modified.
+    """
+    degraded = set(analysis.get("degraded", ())) & _STAGE_NAMES
+    wanted = degraded & set(names)
+    # Pull in degraded stages the wanted ones depend on, walking the stages backwards
+    for name, inputs, _ in reversed(ANALYSIS_STAGES):
+        if name in wanted:
+            wanted |= inputs & degraded
+    if not wanted:
+        return analysis
+
+    analysis = dict(analysis)
+    for name, _, compute in ANALYSIS_STAGES:
+        if name in wanted:
+            analysis.update(_run_stage(name, compute, parsed_data, analysis))
+    remaining = [name for name in analysis["degraded"] if name not in wanted]
+    if remaining:
+        analysis["degraded"] = remaining
+    else:
+        del analysis["degraded"]
+    return analysis
+
+
+def update_analysis(parsed_data, previous, changed_fields):
+    """
+    Recompute only the stages whose inputs changed since `previous` was computed.
+    changed_fields names the parsed_data fields that differ (e.g. {"keyword_counts"}).
+    Returns (analysis, recomputed_stage_names); `previous` is not modified.
+    """
+    analysis = dict(previous)
+    dirty = set(changed_fields)
+    recomputed = []
+    # Degraded stages stay degraded; they are computed from the latest data when requested
+    degraded = set(previous.get("degraded", ()))
+
+    for name, inputs, compute in ANALYSIS_STAGES:
+        if dirty & inputs and name not in degraded:
+            outputs = compute(parsed_data, analysis)
+            analysis.update(outputs)
+            dirty.update(outputs)
+            recomputed.append(name)
+
+    return analysis, recomputed
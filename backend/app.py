@@ -3,23 +3,47 @@ Resume Skill Gap Analyzer — Flask Backend
 Serves the frontend and provides API endpoints for resume analysis.
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, g, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import hashlib
+import hmac
+import multiprocessing
 import os
+import sqlite3
 import sys
+import threading
+import time
 import uuid
 
 # Ensure backend modules are importable regardless of working directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, BASE_DIR)
 
-from resume_parser import parse_resume
-from analyzer import run_full_analysis
-from courses import get_recommended_courses
+from resume_parser import parse_resume, parse_text
+from pipeline import analyze_parsed, complete_analysis, reanalyze_parsed, NotAResumeError
+from incremental import IncrementalResume, StoredResume, EditConflictError
+from analyzer import compute_ats_score, rank_next_keywords, simulate_what_if
+from search_index import candidate_document, get_default_index
+from job_description import get_jd_profile, jd_hash, NotEnoughSkillsError
+from analyzer import warm_taxonomy
+from taxonomy import current, pin, unpin, pinned, reload_taxonomy, TaxonomyWatcher, TaxonomyError
+from tenants import get_tenant_taxonomy, UnknownTenantError, TENANT_HEADER
+from metrics import metrics
+from tracing import tracer, annotate, set_error, span
+from cache import LRUCache, SingleFlight
+from compact import compact_analysis
+from admission import controller_from_env, Overloaded
+from fuzzy import fuzzy_enabled_by_default
+from snapshot import SessionSnapshotter
+from export import FORMATS, available_formats, export_chunks, time_range
 
 app = Flask(__name__)
 CORS(app)
 
+# Reject oversized uploads before they are read (413)
+app.config["MAX_CONTENT_LENGTH"] = int(float(os.environ.get("MAX_UPLOAD_MB", 10)) * 1024 * 1024)
+
 UPLOAD_FOLDER = os.path.join("/tmp", "uploads") if os.environ.get("VERCEL") else os.path.join(BASE_DIR, "uploads")
 
 # Determine frontend folder path - works both locally and on Vercel
@@ -33,9 +57,225 @@ else:
 
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
-# In-memory session store: session_id -> analysis results
+# In-memory session store: session_id -> analysis results (as CompactAnalysis records)
 sessions = {}
 
+# Resume text per session, for incremental re-analysis (StoredResume records: the compressed text)
+resume_states = {}
+_edit_lock = threading.Lock()
+
+# IncrementalResume (parsed_data built, plus the line index once edited) for the most recently used
+# sessions, as (StoredResume, IncrementalResume); an entry is current while resume_states holds its StoredResume
+working_states = LRUCache(int(os.environ.get("WORKING_STATE_CACHE", 256)))
+
+# Wall-clock expiry time per session; a session is dropped when it is accessed after it
+SESSION_TTL_SECONDS = float(os.environ.get("SESSION_TTL_SECONDS", 24 * 3600))
+session_expiry = {}
+
+# When each session was last analyzed (unix time; uploads and saved edits), for bulk export
+session_analyzed_at = {}
+
+# Identical uploads that arrive while the first one is still being analyzed share its result
+analysis_flight = SingleFlight()
+
+# Bounded concurrency (plus a bounded wait queue) for the parse and analysis pipeline
+admission = controller_from_env()
+metrics.register("analysis", admission, "admission")
+
+# Latency budget for an analysis request (unset: no budget). Optional sections that would not fit,
+# or that are requested while other analyses are queued, are deferred until a GET endpoint asks for them.
+ANALYSIS_BUDGET_MS = os.environ.get("ANALYSIS_BUDGET_MS")
+
+
+# ============================================================
+#  Request Tracing
+# ============================================================
+
+metrics.register("requests", tracer, "tracing")
+
+
+class TracedJSONProvider(DefaultJSONProvider):
+    """Default JSON provider that records response serialization as a trace span."""
+
+    def response(self, *args, **kwargs):
+        with span("serialize") as s:
+            response = super().response(*args, **kwargs)
+            s.set("response_bytes", response.content_length or 0)
+        return response
+
+
+app.json = TracedJSONProvider(app)
+
+
+# One root span per request (when sampled, see tracing.py); registered first so it covers the other hooks
+@app.before_request
+def _start_trace():
+    route = request.url_rule.rule if request.url_rule else request.path
+    g.trace_token = tracer.begin(f"{request.method} {route}", **{
+        "http.request.method": request.method,
+        "http.route": route,
+        "url.path": request.path,
+    })
+
+
+@app.after_request
+def _trace_response(response):
+    annotate(**{"http.response.status_code": response.status_code})
+    if response.status_code >= 500:
+        set_error(response.status)
+    return response
+
+
+@app.teardown_request
+def _finish_trace(exc):
+    tracer.finish(g.pop("trace_token", None), exc)
+
+
+# ============================================================
+#  Skills Taxonomy
+# ============================================================
+
+# Every request sees one taxonomy snapshot from start to finish; a reload only affects later requests.
+# The X-Tenant-ID header (or ?tenant=) selects a tenant overlay over the base taxonomy.
+@app.before_request
+def _pin_taxonomy():
+    tenant_id = request.headers.get(TENANT_HEADER) or request.args.get("tenant")
+    try:
+        taxonomy = get_tenant_taxonomy(tenant_id)
+    except UnknownTenantError as e:
+        return jsonify({"error": str(e)}), 404
+    except TaxonomyError as e:
+        return jsonify({"error": str(e)}), 500
+    g.taxonomy_token = pin(taxonomy)
+    if tenant_id:
+        annotate(tenant=tenant_id)
+
+
+@app.teardown_request
+def _unpin_taxonomy(exc):
+    token = g.pop("taxonomy_token", None)
+    if token is not None:
+        unpin(token)
+
+
+def _start_taxonomy_watcher():
+    """Poll TAXONOMY_PATH for changes when TAXONOMY_WATCH_INTERVAL (seconds) is set."""
+    path = os.environ.get("TAXONOMY_PATH")
+    interval = float(os.environ.get("TAXONOMY_WATCH_INTERVAL", 0) or 0)
+    # Like snapshots, only the serving process watches, not spawned workers re-importing this module
+    if not path or interval <= 0 or multiprocessing.parent_process() is not None:
+        return None
+    watcher = TaxonomyWatcher(path, interval, warm=warm_taxonomy,
+                              on_error=lambda e: app.logger.error("Taxonomy reload failed: %s", e))
+    watcher.start()
+    return watcher
+
+
+def _warm_initial_taxonomy():
+    """Compile a TAXONOMY_PATH taxonomy at startup, so a file that loads but cannot be used stops the service here."""
+    if os.environ.get("TAXONOMY_PATH") and multiprocessing.parent_process() is None:
+        warm_taxonomy(current())
+
+
+_warm_initial_taxonomy()
+taxonomy_watcher = _start_taxonomy_watcher()
+
+
+# ============================================================
+#  Session Snapshots
+# ============================================================
+
+# How long a snapshot waits for an edit in progress before reading that session anyway
+SNAPSHOT_EDIT_WAIT = 1.0
+_restore_lock = threading.Lock()
+
+
+def _drop_session(session_id):
+    sessions.pop(session_id, None)
+    resume_states.pop(session_id, None)
+    working_states.pop(session_id)
+    session_expiry.pop(session_id, None)
+    session_analyzed_at.pop(session_id, None)
+
+
+def _expired(session_id, now=None):
+    """True (and the session is dropped) if session_id is past its expiry time."""
+    if session_expiry.get(session_id, float("inf")) > (now or time.time()):
+        return False
+    _drop_session(session_id)
+    metrics.increment("sessions.expired")
+    return True
+
+
+def _session_records():
+    """(session_id, expires_at, record) for every live session, for snapshotter.save (drops expired ones)."""
+    now = time.time()
+    for session_id, expires_at in session_expiry.copy().items():
+        if _expired(session_id, now):
+            continue
+        # Bounded wait: an edit may still be running in a request thread when the exit save starts
+        locked = _edit_lock.acquire(timeout=SNAPSHOT_EDIT_WAIT)
+        try:
+            session, state = sessions.get(session_id), resume_states.get(session_id)
+        finally:
+            if locked:
+                _edit_lock.release()
+        if session is None or state is None:
+            continue
+        # parsed_data is not saved: it is rebuilt from the text when the session is next used
+        yield session_id, expires_at, {
+            "analysis": session,
+            "analyzed_at": session_analyzed_at.get(session_id),
+            "text": state.text,
+            "job_role": state.job_role,
+            "role_data": state.role_data,
+            "fuzzy": state.fuzzy,
+        }
+
+
+def _restore_session(session_id):
+    """
+    The session from the last snapshot, restored on first use after a restart (None if it is not there).
+    Its resume state is rebuilt under the request's taxonomy.
+    """
+    if snapshotter is None:
+        return None
+    with _restore_lock:
+        if session_id in sessions:
+            return sessions[session_id]
+        restored = snapshotter.restore(session_id)
+        if restored is None:
+            return None
+        record, expires_at = restored
+        resume_states[session_id] = StoredResume(record["text"], record["job_role"], role_data=record["role_data"],
+                                                 fuzzy=record["fuzzy"])
+        session_expiry[session_id] = expires_at
+        session_analyzed_at[session_id] = record["analyzed_at"]
+        session = sessions[session_id] = record["analysis"]
+    metrics.increment("sessions.restored")
+    return session
+
+
+def _start_session_snapshots():
+    """
+    Snapshot sessions to SESSION_SNAPSHOT_PATH every SESSION_SNAPSHOT_INTERVAL seconds (default 60),
+    on SIGTERM and at exit, and make the previous snapshot's sessions restorable.
+    """
+    path = os.environ.get("SESSION_SNAPSHOT_PATH")
+    # Worker processes (a spawned pool re-imports this module when it is run as a script) never snapshot
+    if not path or multiprocessing.parent_process() is not None:
+        return None
+    interval = float(os.environ.get("SESSION_SNAPSHOT_INTERVAL", 60) or 0)
+    snapshots = SessionSnapshotter(path, _session_records, interval,
+                                   on_error=lambda e: app.logger.error("Session snapshot failed: %s", e))
+    snapshots.open()
+    snapshots.start()
+    metrics.register("sessions", snapshots, "snapshots")
+    return snapshots
+
+
+snapshotter = _start_session_snapshots()
+
 
 # ============================================================
 #  Static File Serving
@@ -100,6 +340,7 @@ def upload_resume():
     Upload a resume file and job role.
     Parses the resume, runs full analysis, stores results in session.
     Returns a session_id for subsequent API calls.
+    Optional form field "fuzzy" turns approximate skill matching on or off.
     """
     if "resume" not in request.files:
         return jsonify({"error": "Resume file is required"}), 400
@@ -112,74 +353,280 @@ def upload_resume():
     if not file.filename:
         return jsonify({"error": "No file selected"}), 400
 
-    # Save the uploaded file
-    safe_name = f"{uuid.uuid4().hex}_{file.filename}"
-    file_path = os.path.join(UPLOAD_FOLDER, safe_name)
-    file.save(file_path)
+    return _analyze_upload(file, job_role, fuzzy=_fuzzy_option(request.form))
+
+
+@app.route("/api/match-job-description", methods=["POST"])
+def match_job_description():
+    """
+    Upload a resume plus pasted job-description text (and an optional title).
+    The required skills are extracted from the JD and the resume is analyzed
+    against that ad-hoc role. Returns a session_id like /upload-resume.
+    """
+    if "resume" not in request.files:
+        return jsonify({"error": "Resume file is required"}), 400
+
+    jd_text = request.form.get("jobDescription", "")
+    if not jd_text.strip():
+        return jsonify({"error": "Job description is required"}), 400
+
+    file = request.files["resume"]
+    if not file.filename:
+        return jsonify({"error": "No file selected"}), 400
 
     try:
-        # Parse the resume
-        parsed_data = parse_resume(file_path, job_role)
-
-        # ── Validate: does this look like a resume? ──
-        resume_indicators = [
-            "education", "experience", "skills", "projects", "work",
-            "university", "college", "degree", "certifications",
-            "summary", "objective", "qualification", "employment",
-            "intern", "professional", "achievements", "responsibilities",
-            "bachelor", "master", "gpa", "resume", "curriculum vitae"
-        ]
-        text_lower = parsed_data.get("raw_text", "").lower()
-        matches = sum(1 for kw in resume_indicators if kw in text_lower)
-
-        if matches < 2:
-            return jsonify({
-                "error": "This file does not appear to be a resume. Please upload a valid resume (PDF or DOCX) containing sections like Education, Experience, Skills, etc."
-            }), 400
+        role_name, profile, matcher = get_jd_profile(jd_text, request.form.get("jobTitle"))
+    except NotEnoughSkillsError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return _analyze_upload(file, role_name, role_data=profile, matcher=matcher,
+                           fuzzy=_fuzzy_option(request.form), profile_key=jd_hash(jd_text, role_name), extra={
+        "job_profile": {
+            "role": role_name,
+            "technical_skills": profile["technical_skills"],
+            "soft_skills": profile["soft_skills"],
+        }
+    })
 
-        # Run full analysis
-        analysis = run_full_analysis(parsed_data)
 
-        # Get course recommendations
-        courses = get_recommended_courses(parsed_data)
-        analysis["courses"] = courses
+def _fuzzy_option(payload):
+    """The optional "fuzzy" request flag: True/False, or None to use the FUZZY_SKILL_MATCHING default."""
+    value = payload.get("fuzzy")
+    if value is None or value == "":
+        return None
+    return str(value).lower() in ("1", "true", "yes")
 
-        # Store in session
-        session_id = uuid.uuid4().hex
-        sessions[session_id] = analysis
 
-        return jsonify({
+def _store_session(parsed_data, analysis):
+    """Store an analysis under a new session id (and in the search index, if enabled)."""
+    session_id = uuid.uuid4().hex
+
+    # Add to the candidate search index, if enabled. The index is secondary: a failed write
+    # (locked database, full disk) is logged and the session is still stored and returned.
+    index = get_default_index()
+    if index is not None:
+        try:
+            index.add(session_id, candidate_document(parsed_data, analysis))
+        except sqlite3.Error as e:
+            app.logger.error("Search index write failed for session %s: %s", session_id, e)
+            metrics.increment("search_index.write_failed")
+
+    sessions[session_id] = compact_analysis(analysis)
+    resume = IncrementalResume(
+        parsed_data["raw_text"], parsed_data["job_role"], role_data=parsed_data.get("role_profile"),
+        parsed_data=parsed_data, fuzzy="fuzzy_hits" in parsed_data)
+    stored = resume_states[session_id] = StoredResume.from_resume(resume)
+    working_states.put(session_id, (stored, resume))
+    session_analyzed_at[session_id] = time.time()
+    session_expiry[session_id] = session_analyzed_at[session_id] + SESSION_TTL_SECONDS
+
+    return session_id
+
+
+def _coalesced(kind, content, job_role, fuzzy, compute, profile_key=""):
+    """
+    Run compute(deadline, degrade) -> (parsed_data, analysis) once for concurrent requests with
+    the same content, role, options and taxonomy; the others wait and share its (read-only) result.
+    The run itself goes through admission control and may raise Overloaded. Optional analysis
+    stages are degraded past the ANALYSIS_BUDGET_MS deadline or while other analyses are queued.
+    """
+    if fuzzy is None:
+        fuzzy = fuzzy_enabled_by_default()
+    key = (kind, hashlib.sha256(content).hexdigest(), job_role, profile_key, fuzzy, current().version)
+    deadline = time.perf_counter() + float(ANALYSIS_BUDGET_MS) / 1000 if ANALYSIS_BUDGET_MS else None
+
+    def admitted():
+        queued = time.perf_counter()
+        with admission.admit():
+            annotate(queue_wait_ms=round((time.perf_counter() - queued) * 1000, 3))
+            degrade = admission.busy()
+            if degrade:
+                metrics.increment("analysis.degraded_under_load")
+            return compute(deadline, degrade)
+
+    result, shared = analysis_flight.do(key, admitted)
+    annotate(coalesced=shared)
+    metrics.increment("analysis.coalesced" if shared else "analysis.computed")
+    return result
+
+
+def _analyze_upload(file, job_role, role_data=None, matcher=None, fuzzy=None, extra=None, profile_key=""):
+    """Save an uploaded resume, run the pipeline, store the session and build the response."""
+    content = file.read()
+    extension = os.path.splitext(file.filename)[1].lower()
+    annotate(upload_bytes=len(content))
+
+    def analyze(deadline, degrade):
+        # Save the uploaded file
+        safe_name = f"{uuid.uuid4().hex}_{file.filename}"
+        file_path = os.path.join(UPLOAD_FOLDER, safe_name)
+        with open(file_path, "wb") as f:
+            f.write(content)
+
+        try:
+            # Parse, validate and analyze the resume
+            parsed_data = parse_resume(file_path, job_role, role_data=role_data, matcher=matcher, fuzzy=fuzzy)
+            return parsed_data, analyze_parsed(parsed_data, deadline, degrade)
+        finally:
+            # Clean up uploaded file
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+    try:
+        parsed_data, analysis = _coalesced("file" + extension, content, job_role, fuzzy, analyze, profile_key)
+        session_id = _store_session(parsed_data, analysis)
+
+        response = {
             "success": True,
             "session_id": session_id,
             "message": "Resume analyzed successfully"
-        })
+        }
+        if analysis.get("degraded"):
+            response["degraded"] = analysis["degraded"]
+        response.update(extra or {})
+        return jsonify(response)
+
+    except NotAResumeError as e:
+        return jsonify({"error": str(e)}), 400
+
+    except Overloaded as e:
+        return _overloaded_response(e)
 
     except Exception as e:
         return jsonify({"error": f"Failed to analyze resume: {str(e)}"}), 500
 
-    finally:
-        # Clean up uploaded file
-        try:
-            os.remove(file_path)
-        except OSError:
-            pass
+
+@app.errorhandler(Overloaded)
+def _overloaded_response(e):
+    response = jsonify({"error": str(e), "retry_after": e.retry_after})
+    response.status_code = e.status
+    response.headers["Retry-After"] = str(e.retry_after)
+    return response
+
+
+@app.errorhandler(413)
+def request_too_large(e):
+    limit_mb = app.config["MAX_CONTENT_LENGTH"] / (1024 * 1024)
+    return jsonify({"error": f"Upload too large (limit {round(limit_mb, 2):g} MB)"}), 413
+
+
+@app.route("/api/analyze-text", methods=["POST"])
+def api_analyze_text():
+    """
+    Analyze resume text that was already extracted elsewhere (e.g. by an ATS).
+    JSON body: {"text": "...", "jobRole": "...", "inline": false, "fuzzy": false}
+    Skips file extraction and the uploads folder entirely. With "inline": true
+    the full report is returned directly and no session is created.
+    """
+    start = time.perf_counter()
+    payload = request.get_json(silent=True) or request.form
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+
+    text = payload.get("text", "")
+    if not isinstance(text, str) or not text.strip():
+        return jsonify({"error": "Resume text is required"}), 400
+
+    job_role = payload.get("jobRole", "")
+    if not job_role:
+        return jsonify({"error": "Job role is required"}), 400
+
+    inline = str(payload.get("inline", "")).lower() in ("1", "true", "yes")
+
+    try:
+        fuzzy = _fuzzy_option(payload)
+
+        def analyze(deadline, degrade):
+            parsed_data = parse_text(text, job_role, fuzzy=fuzzy)
+            return parsed_data, analyze_parsed(parsed_data, deadline, degrade)
+
+        parsed_data, analysis = _coalesced("text", text.encode("utf-8"), job_role, fuzzy, analyze)
+    except NotAResumeError as e:
+        return jsonify({"error": str(e)}), 400
+    except Overloaded as e:
+        return _overloaded_response(e)
+    except Exception as e:
+        return jsonify({"error": f"Failed to analyze resume: {str(e)}"}), 500
+
+    if inline:
+        response = {"success": True, "analysis": analysis}
+    else:
+        response = {
+            "success": True,
+            "session_id": _store_session(parsed_data, analysis),
+            "message": "Resume analyzed successfully"
+        }
+        if analysis.get("degraded"):
+            response["degraded"] = analysis["degraded"]
+    response["server_time_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return jsonify(response)
 
 
 # ============================================================
 #  Analysis API Endpoints
 # ============================================================
 
-def get_session(session_id):
-    """Helper to retrieve session data."""
-    if not session_id or session_id not in sessions:
+def get_session(session_id, *sections):
+    """
+    Helper to retrieve session data. Any of the named sections that were
+    degraded at analysis time are computed now and stored with the session.
+    Expired sessions are dropped; sessions from before a restart are restored from the snapshot.
+    """
+    if not session_id:
         return None
-    return sessions[session_id]
+    session = sessions.get(session_id)
+    if session is None:
+        session = _restore_session(session_id)
+    elif _expired(session_id):
+        session = None
+    if session is None:
+        return None
+    if sections and set(sections) & set(session.get("degraded", ())):
+        session = _complete_session(session_id, session, sections)
+    return session
+
+
+def _working_state(session_id, stored):
+    """The IncrementalResume for a stored resume: from working_states, or rebuilt from its text and cached."""
+    cached = working_states.get(session_id)
+    if cached is not None and cached[0] is stored:
+        return cached[1]
+    resume = stored.editable()
+    working_states.put(session_id, (stored, resume))
+    metrics.increment("sessions.working_state_rebuilt")
+    return resume
+
+
+def _complete_session(session_id, session, sections):
+    """
+    Compute degraded sections now, as an admitted analysis (raises Overloaded when shed).
+    The work runs outside the edit lock; stored records are read-only, so the completed record
+    replaces the one it was built from only if no edit or other completion replaced that meanwhile.
+    """
+    with admission.admit():
+        while True:
+            with _edit_lock:
+                state = resume_states.get(session_id)
+                session = sessions.get(session_id, session)
+            if state is None or not set(sections) & set(session.get("degraded", ())):
+                return session
+            with pinned(state.taxonomy):
+                parsed_data = _working_state(session_id, state).parsed_data()
+                completed = compact_analysis(complete_analysis(parsed_data, session, sections))
+            with _edit_lock:
+                if sessions.get(session_id) is session:
+                    sessions[session_id] = completed
+                    break
+    metrics.increment("analysis.deferred_completed")
+    return completed
 
 
 @app.route("/api/resume-summary")
 def api_resume_summary():
     """Return resume summary and skill comparison data."""
-    session = get_session(request.args.get("session_id"))
+    session = get_session(request.args.get("session_id"), "skill_comparison")
     if not session:
         return jsonify({"error": "Session not found. Please upload a resume first."}), 404
 
@@ -198,13 +645,14 @@ def api_resume_summary():
         "found_soft": parsed["found_soft"],
         "missing_technical": parsed["missing_technical"],
         "missing_soft": parsed["missing_soft"],
+        "taxonomy_version": session.get("taxonomy_version"),
     })
 
 
 @app.route("/api/ats-analysis")
 def api_ats_analysis():
     """Return ATS analysis data."""
-    session = get_session(request.args.get("session_id"))
+    session = get_session(request.args.get("session_id"), "role_matches", "simulator", "ai_insight")
     if not session:
         return jsonify({"error": "Session not found. Please upload a resume first."}), 404
 
@@ -232,7 +680,7 @@ def api_ats_analysis():
 @app.route("/api/recommended-roles")
 def api_recommended_roles():
     """Return recommended job roles."""
-    session = get_session(request.args.get("session_id"))
+    session = get_session(request.args.get("session_id"), "recommended_role")
     if not session:
         return jsonify({"error": "Session not found. Please upload a resume first."}), 404
 
@@ -242,7 +690,7 @@ def api_recommended_roles():
 @app.route("/api/suggested-courses")
 def api_suggested_courses():
     """Return suggested courses based on skill gaps."""
-    session = get_session(request.args.get("session_id"))
+    session = get_session(request.args.get("session_id"), "courses")
     if not session:
         return jsonify({"error": "Session not found. Please upload a resume first."}), 404
 
@@ -252,13 +700,263 @@ def api_suggested_courses():
 @app.route("/api/learning-roadmap")
 def api_learning_roadmap():
     """Return the 90-day learning roadmap."""
-    session = get_session(request.args.get("session_id"))
+    session = get_session(request.args.get("session_id"), "learning_roadmap")
     if not session:
         return jsonify({"error": "Session not found. Please upload a resume first."}), 404
 
     return jsonify(session["learning_roadmap"])
 
 
+@app.route("/api/edit-resume", methods=["POST"])
+def api_edit_resume():
+    """
+    Apply edits to a session's resume text and re-analyze incrementally.
+    JSON body: {"session_id": "...",
+                "edits": [{"section": "Skills", "content": "..."}],   (and/or)
+                "diff": "<unified diff against the current text>",
+                "preview": false}
+    Only the edited lines are re-scanned and only analysis stages whose inputs
+    changed are recomputed. With "preview": true the session is left untouched.
+    """
+    start = time.perf_counter()
+    payload = request.get_json(silent=True) or {}
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    session_id = payload.get("session_id")
+    if session_id is not None and not isinstance(session_id, str):
+        return jsonify({"error": "'session_id' must be a string"}), 400
+
+    session = get_session(session_id)
+    state = resume_states.get(session_id)
+    if not session or state is None:
+        return jsonify({"error": "Session not found. Please upload a resume first."}), 404
+
+    edits = payload.get("edits") or []
+    diff = payload.get("diff") or ""
+    if not edits and not diff:
+        return jsonify({"error": "Provide 'edits' and/or 'diff'"}), 400
+    if not isinstance(edits, list) or not all(
+            isinstance(e, dict) and "section" in e and isinstance(e.get("content", ""), str) for e in edits):
+        return jsonify({"error": "Each edit needs a 'section' and 'content' (a string)"}), 400
+    if not isinstance(diff, str):
+        return jsonify({"error": "'diff' must be a string"}), 400
+
+    preview = bool(payload.get("preview"))
+
+    # Re-analyze against the taxonomy version the session was parsed with
+    with pinned(state.taxonomy), _edit_lock:
+        state = resume_states.get(session_id, state)
+        session = sessions.get(session_id, session)
+        # Edits go to a copy that replaces the stored state only once all of them apply
+        target = _working_state(session_id, state).copy()
+        try:
+            parsed_data, changed = target.apply_edits(edits=edits, diff=diff)
+        except EditConflictError as e:
+            return jsonify({"error": str(e)}), 409
+
+        analysis, recomputed = reanalyze_parsed(parsed_data, session, changed)
+        if not preview:
+            stored = resume_states[session_id] = StoredResume.from_resume(target)
+            working_states.put(session_id, (stored, target))
+            sessions[session_id] = compact_analysis(analysis)
+            session_analyzed_at[session_id] = time.time()
+
+    return jsonify({
+        "success": True,
+        "preview": preview,
+        "changed": sorted(changed),
+        "recomputed": recomputed,
+        "ats_score": analysis["ats_score"],
+        "section_scores": analysis["section_scores"],
+        "keyword_density": analysis["keyword_density"],
+        "missing_keywords": analysis["missing_keywords"],
+        "degraded": analysis.get("degraded", []),
+        "server_time_ms": round((time.perf_counter() - start) * 1000, 3),
+    })
+
+
+@app.route("/api/simulate", methods=["POST"])
+def api_simulate():
+    """
+    Exact what-if scores for adding skills to the resume.
+    JSON body: {"session_id": "...", "skills": ["Docker", "Kubernetes"]}
+    Works from the session's cached parse; nothing is re-extracted or re-parsed.
+    """
+    payload = request.get_json(silent=True) or {}
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    session_id = payload.get("session_id")
+    if session_id is not None and not isinstance(session_id, str):
+        return jsonify({"error": "'session_id' must be a string"}), 400
+    session = get_session(session_id)
+    state = resume_states.get(session_id)
+    if not session or state is None:
+        return jsonify({"error": "Session not found. Please upload a resume first."}), 404
+
+    skills = payload.get("skills") or []
+    if not isinstance(skills, list) or not all(isinstance(s, str) for s in skills):
+        return jsonify({"error": "'skills' must be a list of skill names"}), 400
+
+    with pinned(state.taxonomy):
+        parsed_data = _working_state(session_id, state).parsed_data()
+        result = simulate_what_if(parsed_data, skills)
+        result["original_score"] = compute_ats_score(parsed_data)
+    return jsonify(result)
+
+
+@app.route("/api/next-keywords")
+def api_next_keywords():
+    """Return the N missing keywords that would raise the ATS score the most."""
+    session_id = request.args.get("session_id")
+    session = get_session(session_id)
+    state = resume_states.get(session_id)
+    if not session or state is None:
+        return jsonify({"error": "Session not found. Please upload a resume first."}), 404
+
+    try:
+        n = min(max(int(request.args.get("n", 5)), 1), 50)
+    except ValueError:
+        return jsonify({"error": "n must be an integer"}), 400
+
+    with pinned(state.taxonomy):
+        return jsonify({"keywords": rank_next_keywords(_working_state(session_id, state).parsed_data(), n)})
+
+
+# ============================================================
+#  Taxonomy Admin API
+# ============================================================
+
+@app.route("/api/taxonomy")
+def api_taxonomy():
+    """Version and size of the active skills taxonomy."""
+    return jsonify(current().describe())
+
+
+@app.route("/api/metrics")
+def api_metrics():
+    """Compile times, cache hit rates and other in-process metrics."""
+    return jsonify(metrics.snapshot())
+
+
+@app.route("/api/admin/reload-taxonomy", methods=["POST"])
+def api_reload_taxonomy():
+    """
+    Reload the taxonomy file (TAXONOMY_PATH). Matchers and role indexes for the new
+    version are built before it is swapped in, so requests in flight are never paused.
+    Requires the X-Admin-Token header to equal TAXONOMY_ADMIN_TOKEN.
+    """
+    token = os.environ.get("TAXONOMY_ADMIN_TOKEN")
+    if not token:
+        return jsonify({"error": "Taxonomy reload is not enabled"}), 404
+    if not hmac.compare_digest(request.headers.get("X-Admin-Token", "").encode(), token.encode()):
+        return jsonify({"error": "Invalid admin token"}), 403
+
+    previous = current().version
+    try:
+        taxonomy = reload_taxonomy(warm=warm_taxonomy)
+    except TaxonomyError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"success": True, "previous_version": previous, **taxonomy.describe()})
+
+
+# ============================================================
+#  Candidate Search API
+# ============================================================
+
+def _split_param(name):
+    """Split a comma-separated query parameter into a list of non-empty values."""
+    return [v.strip() for v in request.args.get(name, "").split(",") if v.strip()]
+
+
+@app.route("/api/search")
+def api_search():
+    """
+    Search analyzed candidates, e.g.
+    /api/search?has=PyTorch,Docker&missing=Kubernetes&level=Mid&role=AI / ML Engineer
+    """
+    index = get_default_index()
+    if index is None:
+        return jsonify({"error": "Candidate search index is not enabled"}), 404
+
+    try:
+        limit = min(int(request.args.get("limit", 20)), 200)
+        offset = max(int(request.args.get("offset", 0)), 0)
+    except ValueError:
+        return jsonify({"error": "limit and offset must be integers"}), 400
+
+    try:
+        results = index.search(
+            has=_split_param("has"),
+            missing=_split_param("missing"),
+            level=request.args.get("level") or None,
+            role=request.args.get("role") or None,
+            text=request.args.get("q") or None,
+            limit=limit,
+            offset=offset,
+        )
+    except sqlite3.OperationalError as e:
+        return jsonify({"error": f"Invalid search query: {str(e)}"}), 400
+
+    return jsonify({"results": results, "count": len(results)})
+
+
+# ============================================================
+#  Bulk Export API
+# ============================================================
+
+def _export_records(since, until):
+    """
+    (session_id, analyzed_at, analysis) for each session analyzed in [since, until): live ones
+    (with a deferred recommended role computed now), then any not yet restored from the snapshot.
+    """
+    for session_id in list(sessions):
+        analyzed_at = session_analyzed_at.get(session_id)
+        if analyzed_at is None or not since <= analyzed_at < until:
+            continue
+        try:
+            session = get_session(session_id, "recommended_role")
+        except Overloaded:
+            # Under load the export keeps streaming; the row just has no recommended role
+            session = sessions.get(session_id)
+        if session is not None:
+            yield session_id, analyzed_at, session
+    if snapshotter is not None:
+        for session_id, _, record in snapshotter.iter_pending():
+            analyzed_at = record["analyzed_at"]
+            if session_id not in sessions and since <= analyzed_at < until:
+                yield session_id, analyzed_at, record["analysis"]
+
+
+@app.route("/api/admin/export")
+def api_export():
+    """
+    Stream every stored analysis as flat rows (see export.py).
+    Query: format=csv|ndjson|parquet|arrow (default csv; the last two need pyarrow) and
+    day=YYYY-MM-DD or since= / until= (ISO dates or times, UTC).
+    Requires the X-Admin-Token header to equal EXPORT_ADMIN_TOKEN.
+    """
+    token = os.environ.get("EXPORT_ADMIN_TOKEN")
+    if not token:
+        return jsonify({"error": "Export is not enabled"}), 404
+    if not hmac.compare_digest(request.headers.get("X-Admin-Token", "").encode(), token.encode()):
+        return jsonify({"error": "Invalid admin token"}), 403
+
+    fmt = request.args.get("format", "csv")
+    formats = available_formats()
+    if fmt not in formats:
+        return jsonify({"error": f"format must be one of: {', '.join(formats)}"}), 400
+    try:
+        since, until = time_range(request.args.get("day"), request.args.get("since"), request.args.get("until"))
+    except ValueError as e:
+        return jsonify({"error": f"Invalid date: {e}"}), 400
+
+    media_type, extension = FORMATS[fmt][:2]
+    # stream_with_context keeps the request (and its pinned taxonomy) alive while rows are generated
+    response = Response(stream_with_context(export_chunks(fmt, _export_records(since, until))), mimetype=media_type)
+    response.headers["Content-Disposition"] = f'attachment; filename="analyses.{extension}"'
+    return response
+
+
 # ============================================================
 #  Run Server
 # ============================================================
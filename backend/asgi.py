@@ -0,0 +1,173 @@
+"""
+ASGI Entry Point — Serves the same routes as the Flask app to an ASGI server.
+
+    cd backend && uvicorn asgi:application --workers 2
+    uvicorn backend.asgi:application          (from the project root)
+
+Request bodies are received on the event loop, so a slow client upload
+occupies a coroutine rather than a worker thread; the body limit
+(MAX_CONTENT_LENGTH) is checked before and while it streams in. The
+complete request is then handed to the Flask WSGI app in a thread pool:
+POSTs (parsing and analysis) go to a work pool sized to the admission
+controller's running + queued limit, everything else to a separate read
+pool, so /api/* reads never wait behind a long parse. Response bodies are
+streamed back chunk by chunk.
+
+No ASGI framework is required; only an ASGI server such as uvicorn.
+"""
+
+import asyncio
+import io
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Ensure backend modules are importable regardless of working directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+from app import app as flask_app, admission
+
+read_executor = ThreadPoolExecutor(int(os.environ.get("ASGI_READ_THREADS", 8)), thread_name_prefix="asgi-read")
+work_executor = ThreadPoolExecutor(admission.max_concurrent + admission.max_queue + 1, thread_name_prefix="asgi-work")
+
+
+class ClientDisconnected(Exception):
+    """Raised when the client goes away before its request body is complete."""
+
+
+def build_environ(scope, body):
+    """PEP 3333 environ for an ASGI HTTP scope and its complete body."""
+    raw_path = scope.get("raw_path")
+    path = raw_path.split(b"?", 1)[0].decode("latin-1") if raw_path else scope["path"].encode("utf-8").decode("latin-1")
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path,
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": "HTTP/" + scope.get("http_version", "1.1"),
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope["headers"]:
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name == "CONTENT_LENGTH":
+            continue
+        key = name if name == "CONTENT_TYPE" else "HTTP_" + name
+        environ[key] = environ[key] + "," + value if key in environ else value
+    return environ
+
+
+def call_wsgi(environ):
+    """Run the Flask app; returns (status_code, headers, body_iterable)."""
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = int(status.split(" ", 1)[0])
+        response["headers"] = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+        return lambda data: response.setdefault("written", []).append(data)
+
+    body = flask_app(environ, start_response)
+    if response.get("written"):
+        body = response["written"] + list(body)
+    return response["status"], response["headers"], body
+
+
+async def read_body(receive, limit):
+    """Receive the whole request body; returns None if it grows past limit bytes."""
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise ClientDisconnected()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if limit is not None and size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+async def send_json(send, status, payload, headers=()):
+    body = json.dumps(payload).encode("utf-8")
+    await send({"type": "http.response.start", "status": status, "headers": [
+        (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()), *headers]})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def handle_http(scope, receive, send):
+    limit = flask_app.config.get("MAX_CONTENT_LENGTH")
+    headers = dict(scope["headers"])
+    declared = headers.get(b"content-length")
+    too_large = {"error": f"Upload too large (limit {round((limit or 0) / (1024 * 1024), 2):g} MB)"}
+    if limit is not None and declared is not None and declared.isdigit() and int(declared) > limit:
+        await send_json(send, 413, too_large, [(b"connection", b"close")])
+        return
+
+    try:
+        body = await read_body(receive, limit)
+    except ClientDisconnected:
+        return
+    if body is None:
+        await send_json(send, 413, too_large, [(b"connection", b"close")])
+        return
+
+    loop = asyncio.get_running_loop()
+    executor = work_executor if scope["method"] == "POST" else read_executor
+    status, response_headers, iterable = await loop.run_in_executor(executor, call_wsgi, build_environ(scope, body))
+
+    await send({"type": "http.response.start", "status": status, "headers": response_headers})
+    try:
+        if isinstance(iterable, (list, tuple)):
+            for chunk in iterable:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            # Streamed responses (e.g. files) are pulled chunk by chunk off the event loop
+            iterator = iter(iterable)
+            while True:
+                chunk = await loop.run_in_executor(executor, next, iterator, None)
+                if chunk is None:
+                    break
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        close = getattr(iterable, "close", None)
+        if close is not None:
+            await loop.run_in_executor(executor, close)
+
+
+async def handle_lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            read_executor.shutdown(wait=False)
+            work_executor.shutdown(wait=True)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope, receive, send):
+    """The ASGI application."""
+    if scope["type"] == "http":
+        await handle_http(scope, receive, send)
+    elif scope["type"] == "lifespan":
+        await handle_lifespan(receive, send)
+    else:
+        raise NotImplementedError(f"Unsupported ASGI scope type: {scope['type']}")
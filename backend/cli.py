@@ -0,0 +1,316 @@
+"""
+Command-Line Interface — Offline bulk tools that reuse the analysis pipeline without Flask.
+
+Usage (from the project root):
+    python -m backend.cli score RESUME_DIR --role "Data Scientist" --out results.jsonl
+    python -m backend.cli score RESUME_DIR --role "Data Scientist" --out results.csv --workers 8
+    python -m backend.cli score RESUME_DIR --role "Data Scientist" --out results.jsonl --index candidates.db
+    python -m backend.cli dump-taxonomy taxonomy.json
+    python -m backend.cli fuzz --cases 5000 --seed 1
+    python -m backend.cli export sessions.snap --day 2026-10-19 --format parquet --out analyses.parquet
+
+Re-running the same command after a crash resumes from the checkpoint file
+(default: <out>.checkpoint) and skips files that were already scored.
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+# Ensure backend modules are importable regardless of working directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+from resume_parser import parse_resume
+from pipeline import analyze_parsed, flatten_analysis, FLAT_COLUMNS
+from search_index import CandidateIndex, candidate_document
+from taxonomy import current, dump_taxonomy
+
+RESUME_EXTENSIONS = (".pdf", ".docx", ".doc")
+
+
+# ============================================================
+#  Bulk Scoring
+# ============================================================
+
+def iter_resume_files(root):
+    """Yield resume file paths under root (relative to root), in a stable order."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                yield os.path.relpath(os.path.join(dirpath, name), root)
+
+
+def load_checkpoint(path):
+    """Return the set of relative file paths already recorded in the checkpoint."""
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def _score_one(task):
+    """Worker: run the full pipeline on one file. Never raises."""
+    root, rel_path, job_role, want_document = task
+    try:
+        parsed_data = parse_resume(os.path.join(root, rel_path), job_role)
+        analysis = analyze_parsed(parsed_data)
+        document = candidate_document(parsed_data, analysis) if want_document else None
+        return rel_path, analysis, document, None
+    except Exception as e:
+        return rel_path, None, None, str(e)
+
+
+class JsonlWriter:
+    """Appends one JSON object per scored file."""
+
+    def __init__(self, path):
+        self.f = open(path, "a", encoding="utf-8")
+
+    def write(self, rel_path, analysis, error):
+        record = {"file": rel_path}
+        if error is not None:
+            record["error"] = error
+        else:
+            record["analysis"] = analysis
+        self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+
+class CsvWriter:
+    """Appends one flattened row per scored file; header is written once."""
+
+    def __init__(self, path):
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.f = open(path, "a", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(self.f, fieldnames=["file", "error"] + FLAT_COLUMNS)
+        if write_header:
+            self.writer.writeheader()
+
+    def write(self, rel_path, analysis, error):
+        row = flatten_analysis(analysis) if analysis is not None else {}
+        row["file"] = rel_path
+        row["error"] = error or ""
+        self.writer.writerow(row)
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+
+def score_directory(root, job_role, out_path, fmt=None, workers=None, checkpoint_path=None,
+                    chunksize=4, progress_every=100, index_path=None, log=sys.stderr):
+    """
+    Score every resume under root with `workers` processes.
+    Results are appended to out_path as they complete and each finished file
+    is recorded in the checkpoint, so an interrupted run can be resumed.
+    With index_path, successful results are also added to a CandidateIndex.
+    Returns a summary dict with counts and throughput.
+    """
+    fmt = fmt or ("csv" if out_path.lower().endswith(".csv") else "jsonl")
+    checkpoint_path = checkpoint_path or out_path + ".checkpoint"
+    workers = workers or os.cpu_count() or 1
+
+    done = load_checkpoint(checkpoint_path)
+    pending = [p for p in iter_resume_files(root) if p not in done]
+
+    writer = CsvWriter(out_path) if fmt == "csv" else JsonlWriter(out_path)
+    checkpoint = open(checkpoint_path, "a", encoding="utf-8")
+    index = CandidateIndex(index_path) if index_path else None
+
+    scored = failed = 0
+    start = time.perf_counter()
+    print(f"Scoring {len(pending)} file(s) with {workers} worker(s); {len(done)} already done", file=log)
+
+    try:
+        tasks = ((root, rel_path, job_role, index is not None) for rel_path in pending)
+        with multiprocessing.Pool(workers) as pool:
+            for rel_path, analysis, document, error in pool.imap_unordered(_score_one, tasks, chunksize):
+                # Output first, then checkpoint: a crash in between re-scores one file
+                writer.write(rel_path, analysis, error)
+                if document is not None:
+                    index.add(rel_path, document)
+                checkpoint.write(rel_path + "\n")
+                checkpoint.flush()
+
+                if error is None:
+                    scored += 1
+                else:
+                    failed += 1
+
+                total = scored + failed
+                if progress_every and total % progress_every == 0:
+                    rate = total / max(time.perf_counter() - start, 1e-9)
+                    print(f"  {total}/{len(pending)} files ({rate:.1f} docs/s)", file=log)
+    finally:
+        writer.close()
+        checkpoint.close()
+        if index is not None:
+            index.close()
+
+    elapsed = time.perf_counter() - start
+    total = scored + failed
+    summary = {
+        "scored": scored,
+        "failed": failed,
+        "skipped": len(done),
+        "elapsed_sec": round(elapsed, 2),
+        "docs_per_sec": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+    print(f"Done: {scored} scored, {failed} failed in {summary['elapsed_sec']}s "
+          f"({summary['docs_per_sec']} docs/s)", file=log)
+    return summary
+
+
+# ============================================================
+#  Differential Fuzzing
+# ============================================================
+
+def run_fuzz(engine, cases, seed, max_failures):
+    """Fuzz the chosen engines against legacy_parser; returns 1 if any diverged."""
+    from differential import ENGINES, fuzz
+
+    failed = False
+    for name in (ENGINES if engine == "all" else [engine]):
+        divergences, timings = fuzz(name, cases, seed, max_failures)
+        per_case = {side: seconds * 1000 / cases for side, seconds in timings.items()}
+        print(f"{name:<11} {cases} cases, {len(divergences)} divergences "
+              f"(legacy {per_case['legacy']:.3f} ms/case, current {per_case['current']:.3f} ms/case)")
+        for divergence in divergences:
+            print(divergence.describe())
+        failed = failed or bool(divergences)
+    return 1 if failed else 0
+
+
+# ============================================================
+#  Bulk Export
+# ============================================================
+
+def export_snapshot(snapshot_path, out, fmt="csv", since=float("-inf"), until=float("inf")):
+    """
+    Stream the analyses in a session snapshot (SESSION_SNAPSHOT_PATH) analyzed in [since, until)
+    to out, a binary file. Records are read and written one batch at a time. Returns the session count.
+    """
+    from export import export_chunks
+    from snapshot import iter_records
+
+    exported = 0
+
+    def records(f):
+        nonlocal exported
+        for session_id, _, record in iter_records(f):
+            if since <= record["analyzed_at"] < until:
+                exported += 1
+                yield session_id, record["analyzed_at"], record["analysis"]
+
+    with open(snapshot_path, "rb") as f:
+        for chunk in export_chunks(fmt, records(f)):
+            out.write(chunk)
+    return exported
+
+
+def run_export(args):
+    """Export a session snapshot as the CLI arguments ask; returns the exit code."""
+    from export import FORMATS, available_formats, time_range
+    from snapshot import SnapshotError
+
+    fmt = args.format or os.path.splitext(args.out or "")[1].lstrip(".") or "csv"
+    fmt = {"jsonl": "ndjson", "arrows": "arrow"}.get(fmt, fmt)
+    if fmt not in FORMATS:
+        print(f"Unknown format {fmt!r}; choose one of {', '.join(FORMATS)}", file=sys.stderr)
+        return 2
+    if fmt not in available_formats():
+        print(f"The {fmt} format needs pyarrow (pip install pyarrow)", file=sys.stderr)
+        return 2
+    try:
+        since, until = time_range(args.day, args.since, args.until)
+    except ValueError as e:
+        print(f"Invalid date: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        if args.out in (None, "-"):
+            count = export_snapshot(args.snapshot, sys.stdout.buffer, fmt, since, until)
+        else:
+            with open(args.out, "wb") as out:
+                count = export_snapshot(args.snapshot, out, fmt, since, until)
+    except SnapshotError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    print(f"Exported {count} session(s) as {fmt}", file=sys.stderr)
+    return 0
+
+
+# ============================================================
+#  Entry Point
+# ============================================================
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m backend.cli", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score = commands.add_parser("score", help="Bulk-score a directory of PDF/DOCX resumes")
+    score.add_argument("directory", help="Directory to walk for resumes")
+    score.add_argument("--role", required=True, choices=sorted(current().job_roles), help="Target job role")
+    score.add_argument("--out", required=True, help="Output file (.jsonl or .csv)")
+    score.add_argument("--format", choices=("jsonl", "csv"), help="Output format (default: from --out extension)")
+    score.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    score.add_argument("--checkpoint", help="Checkpoint file (default: <out>.checkpoint)")
+    score.add_argument("--chunksize", type=int, default=4, help="Files handed to a worker at a time")
+    score.add_argument("--index", help="Also add results to this candidate search index (SQLite)")
+
+    dump = commands.add_parser("dump-taxonomy", help="Write the active skills taxonomy as a JSON file (a starting point for TAXONOMY_PATH)")
+    dump.add_argument("out", help="Output JSON file")
+
+    fuzz = commands.add_parser("fuzz", help="Differential-test the skill, section and experience detectors against the legacy reference")
+    fuzz.add_argument("--engine", choices=("all", "skills", "sections", "experience"), default="all")
+    fuzz.add_argument("--cases", type=int, default=2000, help="Random inputs per engine")
+    fuzz.add_argument("--seed", type=int, default=0)
+    fuzz.add_argument("--max-failures", type=int, default=5, help="Stop an engine after this many divergences")
+
+    export = commands.add_parser("export", help="Export the analyses in a session snapshot as CSV, NDJSON, Parquet or Arrow")
+    export.add_argument("snapshot", help="Session snapshot file (SESSION_SNAPSHOT_PATH)")
+    export.add_argument("--out", help="Output file (default: stdout)")
+    export.add_argument("--format", choices=("csv", "ndjson", "parquet", "arrow"),
+                        help="Output format (default: from --out extension, else csv)")
+    export.add_argument("--day", help="Only sessions analyzed on this UTC day (YYYY-MM-DD)")
+    export.add_argument("--since", help="Only sessions analyzed at or after this ISO date/time (UTC)")
+    export.add_argument("--until", help="Only sessions analyzed before this ISO date/time (UTC)")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "score":
+        if not os.path.isdir(args.directory):
+            print(f"Not a directory: {args.directory}", file=sys.stderr)
+            return 2
+        score_directory(args.directory, args.role, args.out, fmt=args.format, workers=args.workers,
+                        checkpoint_path=args.checkpoint, chunksize=args.chunksize, index_path=args.index)
+    elif args.command == "dump-taxonomy":
+        taxonomy = current()
+        dump_taxonomy(taxonomy, args.out)
+        print(f"Wrote taxonomy {taxonomy.version} ({len(taxonomy.job_roles)} roles) to {args.out}", file=sys.stderr)
+    elif args.command == "fuzz":
+        return run_fuzz(args.engine, args.cases, args.seed, args.max_failures)
+    elif args.command == "export":
+        if not os.path.isfile(args.snapshot):
+            print(f"No such snapshot: {args.snapshot}", file=sys.stderr)
+            return 2
+        return run_export(args)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
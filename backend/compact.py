@@ -0,0 +1,124 @@
+"""
+Compact Analyses — Stored form of an analysis for the in-memory session store.
+
+An analysis is mostly small dicts with the same keys (role matches, section
+scores, keyword rows, course cards) and values repeated across users (role
+descriptions, sample jobs, course entries, status labels). In compact form:
+
+  * a dict becomes a tuple (shape, value, ...) where shape is the shared,
+    interned tuple of its keys;
+  * lists become tuples and short strings are interned;
+  * tuples are hash-consed through a bounded table, so a row or list that is
+    identical across sessions (a course card, a sample job, all_matches next
+    to role_matches) is stored once and referenced everywhere.
+
+CompactAnalysis is a read-only mapping over that form: each top-level value
+is rebuilt as plain dicts and lists when it is read, so session endpoints
+and JSON serialization work on it unchanged.
+"""
+
+import sys
+from collections.abc import Mapping
+
+
+# Strings up to this length are interned (labels, skill and role names, icons)
+INTERN_MAX_LEN = 64
+
+# Tuples up to this length (rows, short lists) are shared; longer ones rarely repeat
+SHARE_MAX_LEN = 10
+
+# Distinct tuples kept for sharing. When the table fills up it starts over: that only
+# costs sharing for values first seen before the reset, never correctness.
+MAX_SHARED = 100000
+_shared = {}
+
+
+class Shape(tuple):
+    """The keys of a compacted dict. One instance per distinct key sequence."""
+
+    __slots__ = ()
+
+
+_shapes = {}
+
+
+def _shape(keys):
+    shape = _shapes.get(keys)
+    if shape is None:
+        shape = _shapes.setdefault(keys, Shape(sys.intern(k) if isinstance(k, str) else k for k in keys))
+    return shape
+
+
+def _share(value):
+    if len(value) > SHARE_MAX_LEN:
+        return value
+    shared = _shared.get(value)
+    if shared is None:
+        if len(_shared) >= MAX_SHARED:
+            _shared.clear()
+        _shared[value] = value
+        return value
+    # Equal tuples may still differ in element types (1, 1.0, True), which must survive the
+    # round trip; nested tuples are already shared, so they must be the same objects
+    for a, b in zip(value, shared):
+        if type(a) is not type(b) or (isinstance(a, tuple) and a is not b):
+            return value
+    return shared
+
+
+def pack(value):
+    """Compact form of a JSON-like value (dicts, lists, tuples, strings, numbers, None)."""
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= INTERN_MAX_LEN else value
+    if isinstance(value, dict):
+        return _share((_shape(tuple(value)),) + tuple(pack(v) for v in value.values()))
+    if isinstance(value, (list, tuple)):
+        return _share(tuple(pack(v) for v in value))
+    return value
+
+
+def unpack(value):
+    """Plain dicts and lists for a packed value."""
+    if isinstance(value, tuple):
+        if value and isinstance(value[0], Shape):
+            return {key: unpack(v) for key, v in zip(value[0], value[1:])}
+        return [unpack(v) for v in value]
+    return value
+
+
+class CompactAnalysis(Mapping):
+    """Read-only analysis in compact form; values are rebuilt as dicts and lists on access."""
+
+    __slots__ = ("_shape", "_values")
+
+    def __init__(self, analysis):
+        self._shape = _shape(tuple(analysis))
+        self._values = tuple(pack(v) for v in analysis.values())
+
+    def __getitem__(self, key):
+        try:
+            i = self._shape.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+        return unpack(self._values[i])
+
+    def __contains__(self, key):
+        return key in self._shape
+
+    def __iter__(self):
+        return iter(self._shape)
+
+    def __len__(self):
+        return len(self._shape)
+
+    def __reduce__(self):
+        # Pickled (e.g. in session snapshots) as the plain analysis and compacted again on
+        # load, so a restored record shares shapes and values with the live ones
+        return CompactAnalysis, (dict(self),)
+
+
+def compact_analysis(analysis):
+    """Compact form of an analysis dict (returned as is if it is already compact)."""
+    if isinstance(analysis, CompactAnalysis):
+        return analysis
+    return CompactAnalysis(analysis)
@@ -1,8 +1,104 @@
 """
 Course Recommendation Engine — Suggests courses based on skill gaps.
+
+COURSE_CATALOG maps a key to a course. A course covers the skills in its
+"skills" list, or just its key when there is none (the built-in catalog is
+one course per skill); "rating" and "duration_hours" are optional. The
+catalog is compiled once per taxonomy into an inverted skill -> courses
+index, and recommendations are picked by greedy weighted set cover, so one
+course covering three gaps beats three separate courses.
 """
 
-from skills_db import COURSE_CATALOG, JOB_ROLES
+import heapq
+
+from taxonomy import current
+from analyzer import get_role_data
+
+# Gap weights: missing ATS keywords, other missing skills, skills mentioned only once
+ATS_GAP_WEIGHT = 3
+MISSING_GAP_WEIGHT = 2
+LOW_MENTION_WEIGHT = 1
+
+
+class CourseIndex:
+    """Inverted skill -> courses index over a course catalog. Courses with the same title are merged."""
+
+    def __init__(self, catalog):
+        self.courses = []      # course dicts, without the "skills" field
+        self.skills = []       # tuple of covered skills per course
+        self.ratings = []
+        self.durations = []
+        self.by_skill = {}
+        by_title = {}
+
+        for key, course in catalog.items():
+            covered = course.get("skills") or [key]
+            i = by_title.get(course.get("title"))
+            if i is None:
+                i = len(self.courses)
+                by_title[course.get("title")] = i
+                self.courses.append({k: v for k, v in course.items() if k != "skills"})
+                self.skills.append(())
+                self.ratings.append(float(course.get("rating") or 0))
+                self.durations.append(float(course.get("duration_hours") or 0))
+            for skill in covered:
+                if skill not in self.skills[i]:
+                    self.skills[i] += (skill,)
+                    self.by_skill.setdefault(skill, []).append(i)
+
+    def __contains__(self, skill):
+        return skill in self.by_skill
+
+    def __len__(self):
+        return len(self.courses)
+
+    def select(self, gaps, k):
+        """
+        Greedy weighted set cover: up to k (course_id, covered_gaps) pairs.
+        gaps maps skill -> (weight, position); each pick maximizes the weight of
+        still-uncovered gaps it covers, then rating, then gap position, then
+        shorter duration. Gains only shrink as gaps get covered, so they are
+        updated through the posting lists and stale heap entries are
+        re-queued lazily when they reach the top.
+        """
+        # Initial gains in one pass over the gaps' posting lists (gaps come in position order)
+        by_skill = self.by_skill
+        gains, positions = {}, {}
+        for gap, (weight, position) in sorted(gaps.items(), key=lambda item: item[1][1]):
+            for i in by_skill.get(gap, ()):
+                gains[i] = gains.get(i, 0) - weight
+                positions.setdefault(i, position)
+        ratings, durations = self.ratings, self.durations
+        heap = [(gain, -ratings[i], positions[i], durations[i], i) for i, gain in gains.items()]
+        heapq.heapify(heap)
+        uncovered = set(gaps)
+
+        picked = []
+        while heap and len(picked) < k:
+            entry = heapq.heappop(heap)
+            i = entry[-1]
+            gain = gains[i]
+            if not gain:
+                continue
+            if gain != entry[0]:
+                # Some of its gaps were covered meanwhile (which also moves its position)
+                position = min(gaps[g][1] for g in self.skills[i] if g in uncovered)
+                heapq.heappush(heap, (gain, entry[1], position, entry[3], i))
+                continue
+            covered = sorted((g for g in self.skills[i] if g in uncovered), key=lambda g: gaps[g][1])
+            picked.append((i, covered))
+            for g in covered:
+                uncovered.discard(g)
+                weight = gaps[g][0]
+                for j in by_skill[g]:
+                    gains[j] += weight
+        return picked
+
+
+def get_course_index(taxonomy=None):
+    """CourseIndex for the taxonomy's catalog, built once per taxonomy version."""
+    taxonomy = taxonomy or current()
+    return taxonomy.cached("course_index", lambda: CourseIndex(taxonomy.course_catalog))
 
 
 def get_recommended_courses(parsed_data, max_courses=9):
@@ -14,8 +110,9 @@ def get_recommended_courses(parsed_data, max_courses=9):
     missing_skills = parsed_data["missing_skills"]
     missing_technical = parsed_data["missing_technical"]
     keyword_counts = parsed_data["keyword_counts"]
+    index = get_course_index()
 
-    role_data = JOB_ROLES.get(job_role, {})
+    role_data = get_role_data(parsed_data)
     ats_keywords = set(role_data.get("ats_keywords", []))
 
     # Priority: missing ATS keywords first, then other missing skills
@@ -33,42 +130,38 @@ def get_recommended_courses(parsed_data, max_courses=9):
         if skill in ats_keywords and skill not in priority_missing:
             priority_missing.append(skill)
 
-    # Combine: ATS-critical first, then other gaps
-    ordered_skills = priority_missing + other_missing
-
     # Also consider: skills with low mentions (improvement opportunities)
     low_mention_skills = [
         skill for skill in parsed_data["found_skills"]
-        if keyword_counts.get(skill, 0) <= 1 and skill in COURSE_CATALOG
+        if keyword_counts.get(skill, 0) <= 1 and skill in index
     ]
 
+    # Weighted gaps; the position keeps the priority order among equally good courses
+    gaps = {}
+    for weight, skills in ((ATS_GAP_WEIGHT, priority_missing), (MISSING_GAP_WEIGHT, other_missing),
+                           (LOW_MENTION_WEIGHT, low_mention_skills)):
+        for skill in skills:
+            if skill in index and skill not in gaps:
+                gaps[skill] = (weight, len(gaps))
+
     courses = []
-    seen_titles = set()
-
-    # First pass: courses for missing skills
-    for skill in ordered_skills:
-        if len(courses) >= max_courses:
-            break
-        if skill in COURSE_CATALOG:
-            course = COURSE_CATALOG[skill].copy()
-            course["skill"] = skill
+    for i, covered in index.select(gaps, max_courses):
+        course = index.courses[i].copy()
+        skill = covered[0]
+        course["skill"] = skill
+        course["covers"] = covered
+        if gaps[skill][0] > LOW_MENTION_WEIGHT:
             course["priority"] = "high"
-            course["reason"] = f"Missing from your resume — critical for {job_role}"
-            if course["title"] not in seen_titles:
-                courses.append(course)
-                seen_titles.add(course["title"])
-
-    # Second pass: courses for low-mention skills
-    for skill in low_mention_skills:
-        if len(courses) >= max_courses:
-            break
-        if skill in COURSE_CATALOG:
-            course = COURSE_CATALOG[skill].copy()
-            course["skill"] = skill
+            if len(covered) > 1:
+                course["reason"] = f"Covers {len(covered)} gaps ({', '.join(covered)}) — critical for {job_role}"
+            else:
+                course["reason"] = f"Missing from your resume — critical for {job_role}"
+        else:
             course["priority"] = "medium"
-            course["reason"] = f"Mentioned only {keyword_counts.get(skill, 0)} time(s) — strengthen this skill"
-            if course["title"] not in seen_titles:
-                courses.append(course)
-                seen_titles.add(course["title"])
+            if len(covered) > 1:
+                course["reason"] = f"Strengthens {len(covered)} lightly mentioned skills ({', '.join(covered)})"
+            else:
+                course["reason"] = f"Mentioned only {keyword_counts.get(skill, 0)} time(s) — strengthen this skill"
+        courses.append(course)
 
     return courses
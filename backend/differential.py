@@ -0,0 +1,178 @@
+"""
+Differential Testing — Fuzzes the production detectors against the frozen legacy
+implementations (legacy_parser.py) and reports any input on which they disagree.
+
+Inputs are random resume-like texts built from the taxonomy's skills and
+aliases, section headers, "N years of experience" phrases and adversarial
+material: punctuation hugging skill names (c++, c#, .net, node.js), mixed
+case, underscores, non-ASCII letters, digits and unusual whitespace. Every
+divergence is shrunk with delta debugging to a minimal input that still
+diverges, so a report is small enough to read and to turn into a fix.
+
+Deliberate behavior changes are applied to the reference side (see
+_legacy_skills), so they are documented here rather than reported.
+
+    python -m backend.cli fuzz --cases 5000 --seed 1
+"""
+
+import random
+import time
+
+import legacy_parser
+from resume_parser import detect_experience_level, detect_sections, detect_skills
+from taxonomy import current
+
+HEADERS = [
+    "Skills", "TECHNICAL SKILLS", "Core Competencies", "Tech Stack", "Experience", "Work History",
+    "Professional Experience", "Projects", "Academic Projects", "Education", "University", "Degree",
+    "Certifications", "Certificate", "Licensed", "Summary", "Objective", "About", "Profile",
+]
+YEAR_PHRASES = [
+    "{n} years of experience", "{n}+ years experience", "{n} yrs exp", "experience of {n} years",
+    "exp {n}+ yrs", "{n} years in", "{n} year working", "{n}years of", "experience {n} years of experience",
+    "{n} years {n} years in", "fresher", "entry-level", "internship", "recent graduate",
+]
+JUNK = [
+    "(", ")", ",", ".", ";", ":", "[", "]", "/", "#", "+", "-", "_", "&", "'", '"', "*", "|",
+    "é", "ß", "İ", "ﬁ", "٣", "²", " ", "​", "\t", "foo", "x", "_py", "py_", "2019", "v2",
+]
+SEPARATORS = [" ", " ", " ", "", "\n", "\n", ", ", " / ", ". ", "\t", " - "]
+UNKNOWN_ROLE = "Unknown Role"
+
+
+class Divergence:
+    """One input on which the legacy and current engines disagree."""
+
+    def __init__(self, engine, role, text, original_length, legacy, current):
+        self.engine = engine
+        self.role = role
+        self.text = text
+        self.original_length = original_length
+        self.legacy = legacy
+        self.current = current
+
+    def describe(self):
+        role = f" (role {self.role!r})" if self.role is not None else ""
+        return (f"{self.engine}{role}: minimized from {self.original_length} to {len(self.text)} chars\n"
+                f"  input:   {self.text!r}\n"
+                f"  legacy:  {self.legacy!r}\n"
+                f"  current: {self.current!r}")
+
+
+def _legacy_skills(text, job_role):
+    # Accepted change: normalize_text casefolds ("ß" -> "ss") where the original only lowercased
+    return legacy_parser.detect_skills(text.casefold(), job_role)
+
+
+# name -> (reference, current, takes_role)
+ENGINES = {
+    "skills": (_legacy_skills, detect_skills, True),
+    "sections": (legacy_parser.detect_sections, detect_sections, False),
+    "experience": (legacy_parser.detect_experience_level, detect_experience_level, False),
+}
+
+
+def _vocabulary(taxonomy):
+    words = set(taxonomy.skill_aliases)
+    for role in taxonomy.job_roles.values():
+        words.update(role.get("technical_skills", []))
+        words.update(role.get("soft_skills", []))
+        words.update(role.get("ats_keywords", []))
+    return sorted(words)
+
+
+def _mutate(token, rng):
+    roll = rng.random()
+    if roll < 0.15:
+        return token.upper()
+    if roll < 0.25:
+        return token.title()
+    if roll < 0.35:
+        return rng.choice(JUNK) + token
+    if roll < 0.45:
+        return token + rng.choice(JUNK)
+    if roll < 0.5 and len(token) > 1:
+        i = rng.randrange(1, len(token))
+        return token[:i] + rng.choice(JUNK + SEPARATORS) + token[i:]
+    return token
+
+
+def random_text(rng, vocabulary, max_tokens=60):
+    """A random resume-like text mixing skills, headers, year phrases and junk."""
+    tokens = []
+    for _ in range(rng.randint(0, max_tokens)):
+        kind = rng.random()
+        if kind < 0.55:
+            token = rng.choice(vocabulary)
+        elif kind < 0.65:
+            token = rng.choice(HEADERS)
+        elif kind < 0.75:
+            token = rng.choice(YEAR_PHRASES).format(n=rng.choice((0, 1, 2, 3, 5, 6, 10, 25, 100)))
+        else:
+            token = rng.choice(JUNK)
+        tokens.append(rng.choice(SEPARATORS) + _mutate(token, rng))
+    return "".join(tokens)
+
+
+def diverges(engine, text, role=None):
+    """(legacy_result, current_result) if the engines disagree on text, else None."""
+    legacy, production, takes_role = ENGINES[engine]
+    args = (text, role) if takes_role else (text,)
+    expected, actual = legacy(*args), production(*args)
+    return None if expected == actual else (expected, actual)
+
+
+def minimize(text, still_fails):
+    """
+    Delta debugging (ddmin complement reduction): repeatedly drop chunks of the
+    input while still_fails(candidate) holds. Returns a 1-minimal failing input.
+    """
+    granularity = 2
+    while len(text) >= 2:
+        chunk = -(-len(text) // granularity)
+        for start in range(0, len(text), chunk):
+            candidate = text[:start] + text[start + chunk:]
+            if still_fails(candidate):
+                text = candidate
+                granularity = max(granularity - 1, 2)
+                break
+        else:
+            if granularity >= len(text):
+                break
+            granularity = min(granularity * 2, len(text))
+    return text
+
+
+def fuzz(engine, cases=1000, seed=0, max_failures=5):
+    """
+    Run `cases` random inputs through one engine pair (under the active taxonomy).
+    Returns (divergences, timings) where timings holds total seconds for "legacy" and "current".
+    """
+    taxonomy = current()
+    legacy, production, takes_role = ENGINES[engine]
+    rng = random.Random(f"{engine}:{seed}")
+    vocabulary = _vocabulary(taxonomy)
+    roles = sorted(taxonomy.job_roles) + [UNKNOWN_ROLE]
+    divergences = []
+    timings = {"legacy": 0.0, "current": 0.0}
+
+    for _ in range(cases):
+        text = random_text(rng, vocabulary)
+        role = rng.choice(roles) if takes_role else None
+        args = (text, role) if takes_role else (text,)
+
+        start = time.perf_counter()
+        expected = legacy(*args)
+        middle = time.perf_counter()
+        actual = production(*args)
+        timings["legacy"] += middle - start
+        timings["current"] += time.perf_counter() - middle
+
+        if expected != actual:
+            small = minimize(text, lambda candidate: diverges(engine, candidate, role) is not None)
+            expected, actual = diverges(engine, small, role)
+            divergences.append(Divergence(engine, role, small, len(text), expected, actual))
+            if len(divergences) >= max_failures:
+                break
+
+    return divergences, timings
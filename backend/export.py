@@ -0,0 +1,181 @@
+"""
+Bulk Export — Streams stored analyses as flat rows in CSV, NDJSON, Parquet or Arrow.
+
+Each row holds the flatten_analysis columns (pipeline.FLAT_COLUMNS) plus the
+session id and when it was analyzed. Every format is written by a generator
+that encodes BATCH_ROWS rows at a time and yields the bytes. Memory use
+therefore stays flat however many sessions are exported, and the same
+generators serve the HTTP endpoint and the CLI. Parquet and Arrow (IPC
+stream) need pyarrow; they are offered only when it is installed.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from importlib.util import find_spec
+
+from pipeline import FLAT_COLUMNS, flatten_analysis
+
+EXPORT_COLUMNS = ["session_id", "analyzed_at"] + FLAT_COLUMNS
+# Rows encoded per yielded chunk (and per Parquet row group / Arrow record batch)
+BATCH_ROWS = 1000
+
+_INT_COLUMNS = {
+    "ats_score", "rejection_pct", "skills_section_score", "projects_score", "experience_score",
+    "keywords_density_score", "formatting_score", "recommended_role_score",
+}
+
+
+def export_rows(records):
+    """Flat rows for (session_id, analyzed_at, analysis) records; analyzed_at is a unix time."""
+    for session_id, analyzed_at, analysis in records:
+        row = {"session_id": session_id, "analyzed_at": datetime.fromtimestamp(analyzed_at, timezone.utc)}
+        row.update(flatten_analysis(analysis))
+        yield row
+
+
+def _batches(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_ROWS:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _typed(row):
+    """Row with ISO timestamps and None (not "") for missing numbers, for typed formats."""
+    row = dict(row)
+    row["analyzed_at"] = row["analyzed_at"].isoformat()
+    for column in _INT_COLUMNS:
+        if row[column] == "":
+            row[column] = None
+    return row
+
+
+def csv_chunks(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    for batch in _batches(rows):
+        for row in batch:
+            writer.writerow(dict(row, analyzed_at=row["analyzed_at"].isoformat()))
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def ndjson_chunks(rows):
+    for batch in _batches(rows):
+        yield "".join(json.dumps(_typed(row), ensure_ascii=False) + "\n" for row in batch).encode("utf-8")
+
+
+class _Drain(io.RawIOBase):
+    """
+    Write-only sink for pyarrow writers that hands out what was written so far.
+    tell() keeps counting across take() calls, so the offsets Parquet records stay right.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def take(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _arrow_schema():
+    import pyarrow as pa
+    fields = []
+    for column in EXPORT_COLUMNS:
+        if column == "analyzed_at":
+            fields.append(pa.field(column, pa.timestamp("ms", tz="UTC")))
+        else:
+            fields.append(pa.field(column, pa.int64() if column in _INT_COLUMNS else pa.string()))
+    return pa.schema(fields)
+
+
+def _arrow_chunks(rows, open_writer):
+    import pyarrow as pa
+    schema = _arrow_schema()
+    sink = _Drain()
+    writer = open_writer(sink, schema)
+    for batch in _batches(rows):
+        for row in batch:
+            for column in _INT_COLUMNS:
+                if row[column] == "":
+                    row[column] = None
+        writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+        data = sink.take()
+        if data:
+            yield data
+    writer.close()
+    yield sink.take()
+
+
+def parquet_chunks(rows):
+    import pyarrow.parquet as pq
+    return _arrow_chunks(rows, lambda sink, schema: pq.ParquetWriter(sink, schema))
+
+
+def arrow_chunks(rows):
+    import pyarrow as pa
+    return _arrow_chunks(rows, lambda sink, schema: pa.ipc.new_stream(sink, schema))
+
+
+# name -> (media type, file extension, chunk generator, needs pyarrow)
+FORMATS = {
+    "csv": ("text/csv", "csv", csv_chunks, False),
+    "ndjson": ("application/x-ndjson", "ndjson", ndjson_chunks, False),
+    "parquet": ("application/vnd.apache.parquet", "parquet", parquet_chunks, True),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows", arrow_chunks, True),
+}
+
+
+def available_formats():
+    """Export formats usable in this environment (Parquet and Arrow only with pyarrow installed)."""
+    has_arrow = find_spec("pyarrow") is not None
+    return [name for name, (_, _, _, needs_arrow) in FORMATS.items() if has_arrow or not needs_arrow]
+
+
+def export_chunks(fmt, records):
+    """Encoded bytes, chunk by chunk, for (session_id, analyzed_at, analysis) records in format fmt."""
+    return FORMATS[fmt][2](export_rows(records))
+
+
+def parse_time(value):
+    """Unix time for an ISO date or date-time (naive values are UTC)."""
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def time_range(day=None, since=None, until=None):
+    """
+    (since, until) unix times for an export: a whole UTC day (YYYY-MM-DD) or ISO bounds,
+    either of which may be left open. Raises ValueError for malformed values.
+    """
+    if day:
+        start = datetime.fromisoformat(day).replace(tzinfo=timezone.utc)
+        return start.timestamp(), (start + timedelta(days=1)).timestamp()
+    return (parse_time(since) if since else float("-inf"),
+            parse_time(until) if until else float("inf"))
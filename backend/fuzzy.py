@@ -0,0 +1,183 @@
+"""
+Fuzzy Skill Matching — Opt-in approximate matching for skills mangled by PDF extraction.
+
+PyPDF2 often splits or garbles words ("Tensor Flow", "Kuber-netes", "Pyth on").
+Text is compacted by dropping spaces and punctuation inside a sliding window
+of tokens, then looked up in a SymSpell-style deletion index built once over
+every skill name and alias. Each lookup generates only the deletions of the
+window itself, so the cost per token depends on the window length and the
+edit distance, not on the vocabulary size.
+"""
+
+import os
+
+from cache import LRUCache
+
+# Windows shorter than this are only matched exactly (after compaction): one edit away from
+# a 6-7 letter skill there are too many ordinary words ("locker" / Docker, "resting" / Testing)
+MIN_FUZZY_LENGTH = 8
+# Compact terms shorter than this are never matched by the fuzzy layer at all
+MIN_TERM_LENGTH = 4
+# Hits below this confidence are reported but not counted as found skills
+MIN_CONFIDENCE = float(os.environ.get("FUZZY_MIN_CONFIDENCE", 0.8))
+
+
+def fuzzy_enabled_by_default():
+    """Fuzzy matching is off unless FUZZY_SKILL_MATCHING=1."""
+    return os.environ.get("FUZZY_SKILL_MATCHING", "").lower() in ("1", "true", "yes")
+
+
+def compact(term):
+    """Drop spaces and punctuation: 'Kuber-netes' -> 'kubernetes', 'c++' stays 'c++'."""
+    return "".join(ch for ch in term.lower() if ch.isalnum() or ch in "#+")
+
+
+def max_distance(length):
+    """Edit distance allowed for a term of this compact length."""
+    if length < MIN_FUZZY_LENGTH:
+        return 0
+    return 1 if length < 10 else 2
+
+
+def _deletes(word, distance):
+    """All strings obtainable from word by deleting up to `distance` characters."""
+    results = {word}
+    frontier = results
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        results = results | frontier
+    return results
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance between a and b, or limit + 1 if it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+            row_min = min(row_min, current[j])
+        if row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+_NO_TERMS = frozenset()
+
+
+class FuzzySkillIndex:
+    """
+    Deletion index over compacted skill names and aliases.
+    As in SymSpell, only deletions of the first PREFIX_LENGTH characters are
+    indexed, so a lookup costs at most a few dozen dict probes whatever the
+    window length. Built once per skill set; search() is linear in the number of tokens.
+    """
+
+    PREFIX_LENGTH = 7
+    MAX_MEMO = 50000
+
+    def __init__(self, patterns):
+        """patterns: iterable of (canonical_skill, raw_term), e.g. SkillMatcher.patterns."""
+        self.exact = {}      # compact term -> canonical skill
+        self.deletes = {}    # deletion of a term prefix -> set of compact terms
+        self.max_words = 1
+        self.min_length = None
+        self.max_length = 0
+        # compacted window -> (term, distance) or None; (prefix, distance) -> terms. Shared by request threads.
+        self._memo = LRUCache(self.MAX_MEMO)
+
+        for skill, raw in patterns:
+            term = compact(raw)
+            if len(term) < MIN_TERM_LENGTH:
+                continue
+            self.exact[term] = skill
+            self.max_words = max(self.max_words, len(raw.split()) + 1)
+            self.min_length = len(term) if self.min_length is None else min(self.min_length, len(term))
+            self.max_length = max(self.max_length, len(term))
+            for variant in _deletes(term[:self.PREFIX_LENGTH], max_distance(len(term))):
+                self.deletes.setdefault(variant, set()).add(term)
+
+    def _lookup(self, window):
+        """Best (term, distance) for a compacted window, or None."""
+        if window in self.exact:
+            return window, 0
+
+        distance = max_distance(len(window))
+        if not distance:
+            return None
+
+        best = None
+        for candidate in self._candidates(window[:self.PREFIX_LENGTH], distance):
+            limit = min(distance, max_distance(len(candidate)))
+            d = edit_distance(window, candidate, limit)
+            if d <= limit and (best is None or (d, candidate) < best[::-1]):
+                best = (candidate, d)
+        return best
+
+    def _candidates(self, prefix, distance):
+        """Terms sharing a deletion with the prefix. Windows of different widths often share a prefix."""
+        def build():
+            found = set()
+            for variant in _deletes(prefix, distance):
+                found |= self.deletes.get(variant, _NO_TERMS)
+            return sorted(found)
+
+        return self._memo.get_or_create((prefix, distance), build)
+
+    def lookup(self, window):
+        """Memoized _lookup: resumes repeat most of their words, and vocabularies are small."""
+        return self._memo.get_or_create(window, lambda: self._lookup(window))
+
+    def search(self, normalized, exclude=()):
+        """
+        Find approximate skill mentions in normalized text.
+        Returns a list of hit dicts: skill, matched text, edit distance, confidence.
+        Skills in `exclude` (e.g. already found exactly) are skipped.
+        """
+        if self.min_length is None:
+            return []
+
+        tokens = normalized.split()
+        compact_tokens = [compact(t) for t in tokens]
+        hits = []
+        i = 0
+        while i < len(tokens):
+            best = None
+            window = ""
+            for width in range(1, min(self.max_words, len(tokens) - i) + 1):
+                window += compact_tokens[i + width - 1]
+                if len(window) > self.max_length + 2:
+                    break
+                if len(window) < self.min_length:
+                    continue
+                found = self.lookup(window)
+                if found is None:
+                    continue
+                term, distance = found
+                if width == 1 and distance == 0 and window == tokens[i]:
+                    continue  # plain exact token: the exact matcher already decided on it
+                confidence = round((1 - distance / len(term)) * (0.95 if width > 1 else 1.0), 3)
+                if best is None or confidence > best[3]:
+                    best = (width, term, distance, confidence)
+
+            if best is not None and self.exact[best[1]] not in exclude:
+                width, term, distance, confidence = best
+                hits.append({
+                    "skill": self.exact[term],
+                    "matched_text": " ".join(tokens[i:i + width]),
+                    "distance": distance,
+                    "confidence": confidence,
+                })
+                i += width
+            else:
+                i += 1
+
+        return hits
@@ -0,0 +1,362 @@
+"""
+Incremental Re-analysis — Keeps line-level skill hits for a stored resume so edits
+(section replacements or unified diffs) only re-scan the lines they touch.
+
+Skill counts are kept per line plus a correction term per line junction, so a
+skill written across a line break ("machine\\nlearning") is still counted the
+way the whole-text scan in detect_skills counts it. Phrases spread over three
+or more lines are the only case the junction terms do not cover.
+"""
+
+import re
+import zlib
+from collections import Counter
+
+from matcher import SkillMatcher, get_role_matcher, role_skill_set
+from taxonomy import current, pinned
+from timeline import extract_timeline
+from resume_parser import (
+    normalize_text, find_section_headers, sections_from_headers,
+    detect_experience_level, assemble_parsed_data, detect_fuzzy_skills, apply_fuzzy_hits,
+    MAX_SECTION_LINES,
+)
+from text_patterns import SECTION_PATTERNS
+
+# A changed line can only move the experience level if it mentions numbers, years or fresher terms
+_EXPERIENCE_HINT = re.compile(r'\d|year|yrs|exp|fresh|intern|entry|graduate', re.IGNORECASE)
+_has_digit = re.compile(r'\d').search
+_HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+_EMPTY = Counter()
+
+# Stored resume texts are compressed with the fastest zlib level; they are small and read rarely
+TEXT_COMPRESS_LEVEL = 1
+
+
+class EditConflictError(ValueError):
+    """Raised when an edit does not apply to the current resume text."""
+
+
+class IncrementalResume:
+    """
+    Editable resume text with cached per-line skill hits.
+    The line index is built lazily on the first edit, so storing one per session is cheap.
+    """
+
+    def __init__(self, text, job_role, role_data=None, matcher=None, parsed_data=None, fuzzy=False):
+        self.job_role = job_role
+        self.fuzzy = fuzzy
+        # The taxonomy the resume was parsed with; edits are re-analyzed against the same version
+        self.taxonomy = current()
+        self.role_data = role_data
+        if matcher is None:
+            matcher = get_role_matcher(job_role) if role_data is None else SkillMatcher(role_skill_set(role_data))
+        self.matcher = matcher
+        self._text = text
+        self._parsed = parsed_data
+        self._norm = None
+
+    @property
+    def text(self):
+        if self._norm is None:
+            return self._text
+        return "\n".join(self.lines)
+
+    def copy(self):
+        """Independent copy for what-if edits. Per-line Counters are never mutated, so they are shared."""
+        clone = IncrementalResume.__new__(IncrementalResume)
+        clone.__dict__.update(self.__dict__)
+        if self._norm is not None:
+            clone.lines = list(self.lines)
+            clone._norm = list(self._norm)
+            clone._line_counts = list(self._line_counts)
+            clone._join_counts = list(self._join_counts)
+            clone._headers = list(self._headers)
+            clone._counts = Counter(self._counts)
+        return clone
+
+    # ── Line index ──
+
+    def _count(self, normalized):
+        if not normalized:
+            return _EMPTY
+        return self.matcher.match(normalized)[1]
+
+    def _next_nonempty(self, i):
+        for j in range(i + 1, len(self._norm)):
+            if self._norm[j]:
+                return j
+        return None
+
+    def _prev_nonempty(self, i):
+        for j in range(i - 1, -1, -1):
+            if self._norm[j]:
+                return j
+        return None
+
+    def _join_delta(self, i):
+        """Matches that only exist when line i is joined to the next non-empty line."""
+        if not self._norm[i]:
+            return _EMPTY
+        j = self._next_nonempty(i)
+        if j is None:
+            return _EMPTY
+        joined = self._count(self._norm[i] + " " + self._norm[j])
+        if joined == self._line_counts[i] + self._line_counts[j]:
+            return _EMPTY
+        delta = Counter(joined)
+        delta.subtract(self._line_counts[i])
+        delta.subtract(self._line_counts[j])
+        return delta
+
+    def _ensure_index(self):
+        if self._norm is not None:
+            return
+        self.lines = self._text.split("\n")
+        self._text = None
+        self._norm = [normalize_text(line) for line in self.lines]
+        self._line_counts = [self._count(n) for n in self._norm]
+        self._join_counts = [self._join_delta(i) for i in range(len(self.lines))]
+        self._headers = find_section_headers(self.lines)
+        self._counts = Counter()
+        for counts in self._line_counts:
+            self._counts.update(counts)
+        for counts in self._join_counts:
+            self._counts.update(counts)
+        self.sections = sections_from_headers(self.lines, self._headers)
+        self.timeline = extract_timeline(self.text, self.matcher, skills=self.keyword_counts)
+        self.experience_level = detect_experience_level(self.text, self.timeline)
+
+    @property
+    def keyword_counts(self):
+        self._ensure_index()
+        return {skill: count for skill, count in self._counts.items() if count > 0}
+
+    def _skill_counts(self):
+        """
+        (keyword_counts, fuzzy_hits) for the current text. Fuzzy hits are not kept per line,
+        so with fuzzy matching on they are recomputed over the whole text (still linear).
+        """
+        counts = self.keyword_counts
+        if not self.fuzzy:
+            return counts, None
+        found = set(counts)
+        hits = detect_fuzzy_skills(self.text, self.matcher, found)
+        apply_fuzzy_hits(found, counts, hits)
+        return counts, hits
+
+    # ── Edits ──
+
+    def replace_lines(self, start, end, new_lines):
+        """Replace lines[start:end] with new_lines, re-scanning only the affected lines."""
+        self._ensure_index()
+        if not 0 <= start <= end <= len(self.lines):
+            raise EditConflictError(f"Line range {start}-{end} is outside the resume ({len(self.lines)} lines)")
+
+        old_lines = self.lines[start:end]
+        self._parsed = None
+        prev = self._prev_nonempty(start)
+        rejoin = ([prev] if prev is not None else [])
+
+        # Remove the contribution of the lines being replaced and of the junction into them
+        for i in rejoin + list(range(start, end)):
+            self._counts.subtract(self._join_counts[i])
+        for i in range(start, end):
+            self._counts.subtract(self._line_counts[i])
+
+        norm = [normalize_text(line) for line in new_lines]
+        counts = [self._count(n) for n in norm]
+        self.lines[start:end] = new_lines
+        self._norm[start:end] = norm
+        self._line_counts[start:end] = counts
+        self._join_counts[start:end] = [_EMPTY] * len(new_lines)
+        for c in counts:
+            self._counts.update(c)
+
+        new_end = start + len(new_lines)
+        for i in rejoin + list(range(start, new_end)):
+            self._join_counts[i] = self._join_delta(i)
+            self._counts.update(self._join_counts[i])
+
+        # Shift header indices past the edit and scan only the new lines
+        shift = len(new_lines) - (end - start)
+        self._headers = (
+            [h for h in self._headers if h < start]
+            + [start + k for k in find_section_headers(new_lines)]
+            + [h + shift for h in self._headers if h >= end]
+        )
+
+        return old_lines
+
+    def _section_range(self, name):
+        """(header_line, content_start, content_end) of a detected section, or None."""
+        pattern = SECTION_PATTERNS[name]
+        for pos, i in enumerate(self._headers):
+            if re.search(pattern, self.lines[i]):
+                stop = min(i + MAX_SECTION_LINES, len(self.lines))
+                if pos + 1 < len(self._headers):
+                    stop = min(stop, self._headers[pos + 1])
+                return i, i + 1, stop
+        return None
+
+    def replace_section(self, name, content):
+        """
+        Replace the content under a section header; appends the section if it is missing.
+        Returns (removed_lines, added_lines).
+        """
+        self._ensure_index()
+        if name not in SECTION_PATTERNS:
+            raise EditConflictError(f"Unknown section '{name}'. Expected one of: {', '.join(SECTION_PATTERNS)}")
+
+        new_lines = content.split("\n")
+        found = self._section_range(name)
+        if found is None:
+            end = len(self.lines)
+            self.replace_lines(end, end, [name] + new_lines)
+            return [], [name] + new_lines
+        _, start, stop = found
+        return self.replace_lines(start, stop, new_lines), new_lines
+
+    def apply_unified_diff(self, diff_text):
+        """
+        Apply a unified diff (as produced by difflib.unified_diff or `diff -u`).
+        Returns (removed_lines, added_lines). Raises EditConflictError if a hunk does not match.
+        """
+        self._ensure_index()
+        hunks = []
+        current = None
+        for line in diff_text.split("\n"):
+            header = _HUNK_HEADER.match(line)
+            if header:
+                old_start = int(header.group(1))
+                old_len = int(header.group(2)) if header.group(2) is not None else 1
+                current = (old_start - 1 if old_len else old_start, [], [])
+                hunks.append(current)
+            elif current is not None and line[:1] in (" ", "-", "+"):
+                if line[0] in " -":
+                    current[1].append(line[1:])
+                if line[0] in " +":
+                    current[2].append(line[1:])
+
+        if not hunks:
+            raise EditConflictError("Diff contains no hunks")
+
+        removed, added = [], []
+        offset = 0
+        for old_start, old, new in hunks:
+            start = old_start + offset
+            if self.lines[start:start + len(old)] != old:
+                raise EditConflictError(f"Diff hunk at line {old_start + 1} does not match the current resume text")
+
+            # Trim shared context so only the lines that really changed are re-scanned
+            head = 0
+            while head < min(len(old), len(new)) and old[head] == new[head]:
+                head += 1
+            tail = 0
+            while tail < min(len(old), len(new)) - head and old[-1 - tail] == new[-1 - tail]:
+                tail += 1
+
+            removed += self.replace_lines(start + head, start + len(old) - tail, new[head:len(new) - tail])
+            added += new[head:len(new) - tail]
+            offset += len(new) - len(old)
+
+        return removed, added
+
+    # ── Results ──
+
+    def apply_edits(self, edits=None, diff=None):
+        """
+        Apply section edits ([{"section": name, "content": text}, ...]) and/or a unified diff.
+        Returns (parsed_data, changed_fields) where changed_fields names the parsed_data
+        fields that differ from before, ready for pipeline.reanalyze_parsed.
+        """
+        self._ensure_index()
+        before_counts, before_hits = self._skill_counts()
+        before_sections = self.sections
+        before_level = self.experience_level
+        before_timeline = self.timeline
+
+        touched = []
+        for edit in edits or []:
+            removed, added = self.replace_section(edit["section"], edit.get("content", ""))
+            touched += removed + added
+        if diff:
+            removed, added = self.apply_unified_diff(diff)
+            touched += removed + added
+
+        self.sections = sections_from_headers(self.lines, self._headers)
+        after_counts, after_hits = self._skill_counts()
+
+        # A resume without dated roles only gains one if an edited line has digits. Once there are
+        # roles, any edit can move a role block or the Education boundary, so the (linear) scan reruns.
+        if self.timeline["roles"] or any(_has_digit(line) for line in touched):
+            self.timeline = extract_timeline(self.text, self.matcher, skills=after_counts)
+        if self.timeline != before_timeline or any(_EXPERIENCE_HINT.search(line) for line in touched):
+            self.experience_level = detect_experience_level(self.text, self.timeline)
+
+        changed = set()
+        if after_counts.keys() != before_counts.keys():
+            changed.add("found_skills")
+        if after_counts != before_counts:
+            changed.add("keyword_counts")
+        if after_hits != before_hits:
+            changed.add("fuzzy_hits")
+        if self.sections != before_sections:
+            changed.add("sections")
+        if self.experience_level != before_level:
+            changed.add("experience_level")
+        if self.timeline != before_timeline:
+            changed.add("experience_timeline")
+
+        return self.parsed_data(), changed
+
+    def parsed_data(self):
+        """parsed_data for the current text, as parse_text would build it (cached until the next edit)."""
+        if self._parsed is None:
+            self._ensure_index()
+            counts, fuzzy_hits = self._skill_counts()
+            self._parsed = assemble_parsed_data(self.text, self.job_role, set(counts), counts, self.sections,
+                                                self.experience_level, role_data=self.role_data,
+                                                fuzzy_hits=fuzzy_hits, timeline=self.timeline)
+        return self._parsed
+
+
+class StoredResume:
+    """
+    A session's resume between requests: the text, zlib-compressed, and what re-parsing it needs.
+    parsed_data and the line index are rebuilt from the text by editable() when a request
+    needs them, so each stored session costs little more than its compressed text.
+    """
+
+    __slots__ = ("_packed", "job_role", "role_data", "fuzzy", "taxonomy")
+
+    def __init__(self, text, job_role, role_data=None, fuzzy=False, taxonomy=None):
+        self._packed = zlib.compress(text.encode("utf-8"), TEXT_COMPRESS_LEVEL)
+        self.job_role = job_role
+        self.role_data = role_data
+        self.fuzzy = fuzzy
+        self.taxonomy = taxonomy or current()
+
+    @classmethod
+    def from_resume(cls, resume):
+        return cls(resume.text, resume.job_role, role_data=resume.role_data, fuzzy=resume.fuzzy,
+                   taxonomy=resume.taxonomy)
+
+    @property
+    def text(self):
+        return zlib.decompress(self._packed).decode("utf-8")
+
+    def editable(self, parsed_data=None):
+        """
+        An IncrementalResume for this text under the stored taxonomy, with parsed_data
+        already built (re-parsed unless given), so readers never trigger a lazy build.
+        """
+        with pinned(self.taxonomy):
+            resume = IncrementalResume(self.text, self.job_role, role_data=self.role_data,
+                                       parsed_data=parsed_data, fuzzy=self.fuzzy)
+            resume.parsed_data()
+        return resume
+
+    def parsed_data(self):
+        """parsed_data re-parsed from the text (see app._working_state for the cached path)."""
+        return self.editable().parsed_data()
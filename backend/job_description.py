@@ -0,0 +1,101 @@
+"""
+Job Description Matching — Derives an ad-hoc role profile from pasted job-description text.
+
+Skills are extracted with the same compiled matcher used for resumes, run over
+the whole SKILL_ALIASES / JOB_ROLES vocabulary. The derived profile and its
+compiled resume matcher are cached in an LRU keyed by a hash of the normalized
+JD text and the taxonomy version, so a popular posting is only compiled once
+per taxonomy.
+"""
+
+import hashlib
+import os
+
+from cache import LRUCache
+from metrics import metrics
+from matcher import SkillMatcher, get_vocabulary_matcher, role_skill_set
+from resume_parser import normalize_text
+from taxonomy import current
+
+DEFAULT_JD_TITLE = "Job Description Match"
+# Appended to a JD title that names a JOB_ROLES entry, so the ad-hoc role sits next to that role
+JD_TITLE_SUFFIX = " (job description)"
+MIN_JD_SKILLS = 3
+MAX_ATS_KEYWORDS = 25
+
+jd_cache = LRUCache(int(os.environ.get("JD_CACHE_SIZE", 256)))
+metrics.register_cache("jd_profiles", jd_cache)
+
+
+class NotEnoughSkillsError(ValueError):
+    """Raised when a job description mentions too few recognizable skills to build a profile."""
+
+
+def default_industry_avg(taxonomy=None):
+    """Average industry benchmark across the taxonomy's roles."""
+    taxonomy = taxonomy or current()
+
+    def build():
+        averages = [role["industry_avg"] for role in taxonomy.job_roles.values() if "industry_avg" in role]
+        return {
+            key: int(sum(avg[key] for avg in averages) / len(averages)) if averages else 0
+            for key in ("technical", "soft", "projects")
+        }
+
+    return taxonomy.cached("default_industry_avg", build)
+
+
+def jd_role_name(title=None, taxonomy=None):
+    """Role name for a JD's ad-hoc profile: its title, kept distinct from the taxonomy's JOB_ROLES."""
+    role_name = (title or "").strip() or DEFAULT_JD_TITLE
+    if role_name in (taxonomy or current()).job_roles:
+        role_name += JD_TITLE_SUFFIX
+    return role_name
+
+
+def jd_hash(jd_text, title=None):
+    """Stable cache key for a job description (insensitive to case and whitespace) under the current taxonomy."""
+    key = current().version + "\0" + (title or "") + "\0" + normalize_text(jd_text)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def derive_role_profile(jd_text, title=None):
+    """
+    Build a JOB_ROLES-style profile from job-description text.
+    Technical skills are ordered by how often the JD mentions them, so the
+    most emphasized ones become the ATS keywords.
+    """
+    taxonomy = current()
+    found, counts = get_vocabulary_matcher(taxonomy).match(normalize_text(jd_text))
+    if len(found) < MIN_JD_SKILLS:
+        raise NotEnoughSkillsError(
+            "Could not find enough recognizable skills in the job description. "
+            "Please paste the full posting including its requirements."
+        )
+
+    known_soft = taxonomy.soft_skills
+    soft_skills = sorted(s for s in found if s in known_soft)
+    technical_skills = sorted((s for s in found if s not in known_soft), key=lambda s: (-counts[s], s))
+
+    return {
+        "technical_skills": technical_skills,
+        "soft_skills": soft_skills,
+        "ats_keywords": technical_skills[:MAX_ATS_KEYWORDS],
+        "industry_avg": dict(default_industry_avg(taxonomy)),
+        "description": f"Custom role derived from a job description mentioning {len(found)} known skills.",
+        "sample_jobs": [],
+    }
+
+
+def get_jd_profile(jd_text, title=None):
+    """
+    Return (role_name, role_profile, matcher) for a job description, using the LRU cache.
+    Raises NotEnoughSkillsError if the JD is too thin to derive a profile.
+    """
+    role_name = jd_role_name(title)
+
+    def build():
+        profile = derive_role_profile(jd_text, role_name)
+        return role_name, profile, SkillMatcher(role_skill_set(profile))
+
+    return jd_cache.get_or_create(jd_hash(jd_text, role_name), build)
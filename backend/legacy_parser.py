@@ -0,0 +1,166 @@
+"""
+Legacy Parser — Frozen reference copies of the original detect_skills, detect_sections
+and detect_experience_level, kept only to check faster engines against (see differential.py).
+
+Do not optimize or "fix" this module: its per-skill regex loop, lookaround
+boundaries, re.error substring fallback, per-line section scan and findall-based
+year patterns ARE the behavior the production parser must reproduce. The only
+change from the originals is that skills and aliases come from a taxonomy
+snapshot (default: the active one) instead of the skills_db constants.
+"""
+
+import re
+from collections import Counter
+
+from taxonomy import current
+
+
+def normalize_text(text):
+    """Lowercase and clean text for matching."""
+    text = text.lower()
+    text = re.sub(r'[^\w\s/#+\-.]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def detect_skills(text, job_role, taxonomy=None):
+    """
+    Detect skills present in the resume text.
+    Returns found_skills (set), missing_skills (set), and keyword_counts (dict).
+    """
+    taxonomy = taxonomy or current()
+    normalized = normalize_text(text)
+    role_data = taxonomy.job_roles.get(job_role, {})
+    all_required = set(role_data.get("technical_skills", []) + role_data.get("soft_skills", []))
+    ats_keywords = set(role_data.get("ats_keywords", []))
+
+    # Build a combined set of all skills to search for
+    all_skills_to_check = all_required | ats_keywords
+
+    found_skills = set()
+    keyword_counts = Counter()
+
+    for skill in all_skills_to_check:
+        skill_lower = skill.lower()
+        # Create search patterns
+        raw_patterns = [skill_lower]
+
+        # Add alias patterns
+        for alias, canonical in taxonomy.skill_aliases.items():
+            if canonical == skill:
+                raw_patterns.append(alias)
+
+        for raw in raw_patterns:
+            escaped = re.escape(raw)
+            # Use lookaround boundaries that work with special chars
+            # (?<!\w) = not preceded by a word char, (?!\w) = not followed by a word char
+            # For patterns starting/ending with non-word chars, use (?<!\S) / (?!\S) as fallback
+            first_char = raw[0] if raw else ''
+            last_char = raw[-1] if raw else ''
+
+            # Choose left boundary
+            if first_char.isalnum() or first_char == '_':
+                left = r'(?<!\w)'
+            else:
+                left = r'(?:(?<=\s)|(?<=^)|(?<=\n))'
+
+            # Choose right boundary
+            if last_char.isalnum() or last_char == '_':
+                right = r'(?!\w)'
+            else:
+                right = r'(?:(?=\s)|(?=$)|(?=\n)|(?=[,;.\)\]]))'
+
+            try:
+                regex = left + escaped + right
+                matches = re.findall(regex, normalized)
+                if matches:
+                    found_skills.add(skill)
+                    keyword_counts[skill] += len(matches)
+            except re.error:
+                # Fallback: simple substring search
+                count = normalized.count(raw)
+                if count > 0:
+                    found_skills.add(skill)
+                    keyword_counts[skill] += count
+
+    missing_skills = all_skills_to_check - found_skills
+
+    return found_skills, missing_skills, dict(keyword_counts)
+
+
+def detect_sections(text):
+    """
+    Detect resume sections and return a dict of section_name -> content.
+    """
+    section_patterns = {
+        "Skills": r'(?i)\b(skills|technical skills|core competencies|technologies|tech stack)\b',
+        "Experience": r'(?i)\b(experience|work experience|employment|professional experience|work history)\b',
+        "Projects": r'(?i)\b(projects|personal projects|academic projects|project experience)\b',
+        "Education": r'(?i)\b(education|academic|qualification|degree|university|college)\b',
+        "Certifications": r'(?i)\b(certifications?|certificates?|licensed?|accreditation)\b',
+        "Summary": r'(?i)\b(summary|objective|about|profile|professional summary)\b',
+    }
+
+    sections_found = {}
+    lines = text.split('\n')
+
+    for section_name, pattern in section_patterns.items():
+        for i, line in enumerate(lines):
+            if re.search(pattern, line):
+                # Grab section content (next 20 lines max or until next section)
+                content_lines = []
+                for j in range(i + 1, min(i + 20, len(lines))):
+                    # Stop if we hit another section header
+                    is_next_section = False
+                    for _, p in section_patterns.items():
+                        if re.search(p, lines[j]) and j != i:
+                            is_next_section = True
+                            break
+                    if is_next_section:
+                        break
+                    content_lines.append(lines[j])
+
+                sections_found[section_name] = '\n'.join(content_lines).strip()
+                break
+
+    return sections_found
+
+
+def detect_experience_level(text):
+    """
+    Detect experience level from the resume text.
+    Returns: 'Fresher', 'Junior (1-2 years)', 'Mid (3-5 years)', or 'Senior (5+ years)'
+    """
+    normalized = text.lower()
+
+    # Look for year patterns like "3+ years", "5 years of experience"
+    year_patterns = [
+        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)',
+        r'(?:experience|exp)\s*(?:of)?\s*(\d+)\+?\s*(?:years?|yrs?)',
+        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:in|of|working)',
+    ]
+
+    max_years = 0
+    for pattern in year_patterns:
+        matches = re.findall(pattern, normalized)
+        for match in matches:
+            try:
+                years = int(match)
+                max_years = max(max_years, years)
+            except ValueError:
+                pass
+
+    # Check for fresher keywords
+    fresher_keywords = ['fresher', 'fresh graduate', 'entry level', 'entry-level', 'intern', 'internship', 'recent graduate']
+    is_fresher = any(kw in normalized for kw in fresher_keywords)
+
+    if max_years == 0 and is_fresher:
+        return "Fresher"
+    elif max_years == 0:
+        return "Fresher"
+    elif max_years <= 2:
+        return "Junior (1-2 years)"
+    elif max_years <= 5:
+        return "Mid (3-5 years)"
+    else:
+        return "Senior (5+ years)"
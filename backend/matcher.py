@@ -0,0 +1,189 @@
+"""
+Skill Matcher — Precompiled skill/alias patterns for fast keyword detection.
+
+detect_skills used to rebuild the alias list and regex for every skill on
+every call. A SkillMatcher does that work once per skill set and, at match
+time, skips any pattern whose literal text does not occur in the resume,
+then counts the remaining ones with str.find plus a boundary check.
+Results are identical to the original lookaround-regex scan, including
+double counting when a skill name is also listed as an alias.
+"""
+
+import re
+from collections import Counter
+
+from taxonomy import current
+
+
+def boundary_regex(raw):
+    """
+    Wrap an escaped skill pattern in lookaround boundaries that work with special chars.
+    (?<!\\w) = not preceded by a word char, (?!\\w) = not followed by a word char.
+    Patterns starting/ending with non-word chars (e.g. "c++") fall back to whitespace/punctuation.
+    """
+    escaped = re.escape(raw)
+    first_char = raw[0] if raw else ''
+    last_char = raw[-1] if raw else ''
+
+    # Choose left boundary
+    if first_char.isalnum() or first_char == '_':
+        left = r'(?<!\w)'
+    else:
+        left = r'(?:(?<=\s)|(?<=^)|(?<=\n))'
+
+    # Choose right boundary
+    if last_char.isalnum() or last_char == '_':
+        right = r'(?!\w)'
+    else:
+        right = r'(?:(?=\s)|(?=$)|(?=\n)|(?=[,;.\)\]]))'
+
+    return left + escaped + right
+
+
+def aliases_by_canonical(aliases=None):
+    """Invert an alias map (the current taxonomy's by default): canonical skill -> [alias, ...] (in alias-map order)."""
+    if aliases is None:
+        aliases = current().skill_aliases
+    inverted = {}
+    for alias, canonical in aliases.items():
+        inverted.setdefault(canonical, []).append(alias)
+    return inverted
+
+
+_RIGHT_PUNCTUATION = frozenset(",;.)]")
+
+
+def _is_word_char(ch):
+    """Same test as the regex class \\w for str patterns."""
+    return ch.isalnum() or ch == '_'
+
+
+def match_positions(normalized, raw):
+    """
+    Start offsets of the non-overlapping matches of boundary_regex(raw) in normalized text.
+    Equivalent to [m.start() for m in re.finditer(boundary_regex(raw), normalized)], but uses
+    str.find to jump between candidate positions and only checks the two
+    boundary characters, instead of letting the regex engine try every offset.
+    """
+    size = len(raw)
+    if not size:
+        return []
+    word_left = _is_word_char(raw[0])
+    word_right = _is_word_char(raw[-1])
+    end = len(normalized)
+
+    positions = []
+    pos = normalized.find(raw)
+    while pos != -1:
+        # Left boundary
+        if pos == 0:
+            left_ok = True
+        elif word_left:
+            left_ok = not _is_word_char(normalized[pos - 1])
+        else:
+            left_ok = normalized[pos - 1].isspace()
+
+        # Right boundary
+        after = pos + size
+        if not left_ok:
+            right_ok = False
+        elif after == end:
+            right_ok = True
+        elif word_right:
+            right_ok = not _is_word_char(normalized[after])
+        else:
+            right_ok = normalized[after].isspace() or normalized[after] in _RIGHT_PUNCTUATION
+
+        if right_ok:
+            positions.append(pos)
+            pos = normalized.find(raw, after)
+        else:
+            pos = normalized.find(raw, pos + 1)
+
+    return positions
+
+
+def count_matches(normalized, raw):
+    """Count non-overlapping matches of boundary_regex(raw); same as len(re.findall(...))."""
+    return len(match_positions(normalized, raw))
+
+
+class SkillMatcher:
+    """
+    Compiled matcher for a fixed set of canonical skills.
+    match() takes normalized text and returns (found_skills, keyword_counts).
+    """
+
+    def __init__(self, skills, aliases=None):
+        self.skills = frozenset(skills)
+        inverted = aliases_by_canonical(aliases)
+
+        # (skill, raw pattern) pairs; a skill name that is also an alias appears twice
+        self.patterns = []
+        for skill in sorted(self.skills):
+            for raw in [skill.lower()] + inverted.get(skill, []):
+                self.patterns.append((skill, raw))
+        self._fuzzy_index = None
+
+    def match(self, normalized):
+        found_skills = set()
+        keyword_counts = Counter()
+
+        for skill, raw in self.patterns:
+            # Cheap C-level prefilter: most patterns do not occur at all
+            if raw not in normalized:
+                continue
+            count = count_matches(normalized, raw)
+            if count:
+                found_skills.add(skill)
+                keyword_counts[skill] += count
+
+        return found_skills, keyword_counts
+
+    def restricted(self, skills):
+        """Matcher for a subset of this matcher's skills, sharing its compiled patterns."""
+        subset = SkillMatcher.__new__(SkillMatcher)
+        subset.skills = self.skills & frozenset(skills)
+        subset.patterns = [(skill, raw) for skill, raw in self.patterns if skill in subset.skills]
+        subset._fuzzy_index = None
+        return subset
+
+    @property
+    def fuzzy_index(self):
+        """Approximate-match index over the same patterns, built on first use."""
+        if self._fuzzy_index is None:
+            from fuzzy import FuzzySkillIndex
+            self._fuzzy_index = FuzzySkillIndex(self.patterns)
+        return self._fuzzy_index
+
+    def __len__(self):
+        return len(self.patterns)
+
+
+def role_skill_set(role_data):
+    """All skills detect_skills looks for in a role: required skills plus ATS keywords."""
+    return (
+        set(role_data.get("technical_skills", []))
+        | set(role_data.get("soft_skills", []))
+        | set(role_data.get("ats_keywords", []))
+    )
+
+
+def get_role_matcher(job_role, taxonomy=None):
+    """Compiled matcher for one of the taxonomy's roles (empty for unknown roles), cached per taxonomy version."""
+    taxonomy = (taxonomy or current()).matcher_owner(job_role)
+    return taxonomy.cached(("role_matcher", job_role), lambda: SkillMatcher(
+        role_skill_set(taxonomy.job_roles.get(job_role, {})), aliases=taxonomy.skill_aliases))
+
+
+def get_vocabulary_matcher(taxonomy=None):
+    """Compiled matcher over every known skill: all role skills plus alias targets."""
+    taxonomy = taxonomy or current()
+
+    def build():
+        vocabulary = set(taxonomy.skill_aliases.values())
+        for role_data in taxonomy.job_roles.values():
+            vocabulary |= role_skill_set(role_data)
+        return SkillMatcher(vocabulary, aliases=taxonomy.skill_aliases)
+
+    return taxonomy.cached("vocabulary_matcher", build)
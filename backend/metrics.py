@@ -0,0 +1,78 @@
+"""
+Metrics — In-process counters, timers and cache statistics, served at /api/metrics.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Metrics:
+    """Thread-safe registry of counters, duration summaries and components (caches, limiters) to report."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._timers = {}
+        self._sources = {}
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name, seconds):
+        """Record one duration (in seconds) under name."""
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = max(timer[2], seconds)
+
+    def average(self, name, default=0.0):
+        """Mean recorded duration (in seconds) under name, or default if nothing was recorded."""
+        with self._lock:
+            timer = self._timers.get(name)
+            return timer[1] / timer[0] if timer else default
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def register(self, name, source, kind="caches"):
+        """Report source.stats() (e.g. an LRUCache) under snapshot()[kind][name]."""
+        self._sources[(kind, name)] = source
+
+    def register_cache(self, name, cache):
+        self.register(name, cache, "caches")
+
+    def snapshot(self):
+        with self._lock:
+            counters = dict(self._counters)
+            timers = {
+                name: {
+                    "count": count,
+                    "total_ms": round(total * 1000, 3),
+                    "avg_ms": round(total * 1000 / count, 3),
+                    "max_ms": round(peak * 1000, 3),
+                }
+                for name, (count, total, peak) in self._timers.items()
+            }
+        snapshot = {"counters": counters, "timers": timers, "caches": {}}
+        for (kind, name), source in list(self._sources.items()):
+            snapshot.setdefault(kind, {})[name] = source.stats()
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+
+metrics = Metrics()
@@ -0,0 +1,316 @@
+"""
+PDF Text Extraction — Pluggable extraction engines, chosen per document, with large
+PDFs extracted page range by page range in a process pool.
+
+Engines (PdfBackend subclasses) are tried in PDF_BACKENDS order, keeping the
+installed ones; an unknown name fails at import. The default order is
+pypdf2,pypdf,pypdfium2,pdfminer: PyPDF2 stays the primary engine, and pypdf,
+pypdfium2 and pdfminer.six are fallbacks when installed. The next engine is
+used for a document when the previous one fails on it. An engine that reads
+the file but finds no text (usually a scanned PDF) is trusted, unless
+PDF_FALLBACK_ON_EMPTY=1 asks the next engines to try as well. A deployment
+that benchmarks a faster engine (benchmarks/bench_pdf_backends.py) can put
+that engine first.
+
+Whatever the engine, a document with at least PDF_PARALLEL_MIN_PAGES pages is
+split into contiguous page ranges, one per worker. Each worker opens the file
+by path, so only the path and page numbers go to a worker and only text comes
+back. The ranges are reassembled in page order, so the result is exactly
+what the serial path returns.
+
+Smaller documents use the serial path, where starting the work costs more
+than it saves. So do processes that cannot run a pool of their own: the
+daemonic workers of the bulk `score` CLI, and hosts without POSIX semaphores
+(e.g. serverless). If the pool breaks (a worker killed mid-task), the
+document is extracted serially and the next one starts a new pool.
+
+Workers are started with "spawn", not fork. Forking a threaded server can copy
+a lock held by another thread into the child.
+"""
+
+import atexit
+import io
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib.util import find_spec
+
+from metrics import metrics
+from tracing import annotate
+
+PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", 64))
+PDF_WORKERS = int(os.environ.get("PDF_EXTRACT_WORKERS", 0) or os.cpu_count() or 1)
+# Every worker re-reads the PDF's page tree, so a task should cover at least this many pages
+MIN_PAGES_PER_TASK = 16
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class PdfBackend:
+    """
+    One text-extraction engine. open() returns a document handle for page_count,
+    page_text and close; the engine is available when its `module` is installed.
+    """
+
+    name = None
+    module = None
+
+    def available(self):
+        return find_spec(self.module) is not None
+
+    def open(self, file_path):
+        raise NotImplementedError
+
+    def page_count(self, doc):
+        raise NotImplementedError
+
+    def page_text(self, doc, i):
+        raise NotImplementedError
+
+    def close(self, doc):
+        pass
+
+    def page_texts(self, file_path, start, stop):
+        """Texts of pages [start, stop) of a PDF file."""
+        doc = self.open(file_path)
+        try:
+            return [self.page_text(doc, i) for i in range(start, stop)]
+        finally:
+            self.close(doc)
+
+
+class PyPDF2Backend(PdfBackend):
+    name = "pypdf2"
+    module = "PyPDF2"
+
+    def open(self, file_path):
+        import PyPDF2
+        return PyPDF2.PdfReader(file_path)
+
+    def page_count(self, doc):
+        return len(doc.pages)
+
+    def page_text(self, doc, i):
+        return doc.pages[i].extract_text()
+
+
+class PypdfBackend(PyPDF2Backend):
+    """pypdf, the maintained successor of PyPDF2 (same reader API)."""
+
+    name = "pypdf"
+    module = "pypdf"
+
+    def open(self, file_path):
+        import pypdf
+        return pypdf.PdfReader(file_path)
+
+
+class PdfiumBackend(PdfBackend):
+    """pypdfium2 (Chrome's PDFium). PDFium is not thread-safe, so calls are serialized per process."""
+
+    name = "pypdfium2"
+    module = "pypdfium2"
+    _lock = threading.RLock()
+
+    def open(self, file_path):
+        import pypdfium2
+        with self._lock:
+            return pypdfium2.PdfDocument(file_path)
+
+    def page_count(self, doc):
+        return len(doc)
+
+    def page_text(self, doc, i):
+        with self._lock:
+            page = doc[i]
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+        return text.replace("\r\n", "\n")
+
+    def close(self, doc):
+        with self._lock:
+            doc.close()
+
+
+class PdfminerBackend(PdfBackend):
+    """pdfminer.six: slow, but rebuilds reading order from the layout of complex pages."""
+
+    name = "pdfminer"
+    module = "pdfminer"
+
+    def open(self, file_path):
+        from pdfminer.pdfpage import PDFPage
+        f = open(file_path, "rb")
+        try:
+            return f, list(PDFPage.get_pages(f))
+        except Exception:
+            f.close()
+            raise
+
+    def page_count(self, doc):
+        return len(doc[1])
+
+    def page_text(self, doc, i):
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        out = io.StringIO()
+        manager = PDFResourceManager()
+        device = TextConverter(manager, out, laparams=LAParams())
+        try:
+            PDFPageInterpreter(manager, device).process_page(doc[1][i])
+        finally:
+            device.close()
+        # Each page ends with a form feed
+        return out.getvalue().rstrip("\x0c")
+
+    def close(self, doc):
+        doc[0].close()
+
+
+BACKENDS = {backend.name: backend for backend in (PyPDF2Backend(), PypdfBackend(), PdfiumBackend(), PdfminerBackend())}
+DEFAULT_BACKENDS = "pypdf2,pypdf,pypdfium2,pdfminer"
+
+
+def backend_names(names):
+    """Engine names from a comma-separated string or a list. Raises ValueError for unknown ones."""
+    if isinstance(names, str):
+        names = [name.strip().lower() for name in names.split(",") if name.strip()]
+    unknown = [name for name in names if name not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown PDF backend(s): {', '.join(unknown)}; choose from {', '.join(BACKENDS)}")
+    return names
+
+
+# Checked once here, so a typo in PDF_BACKENDS stops the service at startup rather than failing every upload
+CONFIGURED_BACKENDS = backend_names(os.environ.get("PDF_BACKENDS") or DEFAULT_BACKENDS)
+FALLBACK_ON_EMPTY = os.environ.get("PDF_FALLBACK_ON_EMPTY", "").lower() in ("1", "true", "yes")
+
+
+def available_backends(names=None):
+    """Installed engines in preference order (names, default: the PDF_BACKENDS env var)."""
+    names = backend_names(names) if names else CONFIGURED_BACKENDS
+    return [BACKENDS[name] for name in names if BACKENDS[name].available()]
+
+
+def extract_page_range(backend_name, file_path, start, stop):
+    """Texts of pages [start, stop) of a PDF file (run in a worker process)."""
+    return BACKENDS[backend_name].page_texts(file_path, start, stop)
+
+
+def page_ranges(n_pages, workers):
+    """Contiguous [start, stop) ranges covering n_pages, one per worker (but not below MIN_PAGES_PER_TASK)."""
+    size = max(math.ceil(n_pages / max(workers, 1)), MIN_PAGES_PER_TASK)
+    return [(start, min(start + size, n_pages)) for start in range(0, n_pages, size)]
+
+
+def get_pool():
+    """The shared extraction pool, started on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool():
+    """Stop the extraction pool and its workers, if one was started (runs at exit)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_pool)
+
+
+def parallel_enabled(n_pages):
+    return (PDF_WORKERS > 1 and n_pages >= PARALLEL_MIN_PAGES
+            and not multiprocessing.current_process().daemon)
+
+
+def _extract_parallel(backend, file_path, n_pages):
+    """Page texts in page order from the pool, or None if no pool can run here."""
+    ranges = page_ranges(n_pages, PDF_WORKERS)
+    if len(ranges) < 2:
+        return None
+    try:
+        pool = get_pool()
+    except (OSError, NotImplementedError):
+        metrics.increment("pdf.pool_unavailable")
+        return None
+    try:
+        chunks = pool.map(extract_page_range, [backend.name] * len(ranges), [file_path] * len(ranges),
+                          *zip(*ranges))
+        texts = [text for chunk in chunks for text in chunk]
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        metrics.increment("pdf.pool_broken")
+        return None
+    metrics.increment("pdf.parallel_extractions")
+    annotate(workers=PDF_WORKERS, page_ranges=len(ranges))
+    return texts
+
+
+def _backend_text(backend, file_path):
+    doc = backend.open(file_path)
+    try:
+        n_pages = backend.page_count(doc)
+        texts = _extract_parallel(backend, file_path, n_pages) if parallel_enabled(n_pages) else None
+        if texts is None:
+            texts = [backend.page_text(doc, i) for i in range(n_pages)]
+    finally:
+        backend.close(doc)
+    annotate(pages=n_pages)
+    return "".join(text + "\n" for text in texts if text)
+
+
+def extract_pdf_text(file_path, backends=None):
+    """
+    Text of a PDF file (each non-empty page followed by a newline, in page order) from the
+    first engine that reads it, even if it finds no text (with FALLBACK_ON_EMPTY the next engines
+    are tried first). If no engine can read it, the first engine's error is raised.
+    """
+    backends = available_backends(backends)
+    if not backends:
+        raise RuntimeError("None of the configured PDF backends is installed (see PDF_BACKENDS; the default is PyPDF2)")
+    error = None
+    for backend in backends:
+        try:
+            text = _backend_text(backend, file_path)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            # A file one engine cannot parse is often readable by the next
+            error = error or e
+            metrics.increment(f"pdf.backend.{backend.name}.failed")
+            continue
+        if text.strip():
+            metrics.increment(f"pdf.backend.{backend.name}")
+            annotate(pdf_backend=backend.name)
+            return text
+        metrics.increment(f"pdf.backend.{backend.name}.empty")
+        if not FALLBACK_ON_EMPTY:
+            annotate(pdf_backend=backend.name)
+            return text
+    if error is not None:
+        raise error
+    return ""
@@ -0,0 +1,158 @@
+"""
+Analysis Pipeline — The parse → validate → analyze → courses flow shared by
+the Flask app and the offline CLI.
+"""
+
+import time
+
+from resume_parser import parse_resume
+from analyzer import fill_analysis, run_full_analysis, stage_fits, update_analysis
+from courses import get_recommended_courses
+from metrics import metrics
+from tracing import annotate, span, traced
+
+
+# Words that almost every real resume contains at least two of
+RESUME_INDICATORS = [
+    "education", "experience", "skills", "projects", "work",
+    "university", "college", "degree", "certifications",
+    "summary", "objective", "qualification", "employment",
+    "intern", "professional", "achievements", "responsibilities",
+    "bachelor", "master", "gpa", "resume", "curriculum vitae"
+]
+
+NOT_A_RESUME_MESSAGE = (
+    "This file does not appear to be a resume. Please upload a valid resume (PDF or DOCX) "
+    "containing sections like Education, Experience, Skills, etc."
+)
+
+
+class NotAResumeError(ValueError):
+    """Raised when the uploaded document does not look like a resume."""
+
+
+def looks_like_resume(text):
+    """Return True if the text contains enough typical resume vocabulary."""
+    text_lower = text.lower()
+    matches = sum(1 for kw in RESUME_INDICATORS if kw in text_lower)
+    return matches >= 2
+
+
+def _course_stage(parsed_data):
+    start = time.perf_counter()
+    with span("stage.courses") as s:
+        courses = get_recommended_courses(parsed_data)
+        s.set("courses", len(courses))
+    metrics.observe("stage.courses", time.perf_counter() - start)
+    return courses
+
+
+@traced("analyze")
+def analyze_parsed(parsed_data, deadline=None, degrade=False):
+    """
+    Validate parsed resume data and run the analysis and course recommendation stages.
+    Optional stages (courses among them) may be degraded, see run_full_analysis.
+    Raises NotAResumeError if the text does not look like a resume.
+    """
+    if not looks_like_resume(parsed_data.get("raw_text", "")):
+        raise NotAResumeError(NOT_A_RESUME_MESSAGE)
+
+    analysis = run_full_analysis(parsed_data, deadline, degrade)
+    if degrade or not stage_fits("courses", deadline):
+        analysis.setdefault("degraded", []).append("courses")
+    else:
+        analysis["courses"] = _course_stage(parsed_data)
+    annotate(ats_score=analysis["ats_score"], degraded=analysis.get("degraded", []))
+    return analysis
+
+
+def complete_analysis(parsed_data, analysis, names):
+    """
+    Compute the degraded sections among names for a previously degraded analysis.
+    Returns a new analysis dict; the given one is shared by sessions and never modified.
+    """
+    if not set(names) & set(analysis.get("degraded", ())):
+        return analysis
+    analysis = fill_analysis(parsed_data, analysis, names)
+    if "courses" in names and "courses" in analysis.get("degraded", ()):
+        analysis = dict(analysis)
+        analysis["courses"] = _course_stage(parsed_data)
+        remaining = [name for name in analysis["degraded"] if name != "courses"]
+        if remaining:
+            analysis["degraded"] = remaining
+        else:
+            del analysis["degraded"]
+    return analysis
+
+
+# parsed_data fields get_recommended_courses reads
+COURSE_INPUTS = {"found_skills", "keyword_counts"}
+
+
+def reanalyze_parsed(parsed_data, previous, changed_fields):
+    """
+    Incrementally refresh an analysis after some parsed_data fields changed.
+    Returns (analysis, recomputed_stage_names).
+    """
+    analysis, recomputed = update_analysis(parsed_data, previous, changed_fields)
+    if COURSE_INPUTS & set(changed_fields) and "courses" not in previous.get("degraded", ()):
+        analysis["courses"] = get_recommended_courses(parsed_data)
+        recomputed.append("courses")
+    return analysis, recomputed
+
+
+def analyze_file(file_path, job_role):
+    """
+    Full pipeline for a resume file on disk: parse, validate, analyze.
+    """
+    parsed_data = parse_resume(file_path, job_role)
+    return analyze_parsed(parsed_data)
+
+
+# Column order for flat (CSV / tabular) exports of an analysis
+FLAT_COLUMNS = [
+    "job_role", "experience_level", "ats_score", "rejection_pct",
+    "skills_section_score", "projects_score", "experience_score",
+    "keywords_density_score", "formatting_score",
+    "recommended_role", "recommended_role_score",
+    "found_technical", "found_soft", "missing_technical", "missing_soft",
+    "missing_keywords", "sections_detected",
+]
+
+_SECTION_COLUMNS = {
+    "Skills Section": "skills_section_score",
+    "Projects": "projects_score",
+    "Experience": "experience_score",
+    "Keywords Density": "keywords_density_score",
+    "Formatting": "formatting_score",
+}
+
+
+def flatten_analysis(analysis):
+    """
+    Flatten a run_full_analysis result into a single-level dict of FLAT_COLUMNS.
+    List values are joined with '; ' so they fit in one CSV cell.
+    """
+    parsed = analysis["parsed_data"]
+    recommended = analysis.get("recommended_role") or {}
+
+    row = {
+        "job_role": parsed["job_role"],
+        "experience_level": parsed["experience_level"],
+        "ats_score": analysis["ats_score"],
+        "rejection_pct": analysis["risk_assessment"]["rejection_pct"],
+        "recommended_role": recommended.get("role", ""),
+        "recommended_role_score": recommended.get("score", ""),
+        "found_technical": "; ".join(parsed["found_technical"]),
+        "found_soft": "; ".join(parsed["found_soft"]),
+        "missing_technical": "; ".join(parsed["missing_technical"]),
+        "missing_soft": "; ".join(parsed["missing_soft"]),
+        "missing_keywords": "; ".join(analysis["missing_keywords"]),
+        "sections_detected": "; ".join(parsed["sections_detected"]),
+    }
+    for item in analysis["section_scores"]:
+        column = _SECTION_COLUMNS.get(item["section"])
+        if column:
+            row[column] = item["score"]
+
+    return {col: row.get(col, "") for col in FLAT_COLUMNS}
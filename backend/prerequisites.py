@@ -0,0 +1,107 @@
+"""
+Skill Prerequisites — Compiles the taxonomy's SKILL_PREREQUISITES graph (skill -> skills
+to learn first) into a topological order and a transitive closure.
+
+The closure is stored as one integer bitmask per skill (bit = the skill's
+position in topological order), so at request time ordering a resume's gaps
+is a handful of AND operations per gap, however large the graph is.
+"""
+
+from taxonomy import TaxonomyError, current
+
+
+class SkillGraph:
+    """Compiled prerequisite graph. Raises TaxonomyError if the graph has a cycle."""
+
+    def __init__(self, prerequisites):
+        # Every skill mentioned anywhere, in first-seen order (keeps the topological order stable)
+        skills = {}
+        for skill, required in prerequisites.items():
+            skills.setdefault(skill, None)
+            for prerequisite in required:
+                skills.setdefault(prerequisite, None)
+
+        dependents = {skill: [] for skill in skills}
+        indegree = dict.fromkeys(skills, 0)
+        for skill, required in prerequisites.items():
+            for prerequisite in dict.fromkeys(required):
+                dependents[prerequisite].append(skill)
+                indegree[skill] += 1
+
+        # Kahn's algorithm
+        order = [skill for skill in skills if not indegree[skill]]
+        for skill in order:
+            for dependent in dependents[skill]:
+                indegree[dependent] -= 1
+                if not indegree[dependent]:
+                    order.append(dependent)
+        if len(order) < len(skills):
+            cycle = sorted(skill for skill, degree in indegree.items() if degree)
+            raise TaxonomyError(f"Skill prerequisites contain a cycle involving: {', '.join(cycle[:10])}")
+
+        self.order = order
+        self.rank = {skill: i for i, skill in enumerate(order)}
+        # ancestors[skill]: bitmask of every direct or indirect prerequisite
+        self.ancestors = {}
+        for skill in order:
+            mask = 0
+            for prerequisite in prerequisites.get(skill, ()):
+                mask |= self.ancestors[prerequisite] | (1 << self.rank[prerequisite])
+            self.ancestors[skill] = mask
+
+    def __len__(self):
+        return len(self.order)
+
+    def mask(self, skills):
+        """Bitmask of the given skills (skills outside the graph are ignored)."""
+        rank = self.rank
+        mask = 0
+        for skill in skills:
+            if skill in rank:
+                mask |= 1 << rank[skill]
+        return mask
+
+    def requires(self, skill, skills_mask):
+        """The skills in skills_mask that skill (transitively) depends on, in topological order."""
+        needed = self.ancestors.get(skill, 0) & skills_mask
+        required = []
+        while needed:
+            lowest = needed & -needed
+            required.append(self.order[lowest.bit_length() - 1])
+            needed ^= lowest
+        return required
+
+    def schedule(self, gaps):
+        """
+        Order gaps (given in priority order) so that every skill comes after the gaps
+        it transitively depends on. Among skills whose prerequisites are done, the
+        earliest in priority order goes next. Returns (ordered_gaps, requires),
+        where requires maps a gap to its prerequisite gaps.
+        """
+        gaps_mask = self.mask(gaps)
+        needs = {}
+        for skill in gaps:
+            needed = self.ancestors.get(skill, 0) & gaps_mask
+            if needed:
+                needs[skill] = needed
+        if not needs:
+            return list(gaps), {}
+
+        ordered = []
+        done = 0
+        pending = list(gaps)
+        rank = self.rank
+        while pending:
+            # The graph is acyclic, so some pending skill always has all its prerequisites done
+            i = next(i for i, skill in enumerate(pending) if needs.get(skill, 0) & done == needs.get(skill, 0))
+            skill = pending.pop(i)
+            ordered.append(skill)
+            if skill in rank:
+                done |= 1 << rank[skill]
+        return ordered, {skill: self.requires(skill, gaps_mask) for skill in needs}
+
+
+def get_skill_graph(taxonomy=None):
+    """SkillGraph for the taxonomy's prerequisites, built once per taxonomy version."""
+    taxonomy = taxonomy or current()
+    return taxonomy.cached("skill_graph", lambda: SkillGraph(taxonomy.skill_prerequisites))
@@ -4,21 +4,19 @@ Resume Parser — Extracts text, skills, sections, experience level, and keyword
 
 import re
 import os
-from collections import Counter
-from skills_db import JOB_ROLES, SKILL_ALIASES
+from taxonomy import current
+from matcher import SkillMatcher, get_role_matcher, role_skill_set
+from fuzzy import MIN_CONFIDENCE, fuzzy_enabled_by_default
+from text_cleanup import clean_text
+from text_patterns import _ANY_SECTION_REGEX, _SECTION_REGEXES, normalize_text
+from timeline import extract_timeline
+from pdf_extract import extract_pdf_text
+from tracing import annotate, span, traced
 
 
 def extract_text_from_pdf(file_path):
-    """Extract text from a PDF file."""
-    import PyPDF2
-    text = ""
-    with open(file_path, "rb") as f:
-        reader = PyPDF2.PdfReader(f)
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
-    return text
+    """Extract text from a PDF file with the configured engines (see pdf_extract.py)."""
+    return extract_pdf_text(file_path)
 
 
 def extract_text_from_docx(file_path):
@@ -34,147 +32,131 @@ def extract_text_from_docx(file_path):
 def extract_text(file_path):
     """Extract text from a resume file (PDF or DOCX)."""
     ext = os.path.splitext(file_path)[1].lower()
-    if ext == ".pdf":
-        return extract_text_from_pdf(file_path)
-    elif ext in (".docx", ".doc"):
-        return extract_text_from_docx(file_path)
-    else:
-        raise ValueError(f"Unsupported file format: {ext}")
+    with span("extract", file_type=ext) as s:
+        if ext == ".pdf":
+            text = extract_text_from_pdf(file_path)
+        elif ext in (".docx", ".doc"):
+            text = extract_text_from_docx(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {ext}")
+        s.set("text_length", len(text))
+    return text
 
 
-def normalize_text(text):
-    """Lowercase and clean text for matching."""
-    text = text.lower()
-    text = re.sub(r'[^\w\s/#+\-.]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+def resolve_matcher(job_role, role_data=None, matcher=None):
+    """The compiled matcher for a built-in role or a custom role profile."""
+    if matcher is not None:
+        return matcher
+    if role_data is None:
+        return get_role_matcher(job_role)
+    return SkillMatcher(role_skill_set(role_data))
 
 
-def detect_skills(text, job_role):
+@traced()
+def detect_skills(text, job_role, role_data=None, matcher=None):
     """
     Detect skills present in the resume text.
     Returns found_skills (set), missing_skills (set), and keyword_counts (dict).
+    role_data / matcher override the taxonomy's JOB_ROLES entry (e.g. for a job-description profile).
     """
     normalized = normalize_text(text)
-    role_data = JOB_ROLES.get(job_role, {})
-    all_required = set(role_data.get("technical_skills", []) + role_data.get("soft_skills", []))
-    ats_keywords = set(role_data.get("ats_keywords", []))
+    matcher = resolve_matcher(job_role, role_data, matcher)
+    if role_data is None:
+        role_data = current().job_roles.get(job_role, {})
 
     # Build a combined set of all skills to search for
-    all_skills_to_check = all_required | ats_keywords
-
-    found_skills = set()
-    keyword_counts = Counter()
-
-    for skill in all_skills_to_check:
-        skill_lower = skill.lower()
-        # Create search patterns
-        raw_patterns = [skill_lower]
-
-        # Add alias patterns
-        for alias, canonical in SKILL_ALIASES.items():
-            if canonical == skill:
-                raw_patterns.append(alias)
-
-        for raw in raw_patterns:
-            escaped = re.escape(raw)
-            # Use lookaround boundaries that work with special chars
-            # (?<!\w) = not preceded by a word char, (?!\w) = not followed by a word char
-            # For patterns starting/ending with non-word chars, use (?<!\S) / (?!\S) as fallback
-            first_char = raw[0] if raw else ''
-            last_char = raw[-1] if raw else ''
-
-            # Choose left boundary
-            if first_char.isalnum() or first_char == '_':
-                left = r'(?<!\w)'
-            else:
-                left = r'(?:(?<=\s)|(?<=^)|(?<=\n))'
-
-            # Choose right boundary
-            if last_char.isalnum() or last_char == '_':
-                right = r'(?!\w)'
-            else:
-                right = r'(?:(?=\s)|(?=$)|(?=\n)|(?=[,;.\)\]]))'
-
-            try:
-                regex = left + escaped + right
-                matches = re.findall(regex, normalized)
-                if matches:
-                    found_skills.add(skill)
-                    keyword_counts[skill] += len(matches)
-            except re.error:
-                # Fallback: simple substring search
-                count = normalized.count(raw)
-                if count > 0:
-                    found_skills.add(skill)
-                    keyword_counts[skill] += count
+    all_skills_to_check = role_skill_set(role_data)
 
+    found_skills, keyword_counts = matcher.match(normalized)
     missing_skills = all_skills_to_check - found_skills
 
     return found_skills, missing_skills, dict(keyword_counts)
 
 
+@traced()
+def detect_fuzzy_skills(text, matcher, found_skills=()):
+    """
+    Approximate matches for skills the exact scan missed (split or garbled words).
+    Returns a list of hits with skill, matched_text, distance and confidence.
+    """
+    return matcher.fuzzy_index.search(normalize_text(text), exclude=found_skills)
+
+
+def apply_fuzzy_hits(found_skills, keyword_counts, hits):
+    """Count fuzzy hits at or above MIN_CONFIDENCE as found skills (mutates both arguments)."""
+    for hit in hits:
+        if hit["confidence"] >= MIN_CONFIDENCE:
+            found_skills.add(hit["skill"])
+            keyword_counts[hit["skill"]] = keyword_counts.get(hit["skill"], 0) + 1
+
+
+MAX_SECTION_LINES = 20
+
+
+@traced()
 def detect_sections(text):
     """
     Detect resume sections and return a dict of section_name -> content.
+    A section is the first header line matching its pattern plus the following
+    lines, up to MAX_SECTION_LINES or the next header line of any section.
     """
-    section_patterns = {
-        "Skills": r'(?i)\b(skills|technical skills|core competencies|technologies|tech stack)\b',
-        "Experience": r'(?i)\b(experience|work experience|employment|professional experience|work history)\b',
-        "Projects": r'(?i)\b(projects|personal projects|academic projects|project experience)\b',
-        "Education": r'(?i)\b(education|academic|qualification|degree|university|college)\b',
-        "Certifications": r'(?i)\b(certifications?|certificates?|licensed?|accreditation)\b',
-        "Summary": r'(?i)\b(summary|objective|about|profile|professional summary)\b',
-    }
+    lines = text.split('\n')
+    return sections_from_headers(lines, find_section_headers(lines))
 
+
+def find_section_headers(lines):
+    """Indices of lines that match any section pattern."""
+    return [i for i, line in enumerate(lines) if _ANY_SECTION_REGEX.search(line)]
+
+
+def sections_from_headers(lines, header_lines):
+    """
+    Resolve sections given the precomputed header line indices.
+    Only header lines can start a section, so each section pattern is tried on that short list.
+    """
     sections_found = {}
-    lines = text.split('\n')
 
-    for section_name, pattern in section_patterns.items():
-        for i, line in enumerate(lines):
-            if re.search(pattern, line):
+    for section_name, regex in _SECTION_REGEXES.items():
+        for pos, i in enumerate(header_lines):
+            if regex.search(lines[i]):
                 # Grab section content (next 20 lines max or until next section)
-                content_lines = []
-                for j in range(i + 1, min(i + 20, len(lines))):
-                    # Stop if we hit another section header
-                    is_next_section = False
-                    for _, p in section_patterns.items():
-                        if re.search(p, lines[j]) and j != i:
-                            is_next_section = True
-                            break
-                    if is_next_section:
-                        break
-                    content_lines.append(lines[j])
-
-                sections_found[section_name] = '\n'.join(content_lines).strip()
+                stop = min(i + MAX_SECTION_LINES, len(lines))
+                if pos + 1 < len(header_lines):
+                    stop = min(stop, header_lines[pos + 1])
+                sections_found[section_name] = '\n'.join(lines[i + 1:stop]).strip()
                 break
 
     return sections_found
 
 
-def detect_experience_level(text):
+# The three "N years" phrases detect_experience_level looks for, in one scan:
+# "5+ years of experience", "experience of 5 years", "5 years in/of/working ..."
+_YEARS_PHRASE = re.compile(r'(?P<before>(?:experience|exp)\s*(?:of)?\s*)?(\d+)\+?\s*(?:years?|yrs?)')
+_YEARS_PHRASE_AFTER = re.compile(r'\s*(?:of)?\s*(?:experience|exp)|\s*(?:in|of|working)')
+
+
+def years_from_phrases(normalized):
+    """Largest N in an "N years of experience" style phrase of lowercased text (0 if none)."""
+    max_years = 0
+    for match in _YEARS_PHRASE.finditer(normalized):
+        if match.group("before") is not None or _YEARS_PHRASE_AFTER.match(normalized, match.end()):
+            max_years = max(max_years, int(match.group(2)))
+    return max_years
+
+
+@traced()
+def detect_experience_level(text, timeline=None):
     """
     Detect experience level from the resume text.
     Returns: 'Fresher', 'Junior (1-2 years)', 'Mid (3-5 years)', or 'Senior (5+ years)'
+    Uses the larger of the stated years and, if given, the merged job tenure from timeline.extract_timeline.
     """
     normalized = text.lower()
 
     # Look for year patterns like "3+ years", "5 years of experience"
-    year_patterns = [
-        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)',
-        r'(?:experience|exp)\s*(?:of)?\s*(\d+)\+?\s*(?:years?|yrs?)',
-        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:in|of|working)',
-    ]
-
-    max_years = 0
-    for pattern in year_patterns:
-        matches = re.findall(pattern, normalized)
-        for match in matches:
-            try:
-                years = int(match)
-                max_years = max(max_years, years)
-            except ValueError:
-                pass
+    max_years = years_from_phrases(normalized)
+    if timeline:
+        max_years = max(max_years, timeline["total_months"] // 12)
 
     # Check for fresher keywords
     fresher_keywords = ['fresher', 'fresh graduate', 'entry level', 'entry-level', 'intern', 'internship', 'recent graduate']
@@ -192,27 +174,65 @@ def detect_experience_level(text):
         return "Senior (5+ years)"
 
 
-def parse_resume(file_path, job_role):
+def parse_resume(file_path, job_role, role_data=None, matcher=None, fuzzy=None):
     """
     Full resume parsing pipeline.
     Returns a dict with all extracted information.
     """
     text = extract_text(file_path)
-    found_skills, missing_skills, keyword_counts = detect_skills(text, job_role)
+    return parse_text(text, job_role, role_data=role_data, matcher=matcher, fuzzy=fuzzy)
+
+
+@traced("parse")
+def parse_text(text, job_role, role_data=None, matcher=None, fuzzy=None):
+    """
+    Parse already-extracted resume text.
+    With role_data, the resume is analyzed against that profile instead of JOB_ROLES[job_role]
+    and the profile is carried along as parsed_data["role_profile"].
+    With fuzzy (default: FUZZY_SKILL_MATCHING env var), approximate matches are added
+    and listed in parsed_data["fuzzy_hits"].
+    The text first goes through text_cleanup.clean_text; raw_text is the cleaned text.
+    """
+    text = clean_text(text)
+    matcher = resolve_matcher(job_role, role_data, matcher)
+    found_skills, _, keyword_counts = detect_skills(text, job_role, role_data, matcher)
     sections = detect_sections(text)
-    experience_level = detect_experience_level(text)
+    timeline = extract_timeline(text, matcher, skills=found_skills)
+    experience_level = detect_experience_level(text, timeline)
+
+    if fuzzy is None:
+        fuzzy = fuzzy_enabled_by_default()
+    fuzzy_hits = None
+    if fuzzy:
+        fuzzy_hits = detect_fuzzy_skills(text, matcher, found_skills)
+        apply_fuzzy_hits(found_skills, keyword_counts, fuzzy_hits)
 
+    annotate(job_role=job_role, text_length=len(text), skills_found=len(found_skills),
+             sections_found=len(sections), experience_level=experience_level, fuzzy=bool(fuzzy))
+    return assemble_parsed_data(text, job_role, found_skills, keyword_counts, sections,
+                                experience_level, role_data=role_data, fuzzy_hits=fuzzy_hits, timeline=timeline)
+
+
+def assemble_parsed_data(text, job_role, found_skills, keyword_counts, sections, experience_level, role_data=None,
+                         fuzzy_hits=None, timeline=None):
+    """
+    Build the parsed_data dict from detector outputs.
+    Shared by parse_text and incremental re-analysis of edited text.
+    """
     # Separate technical and soft skills
-    role_data = JOB_ROLES.get(job_role, {})
+    role_profile = role_data
+    if role_data is None:
+        role_data = current().job_roles.get(job_role, {})
     tech_skills_set = set(role_data.get("technical_skills", []))
     soft_skills_set = set(role_data.get("soft_skills", []))
+    missing_skills = role_skill_set(role_data) - found_skills
 
     found_technical = found_skills & tech_skills_set
     found_soft = found_skills & soft_skills_set
     missing_technical = tech_skills_set - found_skills
     missing_soft = soft_skills_set - found_skills
 
-    return {
+    parsed_data = {
         "raw_text": text,
         "found_skills": sorted(list(found_skills)),
         "missing_skills": sorted(list(missing_skills)),
@@ -224,4 +244,12 @@ def parse_resume(file_path, job_role):
         "sections": sections,
         "experience_level": experience_level,
         "job_role": job_role,
+        "taxonomy_version": current().version,
     }
+    if role_profile is not None:
+        parsed_data["role_profile"] = role_profile
+    if fuzzy_hits is not None:
+        parsed_data["fuzzy_hits"] = fuzzy_hits
+    if timeline is not None:
+        parsed_data["experience_timeline"] = timeline
+    return parsed_data
@@ -0,0 +1,281 @@
+"""
+Candidate Search Index — Optional persistent SQLite index over analyzed resumes.
+
+Each analyzed resume becomes one candidate row with:
+  * skill posting lists (skill_id -> candidate ids) for exact has/missing filters,
+  * per-role ATS scores for ranking,
+  * an FTS5 document over found skills and section text for free-text queries.
+
+Enable it in the Flask app by setting SEARCH_INDEX_PATH, or pass --index to
+the bulk-scoring CLI.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from taxonomy import current
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    candidate_key TEXT NOT NULL UNIQUE,
+    job_role TEXT NOT NULL,
+    experience_level TEXT NOT NULL,
+    level TEXT NOT NULL,
+    ats_score INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS candidates_rank ON candidates(ats_score DESC);
+CREATE INDEX IF NOT EXISTS candidates_level_rank ON candidates(level, ats_score DESC);
+CREATE TABLE IF NOT EXISTS postings (
+    skill_id INTEGER NOT NULL,
+    candidate_id INTEGER NOT NULL,
+    mentions INTEGER NOT NULL,
+    PRIMARY KEY (skill_id, candidate_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_candidate ON postings(candidate_id);
+CREATE TABLE IF NOT EXISTS role_scores (
+    role TEXT NOT NULL,
+    candidate_id INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (role, candidate_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS role_scores_rank ON role_scores(role, score DESC);
+CREATE VIRTUAL TABLE IF NOT EXISTS candidate_text USING fts5(skills, sections);
+"""
+
+
+def candidate_document(parsed_data, analysis):
+    """
+    Extract the fields the index needs from parse_resume / run_full_analysis output.
+    The result is small and picklable, so CLI workers can send it to the writer process.
+    """
+    sections = parsed_data.get("sections", {})
+    return {
+        "job_role": parsed_data["job_role"],
+        "experience_level": parsed_data["experience_level"],
+        "ats_score": analysis["ats_score"],
+        "keyword_counts": {s: parsed_data["keyword_counts"].get(s, 1) for s in parsed_data["found_skills"]},
+        "role_scores": {m["role"]: m["score"] for m in analysis.get("role_matches", ())},
+        "sections_text": "\n".join(f"{name}\n{content}" for name, content in sections.items()),
+    }
+
+
+def level_label(experience_level):
+    """'Mid (3-5 years)' -> 'Mid'."""
+    return experience_level.split(" ", 1)[0] if experience_level else ""
+
+
+class CandidateIndex:
+    """
+    Thread-safe wrapper around the SQLite index file.
+    Reads use one connection per thread; writes are serialized by a lock.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._skill_ids = {}
+        with self._write_lock:
+            conn = self._conn()
+            conn.executescript(SCHEMA)
+            conn.commit()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ── Writes ──
+
+    def _skill_id(self, conn, name):
+        key = name.lower()
+        skill_id = self._skill_ids.get(key)
+        if skill_id is None:
+            conn.execute("INSERT OR IGNORE INTO skills(name) VALUES (?)", (name,))
+            skill_id = conn.execute("SELECT id FROM skills WHERE name = ?", (name,)).fetchone()[0]
+            self._skill_ids[key] = skill_id
+        return skill_id
+
+    def add(self, candidate_key, document):
+        """Insert or replace one candidate. `document` comes from candidate_document()."""
+        self.add_many([(candidate_key, document)])
+
+    def add_many(self, items):
+        """Insert or replace several candidates in a single transaction."""
+        with self._write_lock:
+            conn = self._conn()
+            try:
+                with conn:
+                    for candidate_key, doc in items:
+                        self._write(conn, candidate_key, doc)
+            except Exception:
+                # Skill ids inserted by the rolled-back transaction are gone too
+                self._skill_ids.clear()
+                raise
+
+    def _write(self, conn, candidate_key, doc):
+        row = conn.execute("SELECT id FROM candidates WHERE candidate_key = ?", (candidate_key,)).fetchone()
+        if row:
+            candidate_id = row[0]
+            conn.execute("DELETE FROM postings WHERE candidate_id = ?", (candidate_id,))
+            conn.execute("DELETE FROM role_scores WHERE candidate_id = ?", (candidate_id,))
+            conn.execute("DELETE FROM candidate_text WHERE rowid = ?", (candidate_id,))
+            conn.execute(
+                "UPDATE candidates SET job_role = ?, experience_level = ?, level = ?, ats_score = ?, indexed_at = ? WHERE id = ?",
+                (doc["job_role"], doc["experience_level"], level_label(doc["experience_level"]),
+                 doc["ats_score"], time.time(), candidate_id),
+            )
+        else:
+            candidate_id = conn.execute(
+                "INSERT INTO candidates(candidate_key, job_role, experience_level, level, ats_score, indexed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (candidate_key, doc["job_role"], doc["experience_level"], level_label(doc["experience_level"]),
+                 doc["ats_score"], time.time()),
+            ).lastrowid
+
+        conn.executemany(
+            "INSERT INTO postings(skill_id, candidate_id, mentions) VALUES (?, ?, ?)",
+            [(self._skill_id(conn, skill), candidate_id, count) for skill, count in doc["keyword_counts"].items()],
+        )
+        conn.executemany(
+            "INSERT INTO role_scores(role, candidate_id, score) VALUES (?, ?, ?)",
+            [(role, candidate_id, score) for role, score in doc["role_scores"].items()],
+        )
+        conn.execute(
+            "INSERT INTO candidate_text(rowid, skills, sections) VALUES (?, ?, ?)",
+            (candidate_id, " ".join(doc["keyword_counts"]), doc["sections_text"]),
+        )
+
+    def remove(self, candidate_key):
+        """Drop a candidate from the index. Returns True if it existed."""
+        with self._write_lock:
+            conn = self._conn()
+            with conn:
+                row = conn.execute("SELECT id FROM candidates WHERE candidate_key = ?", (candidate_key,)).fetchone()
+                if not row:
+                    return False
+                for table, column in (("postings", "candidate_id"), ("role_scores", "candidate_id"),
+                                      ("candidate_text", "rowid"), ("candidates", "id")):
+                    conn.execute(f"DELETE FROM {table} WHERE {column} = ?", (row[0],))
+        return True
+
+    # ── Queries ──
+
+    def _resolve_skill(self, conn, name):
+        """Map a user-supplied skill or alias to its skill id (None if never indexed)."""
+        name = name.strip()
+        canonical = current().skill_aliases.get(name.lower(), name)
+        row = conn.execute("SELECT id FROM skills WHERE name = ?", (canonical,)).fetchone()
+        return row[0] if row else None
+
+    def search(self, has=(), missing=(), level=None, role=None, text=None, limit=20, offset=0):
+        """
+        Find candidates that have every skill in `has`, none of `missing`,
+        an experience level starting with `level` and (optionally) an FTS5 match on `text`.
+        Results are ranked by their score for `role` (default: the role they applied for).
+
+        Filters are correlated lookups on the posting-list primary key, so SQLite
+        walks the ranking index in score order and stops after `limit` hits.
+        """
+        conn = self._conn()
+        where = []
+        params = []
+
+        for skill in has:
+            skill_id = self._resolve_skill(conn, skill)
+            if skill_id is None:
+                return []
+            where.append("EXISTS (SELECT 1 FROM postings WHERE skill_id = ? AND candidate_id = c.id)")
+            params.append(skill_id)
+
+        missing_ids = [i for i in (self._resolve_skill(conn, s) for s in missing) if i is not None]
+        if missing_ids:
+            placeholders = ", ".join("?" * len(missing_ids))
+            where.append(f"NOT EXISTS (SELECT 1 FROM postings WHERE skill_id IN ({placeholders}) AND candidate_id = c.id)")
+            params.extend(missing_ids)
+
+        if level:
+            where.append("c.level = ?")
+            params.append(level_label(level.strip().title()))
+
+        if text:
+            where.append("c.id IN (SELECT rowid FROM candidate_text WHERE candidate_text MATCH ?)")
+            params.append(text)
+
+        if role:
+            # Rank by the stored match score for the requested role
+            sql = (
+                "SELECT c.candidate_key, c.job_role, c.experience_level, c.ats_score, rs.score "
+                "FROM role_scores rs JOIN candidates c ON c.id = rs.candidate_id WHERE rs.role = ?"
+                + "".join(" AND " + clause for clause in where)
+                + " ORDER BY rs.score DESC, rs.candidate_id LIMIT ? OFFSET ?"
+            )
+            params.insert(0, role)
+        else:
+            # A candidate's ATS score is their score for the role they applied for
+            sql = (
+                "SELECT c.candidate_key, c.job_role, c.experience_level, c.ats_score, c.ats_score "
+                "FROM candidates c"
+                + ((" WHERE " + " AND ".join(where)) if where else "")
+                + " ORDER BY c.ats_score DESC LIMIT ? OFFSET ?"
+            )
+        params.extend([int(limit), int(offset)])
+
+        return [
+            {
+                "candidate": key,
+                "job_role": job_role,
+                "experience_level": experience_level,
+                "ats_score": ats_score,
+                "role_score": role_score,
+            }
+            for key, job_role, experience_level, ats_score, role_score in conn.execute(sql, params)
+        ]
+
+    def skills_for(self, candidate_key):
+        """Return {skill: mentions} for one indexed candidate."""
+        rows = self._conn().execute(
+            "SELECT s.name, p.mentions FROM candidates c "
+            "JOIN postings p ON p.candidate_id = c.id JOIN skills s ON s.id = p.skill_id "
+            "WHERE c.candidate_key = ?",
+            (candidate_key,),
+        )
+        return dict(rows)
+
+    def count(self):
+        return self._conn().execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+
+_default_index = None
+_default_lock = threading.Lock()
+
+
+def get_default_index():
+    """Return the index configured by SEARCH_INDEX_PATH, or None when indexing is disabled."""
+    global _default_index
+    path = os.environ.get("SEARCH_INDEX_PATH")
+    if not path:
+        return None
+    if _default_index is None:
+        with _default_lock:
+            if _default_index is None:
+                _default_index = CandidateIndex(path)
+    return _default_index
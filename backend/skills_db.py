@@ -446,3 +446,81 @@ COURSE_CATALOG = {
         "url": "https://www.coursera.org/specializations/algorithms"
     },
 }
+
+# Skill -> skills that should be learned first (used to order the learning roadmap)
+SKILL_PREREQUISITES = {
+    # Languages and frameworks
+    "TypeScript": ["JavaScript"],
+    "React": ["JavaScript", "HTML", "CSS"],
+    "Angular": ["TypeScript", "HTML", "CSS"],
+    "Node.js": ["JavaScript"],
+    "Express.js": ["Node.js"],
+    "GraphQL": ["REST API"],
+    "Flask": ["Python", "REST API"],
+    "FastAPI": ["Python", "REST API"],
+    "OOP": ["Java"],
+    "Algorithms": ["Data Structures"],
+    "System Design": ["Data Structures", "Algorithms", "Microservices"],
+    "Microservices": ["REST API", "Docker"],
+    "Unit Testing": ["Testing"],
+    # Data
+    "Pandas": ["Python", "NumPy"],
+    "NumPy": ["Python"],
+    "Matplotlib": ["NumPy"],
+    "Scikit-Learn": ["Pandas", "Machine Learning"],
+    "Data Cleaning": ["Excel"],
+    "Data Visualization": ["Excel"],
+    "Tableau": ["Data Visualization"],
+    "Power BI": ["Data Visualization"],
+    "Looker": ["SQL", "Data Visualization"],
+    "Dashboard": ["Data Visualization"],
+    "VBA": ["Excel"],
+    "Hypothesis Testing": ["Statistics", "Probability"],
+    "A/B Testing": ["Hypothesis Testing"],
+    "Regression": ["Statistics", "Linear Algebra"],
+    "Classification": ["Machine Learning"],
+    "Clustering": ["Machine Learning"],
+    "ETL": ["SQL"],
+    "Data Warehousing": ["SQL", "ETL"],
+    "BigQuery": ["SQL"],
+    "Redshift": ["SQL", "Data Warehousing"],
+    "Spark": ["Python", "Big Data"],
+    "Hadoop": ["Big Data"],
+    # Machine learning
+    "Machine Learning": ["Python", "Statistics", "Linear Algebra"],
+    "Feature Engineering": ["Machine Learning", "Data Preprocessing"],
+    "Data Preprocessing": ["Pandas"],
+    "Neural Networks": ["Machine Learning", "Calculus"],
+    "Deep Learning": ["Neural Networks"],
+    "TensorFlow": ["Deep Learning"],
+    "PyTorch": ["Deep Learning"],
+    "Keras": ["TensorFlow"],
+    "NLP": ["Deep Learning"],
+    "Computer Vision": ["Deep Learning"],
+    "Model Deployment": ["Machine Learning", "REST API", "Docker"],
+    "MLOps": ["Model Deployment", "CI/CD"],
+    # Cloud and infrastructure
+    "Bash": ["Linux"],
+    "Docker": ["Linux"],
+    "Kubernetes": ["Docker"],
+    "Helm": ["Kubernetes"],
+    "CI/CD": ["Git"],
+    "Jenkins": ["CI/CD"],
+    "Terraform": ["AWS"],
+    "CloudFormation": ["AWS"],
+    "Ansible": ["Linux"],
+    "TCP/IP": ["Networking"],
+    "DNS": ["Networking"],
+    "VPN": ["Networking"],
+    "Load Balancing": ["Networking"],
+    "VPC": ["AWS", "Networking"],
+    "EC2": ["AWS"],
+    "S3": ["AWS"],
+    "RDS": ["AWS", "SQL"],
+    "IAM": ["AWS", "Security"],
+    "Lambda": ["AWS"],
+    "Serverless": ["Lambda"],
+    "CloudWatch": ["AWS", "Monitoring"],
+    "Prometheus": ["Monitoring"],
+    "Grafana": ["Prometheus"],
+}
@@ -0,0 +1,328 @@
+"""
+Session Snapshots — Persists the in-memory sessions across deploys and worker restarts.
+
+Live sessions are written to one snapshot file, record by record, so saving
+never builds the whole store in memory: each record is a small frame header
+(session id, expiry time, payload length) followed by the session pickled
+and zlib-compressed on its own. The file is written next to the snapshot and
+moved over it only when complete, so a crash mid-save leaves the previous
+snapshot intact.
+
+A new process does not load the snapshot up front. It reads only the frame
+headers into an index, and a session is unpickled the first time a request
+asks for it. Sessions that were never asked for are copied into the next
+snapshot byte for byte. Expiry times are absolute (wall clock), so a
+session's TTL keeps running while the service is down.
+
+Several worker processes (e.g. gunicorn workers) can share one path: a save
+holds an exclusive lock on a ".lock" file next to the snapshot, and merges
+in the records the other workers saved there. A worker's live sessions win;
+for everything else the record on disk wins over the worker's older copy.
+
+Snapshots are pickles: only point SESSION_SNAPSHOT_PATH at a file this
+service writes.
+"""
+
+import atexit
+import os
+import pickle
+import signal
+import struct
+import sys
+import threading
+import time
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # not on Windows: saves from several processes are not serialized there
+    fcntl = None
+
+# Bumped whenever the pickled record changes shape (2: dict records, 3: no parsed_data in them)
+MAGIC = b"SKILLS-SESSIONS/3\n"
+# Formats still restored: a /2 record only has an extra field. Older snapshots are not restored.
+READABLE_MAGICS = {MAGIC, b"SKILLS-SESSIONS/2\n"}
+# session id length, expires_at (unix time), payload length
+_FRAME = struct.Struct(">HdI")
+COMPRESS_LEVEL = 1
+# The save at exit after SIGTERM waits at most this long for a periodic save already in progress
+SIGTERM_SAVE_TIMEOUT = 10.0
+# How often a save with a timeout retries the lock another process holds on the snapshot
+FILE_LOCK_POLL = 0.05
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is not in the expected format."""
+
+
+def _frame(session_id, expires_at, length):
+    key = session_id.encode()
+    return _FRAME.pack(len(key), expires_at, length) + key
+
+
+def write_records(f, records):
+    """Write (session_id, expires_at, obj) records to an open binary file. Returns the count."""
+    written = 0
+    for session_id, expires_at, obj in records:
+        payload = zlib.compress(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), COMPRESS_LEVEL)
+        f.write(_frame(session_id, expires_at, len(payload)))
+        f.write(payload)
+        written += 1
+    return written
+
+
+def _load(payload):
+    return pickle.loads(zlib.decompress(payload))
+
+
+def _frames(f):
+    if f.read(len(MAGIC)) not in READABLE_MAGICS:
+        raise SnapshotError(f"{getattr(f, 'name', 'snapshot')} is not a session snapshot")
+    while True:
+        header = f.read(_FRAME.size)
+        if not header:
+            return
+        if len(header) < _FRAME.size:
+            raise SnapshotError("Truncated session snapshot")
+        key_length, expires_at, length = _FRAME.unpack(header)
+        session_id = f.read(key_length).decode()
+        yield session_id, f.tell(), length, expires_at
+        f.seek(length, os.SEEK_CUR)
+
+
+def _lock_file(f, timeout=None):
+    """Exclusive lock on an open file, shared across processes. False if timeout passed first."""
+    if fcntl is None:
+        return True
+    if timeout is None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return True
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(FILE_LOCK_POLL)
+
+
+def read_index(f):
+    """session_id -> (payload offset, payload length, expires_at) for every record in a snapshot file."""
+    return {session_id: (offset, length, expires_at) for session_id, offset, length, expires_at in _frames(f)}
+
+
+def iter_records(f):
+    """(session_id, expires_at, obj) for each record of an open snapshot file, loaded one at a time."""
+    for session_id, offset, length, expires_at in _frames(f):
+        yield session_id, expires_at, _load(os.pread(f.fileno(), length, offset))
+
+
+class SessionSnapshotter:
+    """
+    Saves live sessions to path and restores sessions from the last snapshot on demand.
+
+    records() must yield (session_id, expires_at, obj) for the live sessions;
+    restore(session_id) returns the obj saved for a session that is not live yet.
+    """
+
+    def __init__(self, path, records, interval=0.0, on_error=None):
+        self.path = path
+        self.records = records
+        self.interval = interval
+        self.on_error = on_error
+        self.saves = 0
+        self.saved_sessions = 0
+        self.restored = 0
+        self.last_save_ms = None
+        self._file = None
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._terminating = False
+
+    def open(self):
+        """Index the existing snapshot, if any; its sessions become restorable. Returns how many."""
+        f, index = self._on_disk()
+        if f is None:
+            return 0
+        now = time.time()
+        with self._lock:
+            self._file = f
+            self._pending = {sid: entry for sid, entry in index.items() if entry[2] > now}
+            return len(self._pending)
+
+    def pending(self):
+        """Number of sessions in the snapshot that have not been restored yet."""
+        return len(self._pending)
+
+    def restore(self, session_id):
+        """(obj, expires_at) saved for session_id, or None if it is not in the snapshot or has expired."""
+        with self._lock:
+            entry = self._pending.pop(session_id, None)
+            if entry is None:
+                return None
+            offset, length, expires_at = entry
+            payload = os.pread(self._file.fileno(), length, offset)
+        if expires_at <= time.time():
+            return None
+        self.restored += 1
+        return _load(payload), expires_at
+
+    def iter_pending(self):
+        """(session_id, expires_at, obj) for sessions not restored yet, loaded one at a time but left pending."""
+        with self._lock:
+            session_ids = list(self._pending)
+        for session_id in session_ids:
+            with self._lock:
+                entry = self._pending.get(session_id)
+                if entry is None:
+                    continue
+                offset, length, expires_at = entry
+                payload = os.pread(self._file.fileno(), length, offset)
+            if expires_at > time.time():
+                yield session_id, expires_at, _load(payload)
+
+    def save(self, timeout=None):
+        """
+        Write the live sessions, plus those not restored yet and those other processes saved
+        to the same path, to a new snapshot.
+        Returns the number of records, or None if another save held the lock past timeout.
+        """
+        if not self._save_lock.acquire(timeout=-1 if timeout is None else timeout):
+            return None
+        try:
+            start = time.perf_counter()
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(f"{self.path}.lock", "ab") as lock:
+                if not _lock_file(lock, timeout):
+                    return None
+                count = self._write_merged()
+            self.saves += 1
+            self.saved_sessions = count
+            self.last_save_ms = round((time.perf_counter() - start) * 1000, 3)
+            return count
+        finally:
+            self._save_lock.release()
+
+    def _on_disk(self):
+        """(open file, index) for the snapshot currently at path, or (None, {}) if there is none to merge."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return None, {}
+        try:
+            return f, read_index(f)
+        except (SnapshotError, UnicodeDecodeError, struct.error) as e:
+            f.close()
+            self._report(e)
+            return None, {}
+
+    def _write_merged(self):
+        # Called with the snapshot's file lock held, so no other process replaces it meanwhile
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        disk, on_disk = self._on_disk()
+        with self._lock:
+            carried = dict(self._pending)
+        live = set()
+
+        def live_records():
+            for session_id, expires_at, obj in self.records():
+                live.add(session_id)
+                yield session_id, expires_at, obj
+
+        try:
+            with open(tmp, "wb") as out:
+                out.write(MAGIC)
+                count = write_records(out, live_records())
+                with self._lock:
+                    # Sessions not live here are copied as stored: another process's latest save
+                    # first, else this process's copy of a session never restored (or restored
+                    # since this save began)
+                    now = time.time()
+                    moved = {}
+                    for session_id in {**carried, **on_disk}:
+                        if session_id in live:
+                            continue
+                        source, (offset, length, expires_at) = ((disk, on_disk[session_id]) if session_id in on_disk
+                                                                else (self._file, carried[session_id]))
+                        if expires_at <= now:
+                            continue
+                        out.write(_frame(session_id, expires_at, length))
+                        moved[session_id] = (out.tell(), length, expires_at)
+                        out.write(os.pread(source.fileno(), length, offset))
+                    count += len(moved)
+                    out.flush()
+                    os.fsync(out.fileno())
+                    reopened = open(tmp, "rb")
+                    os.replace(tmp, self.path)
+                    if self._file is not None:
+                        self._file.close()
+                    self._file = reopened
+                    self._pending = {sid: moved[sid] for sid in self._pending if sid in moved}
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        finally:
+            if disk is not None:
+                disk.close()
+        return count
+
+    def start(self):
+        """
+        Save every `interval` seconds (when set) and when the interpreter exits, including
+        after a SIGTERM: the handler only makes the process exit, so the save never runs
+        inside a signal handler that may have interrupted a thread holding one of its locks.
+        """
+        if self.interval > 0:
+            threading.Thread(target=self._run, name="session-snapshot", daemon=True).start()
+        atexit.register(self._save_at_exit)
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is threading.main_thread():
+            previous = signal.getsignal(signal.SIGTERM)
+            signal.signal(signal.SIGTERM, lambda signum, frame: self._on_sigterm(previous, signum, frame))
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._save_quietly()
+
+    def _on_sigterm(self, previous, signum, frame):
+        # No locks here: just a flag, then the normal way out, which ends in the save at exit
+        self._terminating = True
+        if callable(previous):
+            # e.g. gunicorn's graceful shutdown; the worker exits once its requests finish
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            sys.exit(128 + signum)
+
+    def _save_at_exit(self):
+        self._save_quietly(timeout=SIGTERM_SAVE_TIMEOUT if self._terminating else None)
+
+    def _save_quietly(self, timeout=None):
+        try:
+            self.save(timeout)
+        except Exception as e:
+            self._report(e)
+
+    def _report(self, error):
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def stats(self):
+        return {
+            "path": self.path,
+            "interval_s": self.interval,
+            "saves": self.saves,
+            "saved_sessions": self.saved_sessions,
+            "restored": self.restored,
+            "pending": self.pending(),
+            "last_save_ms": self.last_save_ms,
+        }
@@ -0,0 +1,300 @@
+"""
+Skills Taxonomy — Versioned, hot-reloadable JOB_ROLES / SKILL_ALIASES / COURSE_CATALOG / SKILL_PREREQUISITES.
+
+The built-in taxonomy comes from skills_db.py. Setting TAXONOMY_PATH loads a
+JSON file instead:
+
+    {"version": "2024-06-01", "job_roles": {...}, "skill_aliases": {...},
+     "course_catalog": {...}, "skill_prerequisites": {...}}
+
+Sections missing from the file fall back to the built-in ones; a missing
+version is derived from a hash of the content.
+
+A Taxonomy is an immutable snapshot. Anything compiled from it (matchers,
+role indexes) is cached on the snapshot itself via cached(), so a reload
+builds a new snapshot, warms it in the background and swaps it in with a
+single assignment. Requests already running keep the snapshot they started
+with (see pinned()), and every analysis is stamped with its version.
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import skills_db
+from metrics import metrics
+from tracing import count
+
+
+class TaxonomyError(ValueError):
+    """Raised when a taxonomy file is missing, unreadable or malformed."""
+
+
+class Taxonomy:
+    """One immutable version of the skills taxonomy plus the structures compiled from it."""
+
+    def __init__(self, job_roles, skill_aliases, course_catalog, skill_prerequisites=None, version=None, source=None,
+                 base=None):
+        self.job_roles = job_roles
+        self.skill_aliases = skill_aliases
+        self.course_catalog = course_catalog
+        self.skill_prerequisites = skill_prerequisites if skill_prerequisites is not None else {}
+        self.version = version or content_version(job_roles, skill_aliases, course_catalog, self.skill_prerequisites)
+        self.source = source
+        # For tenant overlays: the taxonomy this one is layered over (see tenants.py)
+        self.base = base
+        self._derived = {}
+        self._lock = threading.Lock()
+
+    def cached(self, key, factory):
+        """Return the structure stored under key, building it with factory() on first use."""
+        try:
+            value = self._derived[key]
+        except KeyError:
+            pass
+        else:
+            count("taxonomy_cache.hits")
+            return value
+        count("taxonomy_cache.misses")
+        start = time.perf_counter()
+        value = factory()
+        metrics.observe("taxonomy.compile." + (key[0] if isinstance(key, tuple) else key), time.perf_counter() - start)
+        with self._lock:
+            return self._derived.setdefault(key, value)
+
+    def matcher_owner(self, job_role):
+        """
+        The taxonomy whose compiled matcher for job_role can be reused: an overlay that
+        neither redefines the role nor adds aliases shares its base's matcher.
+        """
+        taxonomy = self
+        while (taxonomy.base is not None and not taxonomy.overlay_aliases
+               and job_role not in taxonomy.overlay_roles):
+            taxonomy = taxonomy.base
+        return taxonomy
+
+    @property
+    def overlay_roles(self):
+        """Roles this taxonomy defines on top of its base (empty for a base taxonomy)."""
+        return self.job_roles.maps[0] if self.base is not None else {}
+
+    @property
+    def overlay_aliases(self):
+        return self.skill_aliases.maps[0] if self.base is not None else {}
+
+    @property
+    def soft_skills(self):
+        """Every soft skill named by any role."""
+        return self.cached("soft_skills", lambda: frozenset(
+            s for role in self.job_roles.values() for s in role.get("soft_skills", [])))
+
+    def describe(self):
+        return {
+            "version": self.version,
+            "source": self.source or "builtin",
+            "roles": len(self.job_roles),
+            "aliases": len(self.skill_aliases),
+            "courses": len(self.course_catalog),
+            "prerequisites": len(self.skill_prerequisites),
+        }
+
+
+def content_version(job_roles, skill_aliases, course_catalog, skill_prerequisites=None):
+    """Short content hash used as the version when none is given."""
+    payload = json.dumps([job_roles, skill_aliases, course_catalog, skill_prerequisites or {}], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def builtin_taxonomy():
+    """The taxonomy hardcoded in skills_db.py."""
+    return Taxonomy(skills_db.JOB_ROLES, skills_db.SKILL_ALIASES, skills_db.COURSE_CATALOG,
+                    skills_db.SKILL_PREREQUISITES)
+
+
+def _is_string_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_sections(data, path, require_roles=True):
+    """Check the shape of a taxonomy (or tenant overlay) file, down to the list elements. Raises TaxonomyError."""
+    if not isinstance(data, dict):
+        raise TaxonomyError(f"{path}: expected a JSON object")
+    roles = data.get("job_roles", skills_db.JOB_ROLES if require_roles else {})
+    if not isinstance(roles, dict) or (require_roles and not roles):
+        raise TaxonomyError(f"{path}: 'job_roles' must be a non-empty object")
+    for name, role in roles.items():
+        if not isinstance(role, dict):
+            raise TaxonomyError(f"{path}: role '{name}' must be an object")
+        for key in ("technical_skills", "soft_skills", "ats_keywords"):
+            if not _is_string_list(role.get(key, [])):
+                raise TaxonomyError(f"{path}: role '{name}' field '{key}' must be a list of strings")
+    for key in ("skill_aliases", "course_catalog", "skill_prerequisites"):
+        if not isinstance(data.get(key, {}), dict):
+            raise TaxonomyError(f"{path}: '{key}' must be an object")
+    for alias, canonical in data.get("skill_aliases", {}).items():
+        if not isinstance(canonical, str):
+            raise TaxonomyError(f"{path}: alias '{alias}' must map to a skill name (a string)")
+    for key, course in data.get("course_catalog", {}).items():
+        if not isinstance(course, dict):
+            raise TaxonomyError(f"{path}: course '{key}' must be an object")
+        if not _is_string_list(course.get("skills", [])):
+            raise TaxonomyError(f"{path}: course '{key}' field 'skills' must be a list of strings")
+        for field in ("rating", "duration_hours"):
+            if course.get(field) is not None and not _is_number(course[field]):
+                raise TaxonomyError(f"{path}: course '{key}' field '{field}' must be a number")
+    for skill, prerequisites in data.get("skill_prerequisites", {}).items():
+        if not _is_string_list(prerequisites):
+            raise TaxonomyError(f"{path}: prerequisites of '{skill}' must be a list of strings")
+
+
+def load_taxonomy(path):
+    """Load and validate a taxonomy JSON file. Raises TaxonomyError."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise TaxonomyError(f"Could not read taxonomy file {path}: {e}")
+    validate_sections(data, path)
+
+    return Taxonomy(
+        data.get("job_roles", skills_db.JOB_ROLES),
+        {alias.lower(): canonical for alias, canonical in data.get("skill_aliases", skills_db.SKILL_ALIASES).items()},
+        data.get("course_catalog", skills_db.COURSE_CATALOG),
+        data.get("skill_prerequisites", skills_db.SKILL_PREREQUISITES),
+        version=str(data["version"]) if data.get("version") else None,
+        source=os.path.abspath(path),
+    )
+
+
+def dump_taxonomy(taxonomy, path):
+    """Write a taxonomy as a JSON file load_taxonomy can read."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": taxonomy.version,
+            "job_roles": dict(taxonomy.job_roles),
+            "skill_aliases": dict(taxonomy.skill_aliases),
+            "course_catalog": dict(taxonomy.course_catalog),
+            "skill_prerequisites": dict(taxonomy.skill_prerequisites),
+        }, f, indent=2, ensure_ascii=False)
+
+
+# ============================================================
+#  Current Snapshot
+# ============================================================
+
+_current = None
+_pinned = contextvars.ContextVar("taxonomy", default=None)
+_reload_lock = threading.Lock()
+
+
+def _initial_taxonomy():
+    path = os.environ.get("TAXONOMY_PATH")
+    return load_taxonomy(path) if path else builtin_taxonomy()
+
+
+def current():
+    """The taxonomy for this request (if pinned) or the latest loaded one."""
+    taxonomy = _pinned.get()
+    if taxonomy is not None:
+        return taxonomy
+    return latest()
+
+
+def latest():
+    """The most recently loaded taxonomy, ignoring any pin."""
+    global _current
+    if _current is None:
+        with _reload_lock:
+            if _current is None:
+                _current = _initial_taxonomy()
+    return _current
+
+
+def pin(taxonomy=None):
+    """Pin taxonomy (default: the latest one) to the current context; returns a token for unpin()."""
+    return _pinned.set(taxonomy or latest())
+
+
+def unpin(token):
+    _pinned.reset(token)
+
+
+@contextmanager
+def pinned(taxonomy=None):
+    """Use one taxonomy snapshot for everything inside the block, even if a reload swaps it meanwhile."""
+    token = _pinned.set(taxonomy or current())
+    try:
+        yield _pinned.get()
+    finally:
+        _pinned.reset(token)
+
+
+def swap(taxonomy):
+    """Make taxonomy the current one. A single reference assignment, so readers never see a partial state."""
+    global _current
+    _current = taxonomy
+
+
+def reload_taxonomy(path=None, warm=None):
+    """
+    Load the taxonomy file (TAXONOMY_PATH by default), warm its compiled structures
+    with warm(taxonomy) and swap it in. On any error the old taxonomy stays active.
+    Returns the new Taxonomy; raises TaxonomyError.
+    """
+    path = path or os.environ.get("TAXONOMY_PATH")
+    if not path:
+        raise TaxonomyError("No taxonomy file configured (set TAXONOMY_PATH)")
+    with _reload_lock:
+        taxonomy = load_taxonomy(path)
+        if warm is not None:
+            try:
+                warm(taxonomy)
+            except TaxonomyError:
+                raise
+            except Exception as e:
+                raise TaxonomyError(f"{path}: could not compile the taxonomy: {e}") from e
+        swap(taxonomy)
+    return taxonomy
+
+
+class TaxonomyWatcher(threading.Thread):
+    """Daemon thread that reloads the taxonomy file whenever its modification time changes."""
+
+    def __init__(self, path, interval=5.0, warm=None, on_error=None):
+        super().__init__(name="taxonomy-watcher", daemon=True)
+        self.path = path
+        self.interval = interval
+        self.warm = warm
+        self.on_error = on_error
+        self._stop_event = threading.Event()
+        self._mtime = self._stat()
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            mtime = self._stat()
+            if mtime is None or mtime == self._mtime:
+                continue
+            self._mtime = mtime
+            try:
+                reload_taxonomy(self.path, warm=self.warm)
+            except Exception as e:
+                # Keep watching: the next good version of the file still gets loaded
+                if self.on_error is not None:
+                    self.on_error(e)
+
+    def stop(self):
+        self._stop_event.set()
@@ -0,0 +1,102 @@
+"""
+Tenant Taxonomies — Per-client role definitions and aliases layered over the base taxonomy.
+
+Each tenant has an overlay file TENANT_TAXONOMY_DIR/<tenant>.json with the
+same sections as a taxonomy file (job_roles, skill_aliases, course_catalog,
+skill_prerequisites).
+Overlay entries win over the base ones; a role in the overlay replaces the
+base role of the same name.
+
+The tenant taxonomy is a set of ChainMaps over the base snapshot, so a
+tenant costs only its overlay. Tenant snapshots are kept in an LRU keyed by
+base version, tenant and overlay mtime: editing an overlay or reloading the
+base taxonomy simply starts a new entry. Matchers are compiled lazily on the
+snapshot, and roles the overlay does not touch reuse the base's matchers
+unless the overlay adds aliases.
+"""
+
+import json
+import os
+import re
+from collections import ChainMap
+
+from cache import LRUCache
+from metrics import metrics
+from prerequisites import get_skill_graph
+from taxonomy import Taxonomy, TaxonomyError, content_version, latest, validate_sections
+
+TENANT_HEADER = "X-Tenant-ID"
+_TENANT_ID = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_-]{0,63}$')
+
+tenant_cache = LRUCache(int(os.environ.get("TENANT_CACHE_SIZE", 32)))
+metrics.register_cache("tenant_taxonomies", tenant_cache)
+
+
+class UnknownTenantError(LookupError):
+    """Raised when a tenant id is malformed or has no overlay file."""
+
+
+def tenant_dir():
+    return os.environ.get("TENANT_TAXONOMY_DIR")
+
+
+def overlay_path(tenant_id):
+    """Path of a tenant's overlay file; raises UnknownTenantError if there is none."""
+    directory = tenant_dir()
+    if not directory or not _TENANT_ID.match(tenant_id):
+        raise UnknownTenantError(f"Unknown tenant: {tenant_id}")
+    path = os.path.join(directory, tenant_id + ".json")
+    if not os.path.isfile(path):
+        raise UnknownTenantError(f"Unknown tenant: {tenant_id}")
+    return path
+
+
+def load_overlay(path):
+    """Read and validate an overlay file. Raises TaxonomyError."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            overlay = json.load(f)
+    except (OSError, ValueError) as e:
+        raise TaxonomyError(f"Could not read tenant overlay {path}: {e}")
+    validate_sections(overlay, path, require_roles=False)
+    return overlay
+
+
+def overlay_taxonomy(base, overlay, tenant_id, source=None):
+    """Layer an overlay dict over a base Taxonomy without copying the base."""
+    aliases = {alias.lower(): canonical for alias, canonical in overlay.get("skill_aliases", {}).items()}
+    roles = overlay.get("job_roles", {})
+    catalog = overlay.get("course_catalog", {})
+    prerequisites = overlay.get("skill_prerequisites", {})
+    version = overlay.get("version") or content_version(roles, aliases, catalog, prerequisites)
+    return Taxonomy(
+        ChainMap(roles, base.job_roles),
+        ChainMap(aliases, base.skill_aliases),
+        ChainMap(catalog, base.course_catalog),
+        ChainMap(prerequisites, base.skill_prerequisites),
+        version=f"{base.version}+{tenant_id}.{version}",
+        source=source,
+        base=base,
+    )
+
+
+def get_tenant_taxonomy(tenant_id, base=None):
+    """
+    The taxonomy for a tenant (the base taxonomy for an empty tenant id), from the LRU.
+    Raises UnknownTenantError or TaxonomyError.
+    """
+    base = base or latest()
+    if not tenant_id:
+        return base
+    path = overlay_path(tenant_id)
+    key = (base.version, tenant_id, os.stat(path).st_mtime_ns)
+
+    def build():
+        with metrics.timer("tenant.load"):
+            overlay = load_overlay(path)
+            taxonomy = overlay_taxonomy(base, overlay, tenant_id, source=os.path.abspath(path))
+            if overlay.get("skill_prerequisites"):
+                get_skill_graph(taxonomy)  # reject prerequisite cycles up front
+            return taxonomy
+
+    return tenant_cache.get_or_create(key, build)
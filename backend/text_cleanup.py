@@ -0,0 +1,126 @@
+"""
+Text Cleanup — Repairs common PDF extraction artifacts before skill matching.
+
+PyPDF2 output keeps typographic ligatures ("\\ufb01", "\\ufb02"), soft hyphens and
+invisible joiners, splits words hyphenated at a line break ("Kuber-\\nnetes")
+and, for two-column layouts, interleaves both columns line by line. Each
+repair is a single compiled regex pass, skipped when its trigger characters
+are absent.
+
+A word broken at a hyphen is only rejoined into one word when that word is a
+known skill and neither half is one; otherwise the hyphen is real
+("Python-\\nbased" -> "Python-based") and only the line break goes.
+"""
+
+import re
+from statistics import median
+
+from taxonomy import current
+from tracing import traced
+
+# Ligatures are expanded; soft hyphens and zero-width joiners are dropped
+CLEANUP_MAP = {
+    "\ufb00": "ff", "\ufb01": "fi", "\ufb02": "fl", "\ufb03": "ffi", "\ufb04": "ffl",
+    "\ufb05": "st", "\ufb06": "st",
+    # Soft hyphen, zero-width (non-)joiners, word joiner, BOM
+    "\u00ad": "", "\u200c": "", "\u200d": "", "\u2060": "", "\ufeff": "",
+    # Unicode hyphen and non-breaking hyphen, no-break space
+    "\u2010": "-", "\u2011": "-", "\u00a0": " ",
+}
+# These characters are rare, so one character-class scan that only calls back on a hit
+# is several times faster than str.translate over the whole (non-ASCII) text
+_CLEANUP_CHARS = re.compile("[" + "".join(CLEANUP_MAP) + "]")
+
+# "Kuber-\nnetes and Helm" -> "Kubernetes\nand Helm": the word fragment moves up, the line break stays
+# (The pattern starts with the literal "-" so the scan can skip ahead; the lookbehind checks the letter before it.)
+_HYPHENATED_BREAK = re.compile(r'-(?<=[^\W\d_]-)[ \t]*\r?\n[ \t]*([a-z]\w*)[ \t]*')
+# The word before the hyphen, searched for in a short span ending at it
+_WORD_BEFORE = re.compile(r'\w+$')
+WORD_BEFORE_SPAN = 64
+
+# A run of 3+ spaces (or a tab) between two pieces of text on one line
+_GUTTER = re.compile(r'(?<=\S)(?: {3,}|\t+)(?=\S)')
+
+# Share of non-empty lines that must show a gutter at a consistent position
+MIN_COLUMN_LINES = 4
+MIN_COLUMN_SHARE = 0.4
+GUTTER_TOLERANCE = 6
+
+
+def known_words(taxonomy=None):
+    """Casefolded one-word skill names and aliases of the taxonomy."""
+    taxonomy = taxonomy or current()
+
+    def build():
+        terms = set(taxonomy.skill_aliases) | set(taxonomy.skill_aliases.values())
+        for role_data in taxonomy.job_roles.values():
+            for key in ("technical_skills", "soft_skills", "ats_keywords"):
+                terms.update(role_data.get(key, []))
+        return frozenset(term.casefold() for term in terms if term.isalpha())
+
+    return taxonomy.cached("hyphen_words", build)
+
+
+def dehyphenate(text):
+    """
+    Repair words hyphenated across a line break (when the next line continues in lowercase):
+    rejoined when that makes a known skill out of two unknown halves, else kept hyphenated.
+    """
+    words = known_words()
+
+    def repair(match):
+        before = _WORD_BEFORE.search(match.string, max(0, match.start() - WORD_BEFORE_SPAN), match.start())
+        head, tail = before.group().casefold(), match.group(1).casefold()
+        if head + tail in words and head not in words and tail not in words:
+            return match.group(1) + "\n"
+        return "-" + match.group(1) + "\n"
+
+    return _HYPHENATED_BREAK.sub(repair, text)
+
+
+def split_columns(text):
+    """
+    De-interleave two-column text. If enough lines have a gutter at about the
+    same position, all left-column fragments are emitted first, then all
+    right-column fragments, so phrases read in column order again.
+    Text without a consistent gutter is returned unchanged.
+    """
+    lines = text.split("\n")
+    nonempty = sum(1 for line in lines if line.strip())
+    gutters = {}
+    for i, line in enumerate(lines):
+        match = _GUTTER.search(line)
+        if match:
+            gutters[i] = match
+    if len(gutters) < max(MIN_COLUMN_LINES, MIN_COLUMN_SHARE * nonempty):
+        return text
+
+    position = median(m.end() for m in gutters.values())
+    aligned = {i: m for i, m in gutters.items() if abs(m.end() - position) <= GUTTER_TOLERANCE}
+    if len(aligned) < max(MIN_COLUMN_LINES, MIN_COLUMN_SHARE * nonempty):
+        return text
+
+    left, right = [], []
+    for i, line in enumerate(lines):
+        match = aligned.get(i)
+        if match:
+            left.append(line[:match.start()])
+            right.append(line[match.end():])
+        elif line.strip() and len(line) - len(line.lstrip()) >= position - GUTTER_TOLERANCE:
+            right.append(line.strip())  # indented out to the right column only
+        else:
+            left.append(line)
+    return "\n".join(left + right)
+
+
+@traced()
+def clean_text(text):
+    """Full cleanup stage, run on extracted text before detection and normalization."""
+    if not text.isascii():
+        text = _CLEANUP_CHARS.sub(lambda m: CLEANUP_MAP[m.group()], text)
+    # Columns first, so a word hyphenated at the end of a column line meets its continuation
+    if "   " in text or "\t" in text:
+        text = split_columns(text)
+    if "-" in text:
+        text = dehyphenate(text)
+    return text
@@ -0,0 +1,47 @@
+"""
+Text Patterns — Matching normalization and section-header patterns, shared by the
+resume parser and the experience timeline.
+"""
+
+import re
+
+
+class _NormalizeTable(dict):
+    """
+    str.translate table for normalize_text, filled lazily per character:
+    word characters, whitespace and / # + - . are kept, everything else becomes a space.
+    """
+
+    def __missing__(self, code):
+        ch = chr(code)
+        value = code if (ch.isalnum() or ch.isspace() or ch in "_/#+-.") else " "
+        self[code] = value
+        return value
+
+
+_NORMALIZE_TABLE = _NormalizeTable()
+
+
+def normalize_text(text):
+    """Casefold and clean text for matching (one translate pass instead of two regex substitutions)."""
+    return " ".join(text.casefold().translate(_NORMALIZE_TABLE).split())
+
+
+SECTION_PATTERNS = {
+    "Skills": r'(?i)\b(skills|technical skills|core competencies|technologies|tech stack)\b',
+    "Experience": r'(?i)\b(experience|work experience|employment|professional experience|work history)\b',
+    "Projects": r'(?i)\b(projects|personal projects|academic projects|project experience)\b',
+    "Education": r'(?i)\b(education|academic|qualification|degree|university|college)\b',
+    "Certifications": r'(?i)\b(certifications?|certificates?|licensed?|accreditation)\b',
+    "Summary": r'(?i)\b(summary|objective|about|profile|professional summary)\b',
+}
+_SECTION_REGEXES = {name: re.compile(p) for name, p in SECTION_PATTERNS.items()}
+# Matches a line if any of the section patterns does
+_ANY_SECTION_REGEX = re.compile('|'.join(f"(?:{p[4:]})" for p in SECTION_PATTERNS.values()), re.IGNORECASE)
+# A line with more words than this is prose that mentions a section word, not a heading
+MAX_HEADING_WORDS = 5
+
+
+def is_heading(line):
+    """True for a line short enough to be a section heading ("Education", "Work History")."""
+    return len(line.split()) <= MAX_HEADING_WORDS
@@ -0,0 +1,205 @@
+"""
+Experience Timeline — Extracts job date ranges ("Jan 2019 – Present", "03/2017 - 2020")
+with one compiled scanner, merges overlapping intervals into total tenure and
+records when each skill was last used.
+
+Intervals are half-open month ranges. A year-only start means January, a
+year-only end means the start of that year, "Present" runs through the
+current month and future end dates are cut at the current month. Ranges on
+degree lines or inside the Education section are not counted.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date
+from itertools import accumulate
+
+from matcher import match_positions
+from tracing import traced
+from text_patterns import normalize_text, is_heading, _SECTION_REGEXES, _ANY_SECTION_REGEX
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_MONTH = r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?'
+_YEAR = r"(?:19[5-9]\d|20\d\d)"
+
+
+def _date(tag):
+    """Month-name, numeric (MM/YYYY) or bare-year date; groups are suffixed with tag."""
+    return (rf"(?:(?P<{tag}_month>{_MONTH})\s*,?\s*|(?P<{tag}_num>0?[1-9]|1[0-2])\s*[/.]\s*)?"
+            rf"(?P<{tag}_year>{_YEAR})")
+
+
+_DATE_RANGE_PATTERN = (
+    rf"(?<![\w/.]){_date('start')}"
+    r"\s*(?:-|–|—|to|till|until)\s*"
+    rf"(?:{_date('end')}|(?P<present>present|current|now|today|date))(?!\w)"
+)
+DATE_RANGE = re.compile(_DATE_RANGE_PATTERN, re.IGNORECASE)
+
+# Case-sensitive twins run on lowercased text, which the regex engine scans about twice as fast
+_DATE_RANGE_LOWER = re.compile(_DATE_RANGE_PATTERN)
+_ANY_SECTION_LOWER = re.compile(_ANY_SECTION_REGEX.pattern)
+
+# Skills not used in a role for at least this many years are reported as stale
+STALE_SKILL_YEARS = 3
+# Lines after a date range that still describe the same role
+MAX_ROLE_LINES = 25
+
+_TITLE_STRIP = " \t()[]|,;:-–—@"
+
+# Under a heading that mixes Education with Experience or Projects, lines naming a degree are
+# the education entries. Words that also name jobs or employers ("Scrum Master", "School District") are left out.
+_DEGREE = re.compile(
+    r'\b(?:bachelor(?:\'?s)?|b\.?tech|m\.?tech|b\.?sc|m\.?sc|mba|ph\.?d|diploma|gpa|cgpa)\b',
+    re.IGNORECASE,
+)
+
+
+def _month_index(match, tag, is_end):
+    """Months since year 0 for one side of a range, or None if that side is missing."""
+    year = match.group(f"{tag}_year")
+    if year is None:
+        return None
+    month_name = match.group(f"{tag}_month")
+    number = match.group(f"{tag}_num")
+    if month_name:
+        month = MONTHS[month_name[:3].lower()]
+    elif number:
+        month = int(number)
+    else:
+        return int(year) * 12  # year-only: January for starts, start of the year for ends
+    return int(year) * 12 + month - 1 + (1 if is_end else 0)
+
+
+def _format_month(index):
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def merge_intervals(intervals):
+    """Merge overlapping or touching (start, end) intervals; returns a sorted list."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+def _in_education(lines, i, header):
+    """
+    True if line i sits under an Education heading, unless that heading also names
+    Experience or Projects, in which case only lines naming a degree count.
+    """
+    if header is None:
+        return False
+    line = lines[header]
+    if not _SECTION_REGEXES["Education"].search(line):
+        return False
+    if _SECTION_REGEXES["Experience"].search(line) or _SECTION_REGEXES["Projects"].search(line):
+        return bool(_DEGREE.search(lines[i]))
+    return True
+
+
+@traced()
+def extract_timeline(text, matcher=None, skills=None, today=None):
+    """
+    Scan text for job date ranges and build the experience timeline:
+    total_months / total_years over merged intervals, the roles with their own
+    tenure and, when a SkillMatcher is given, per-skill recency.
+    `skills` (the skills already found in the whole text) narrows the recency scan.
+    """
+    today = today or date.today()
+    now = today.year * 12 + today.month  # exclusive end of the current month
+
+    lines = text.split("\n")
+    line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+
+    # One pass over the whole text for ranges and one for header candidates
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        range_regex, header_regex, scanned = _DATE_RANGE_LOWER, _ANY_SECTION_LOWER, lowered
+    else:
+        range_regex, header_regex, scanned = DATE_RANGE, _ANY_SECTION_REGEX, text
+    ranges = [(bisect_right(line_starts, m.start()) - 1, m) for m in range_regex.finditer(scanned)]
+    headers = []
+    if ranges:
+        # Only headers above the last range can decide whether a range sits under Education
+        last = ranges[-1][1].start()
+        found = {bisect_right(line_starts, m.start()) - 1 for m in header_regex.finditer(scanned, 0, last)}
+        # A bullet that mentions "university" or "degree" is not a heading
+        headers = sorted(i for i in found - {i for i, _ in ranges} if is_heading(lines[i]))
+
+    roles = []
+    for i, match in ranges:
+        pos = bisect_left(headers, i)
+        header = headers[pos - 1] if pos else None
+        start = _month_index(match, "start", is_end=False)
+        end = now if match.group("present") else _month_index(match, "end", is_end=True)
+        if end < start or start >= now or _in_education(lines, i, header):
+            continue
+        end = min(max(end, start + 1), now)
+
+        # The title is the rest of the line, or the previous line if the range stands alone
+        line = lines[i]
+        offset = line_starts[i]
+        first = i
+        title = (line[:match.start() - offset] + " " + line[match.end() - offset:]).strip(_TITLE_STRIP)
+        if sum(ch.isalpha() for ch in title) < 3 and i > 0:
+            first = i - 1
+            title = lines[first].strip(_TITLE_STRIP)
+        roles.append(({
+            "title": " ".join(title.split()),
+            "start": _format_month(start),
+            "end": "present" if match.group("present") else _format_month(end - 1),
+            "months": end - start,
+        }, first, i, start, end))
+
+    total_months = sum(end - start for start, end in merge_intervals((r[3], r[4]) for r in roles))
+
+    skill_recency = {}
+    if matcher is not None and roles:
+        if skills is not None:
+            matcher = matcher.restricted(skills)
+        # Line-preserving normalization, so each skill hit maps back to a line and then a role block
+        normalized = "\n".join(normalize_text(line) for line in lines)
+        norm_starts = list(accumulate((len(line) + 1 for line in normalized.split("\n")[:-1]), initial=0))
+        firsts = [first for _, first, _, _, _ in roles]
+        stops = []
+        for k, (_, first, line_no, _, _) in enumerate(roles):
+            stop = min(line_no + MAX_ROLE_LINES, len(lines))
+            if k + 1 < len(roles):
+                stop = min(stop, max(roles[k + 1][1], line_no + 1))
+            stops.append(stop)
+
+        for skill, raw in matcher.patterns:
+            if raw not in normalized:
+                continue
+            for pos in match_positions(normalized, raw):
+                line_no = bisect_right(norm_starts, pos) - 1
+                k = bisect_right(firsts, line_no) - 1
+                if k >= 0 and line_no < stops[k] and roles[k][4] > skill_recency.get(skill, -1):
+                    skill_recency[skill] = roles[k][4]
+
+    return {
+        "total_months": total_months,
+        "total_years": round(total_months / 12, 1),
+        "roles": [r[0] for r in roles],
+        "skill_recency": {
+            skill: {
+                "last_used": "present" if end >= now else _format_month(end - 1),
+                "years_ago": round(max(now - end, 0) / 12, 1),
+            }
+            for skill, end in sorted(skill_recency.items())
+        },
+    }
+
+
+def stale_skills(timeline, skills, years=STALE_SKILL_YEARS):
+    """Skills from `skills` whose most recent use in a dated role is at least `years` ago."""
+    recency = (timeline or {}).get("skill_recency", {})
+    return sorted(s for s in skills if s in recency and recency[s]["years_ago"] >= years)
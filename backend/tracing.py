@@ -0,0 +1,262 @@
+"""
+Tracing — Per-request trace spans written to a rotating local JSONL file.
+
+    with trace("POST /upload-resume", kind=SERVER):     # root span, head-sampled
+        with span("extract", file_type=".pdf") as s:    # child of the current span
+            ...
+            s.set("pages", 2)
+        annotate(skills_found=12)                       # attributes on the current span
+
+The sampling decision is made once, when the root span opens (TRACE_SAMPLE_RATE,
+default 0: off). Outside a sampled trace, span(), annotate() and @traced
+functions cost a single context-variable lookup. A finished trace is written
+as one line in the OTLP/JSON ExportTraceServiceRequest shape, so the file can
+be read by an OpenTelemetry Collector (otlpjsonfile receiver) or any JSONL tool.
+
+    TRACE_SAMPLE_RATE   fraction of requests traced, 0..1
+    TRACE_FILE          output path (default backend/traces/traces.jsonl)
+    TRACE_FILE_MAX_MB   size before the file is rotated (default 20, 3 backups kept)
+"""
+
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+SERVICE_NAME = "skills-check"
+
+SERVER = "SPAN_KIND_SERVER"
+INTERNAL = "SPAN_KIND_INTERNAL"
+
+_current = ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed operation in a sampled trace. As a context manager it is the current span while open."""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns", "attributes", "error",
+                 "_reset")
+
+    def __init__(self, trace, parent_id, name, kind, attributes):
+        self.trace = trace
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+        self._reset = None
+
+    def __enter__(self):
+        self._reset = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current.reset(self._reset)
+        self.end(exc)
+        return False
+
+    def set(self, key, value):
+        self.attributes[key] = value
+
+    def end(self, error=None):
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.trace.finished.append(self)
+
+    def to_otlp(self):
+        span = {
+            "traceId": f"{self.trace.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in self.attributes.items()],
+            "status": {"code": "STATUS_CODE_ERROR", "message": self.error} if self.error else {"code": "STATUS_CODE_OK"},
+        }
+        if self.parent_id is not None:
+            span["parentSpanId"] = f"{self.parent_id:016x}"
+        return span
+
+
+class _Trace:
+    __slots__ = ("trace_id", "finished")
+
+    def __init__(self):
+        self.trace_id = random.getrandbits(128)
+        self.finished = []
+
+
+class _NoopSpan:
+    """Stands in for a span when the request is not sampled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, key, value):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+class JsonlSink:
+    """Appends one JSON document per line to a size-rotated file (thread-safe)."""
+
+    def __init__(self, path, max_bytes=20 * 1024 * 1024, backups=3):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups,
+                                                             encoding="utf-8", delay=True)
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def write(self, document):
+        record = logging.LogRecord("tracing", logging.INFO, __file__, 0, json.dumps(document), None, None)
+        self._handler.handle(record)
+
+    def close(self):
+        self._handler.close()
+
+
+class Tracer:
+    """Head-sampled tracer writing finished traces to a JsonlSink."""
+
+    def __init__(self, sample_rate=0.0, sink=None):
+        self.sample_rate = sample_rate
+        self.sink = sink
+        self.traces_written = 0
+
+    @property
+    def enabled(self):
+        return self.sample_rate > 0 and self.sink is not None
+
+    def begin(self, name, kind=SERVER, **attributes):
+        """
+        Open a root span if this request is sampled. Returns a token for finish()
+        (None when not sampled).
+        """
+        if not self.enabled or random.random() >= self.sample_rate:
+            return None
+        root = Span(_Trace(), None, name, kind, attributes)
+        return root, _current.set(root)
+
+    def finish(self, token, error=None):
+        if token is None:
+            return
+        root, reset = token
+        _current.reset(reset)
+        root.end(error)
+        self.export(root.trace)
+
+    def export(self, trace):
+        resource = {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]}
+        spans = sorted(trace.finished, key=lambda s: s.start_ns)
+        self.sink.write({"resourceSpans": [{
+            "resource": resource,
+            "scopeSpans": [{"scope": {"name": SERVICE_NAME}, "spans": [s.to_otlp() for s in spans]}],
+        }]})
+        self.traces_written += 1
+
+    def stats(self):
+        return {
+            "sample_rate": self.sample_rate,
+            "file": self.sink.path if self.sink else None,
+            "traces_written": self.traces_written,
+        }
+
+
+def tracer_from_env():
+    """Tracer configured by TRACE_SAMPLE_RATE, TRACE_FILE and TRACE_FILE_MAX_MB."""
+    rate = min(max(float(os.environ.get("TRACE_SAMPLE_RATE", 0)), 0.0), 1.0)
+    if not rate:
+        return Tracer(0.0)
+    default_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "traces", "traces.jsonl")
+    max_bytes = int(float(os.environ.get("TRACE_FILE_MAX_MB", 20)) * 1024 * 1024)
+    return Tracer(rate, JsonlSink(os.environ.get("TRACE_FILE", default_path), max_bytes))
+
+
+tracer = tracer_from_env()
+
+
+@contextmanager
+def trace(name, kind=SERVER, **attributes):
+    """Root span for one unit of work (sampled per TRACE_SAMPLE_RATE)."""
+    token = tracer.begin(name, kind, **attributes)
+    error = None
+    try:
+        yield token[0] if token else NOOP_SPAN
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        tracer.finish(token, error)
+
+
+def span(name, **attributes):
+    """Child span of the current span, used as a context manager; a no-op outside a sampled trace."""
+    parent = _current.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent.trace, parent.span_id, name, INTERNAL, attributes)
+
+
+def traced(name=None):
+    """Decorator: run the function in a child span named name (default: the function name)."""
+    def decorate(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return fn(*args, **kwargs)
+            with span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def annotate(**attributes):
+    """Set attributes on the current span (no-op outside a sampled trace)."""
+    current = _current.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+
+def set_error(message):
+    """Mark the current span as failed (e.g. a request answered with a 5xx)."""
+    current = _current.get()
+    if current is not None:
+        current.error = message
+
+
+def count(key, n=1):
+    """Add n to a counter attribute on the current span (e.g. cache hits)."""
+    current = _current.get()
+    if current is not None:
+        current.attributes[key] = current.attributes.get(key, 0) + n
@@ -0,0 +1,164 @@
+"""
+ASGI vs WSGI Benchmark — Concurrent-connection capacity of the ASGI entry point
+(uvicorn) versus gunicorn sync workers on the same machine.
+
+C clients upload a resume slowly (the body trickles in over --trickle seconds,
+like a phone on a bad connection) while a reader polls /api/taxonomy. With
+sync workers every slow upload pins a worker, so reads queue behind them;
+under ASGI the uploads wait on the event loop and reads keep being served.
+
+Usage (from the project root; uvicorn is needed for the ASGI side):
+    python benchmarks/bench_asgi.py [--clients 32] [--workers 2] [--trickle 3]
+"""
+
+import argparse
+import glob
+import importlib.util
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(ROOT, "backend")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def multipart(job_role, filename, data):
+    boundary = uuid.uuid4().hex
+    body = (f'--{boundary}\r\nContent-Disposition: form-data; name="jobRole"\r\n\r\n{job_role}\r\n'
+            f'--{boundary}\r\nContent-Disposition: form-data; name="resume"; filename="{filename}"\r\n'
+            f'Content-Type: application/pdf\r\n\r\n').encode() + data + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+def read_status(sock):
+    """Read the response until the connection closes; return the status code (or None)."""
+    data = b""
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    try:
+        return int(data.split(b" ", 2)[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def slow_upload(port, body, content_type, trickle, results):
+    try:
+        sock = socket.create_connection(("127.0.0.1", port), timeout=60)
+        sock.sendall((f"POST /upload-resume HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                      f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n").encode())
+        pieces = 20
+        step = len(body) // pieces + 1
+        for i in range(0, len(body), step):
+            sock.sendall(body[i:i + step])
+            time.sleep(trickle / pieces)
+        results.append(read_status(sock))
+        sock.close()
+    except OSError:
+        results.append(None)
+
+
+def poll_reads(port, stop, latencies, failures):
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            sock = socket.create_connection(("127.0.0.1", port), timeout=5)
+            sock.sendall(b"GET /api/taxonomy HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+            status = read_status(sock)
+            sock.close()
+        except OSError:
+            status = None
+        if status == 200:
+            latencies.append((time.perf_counter() - start) * 1000)
+        else:
+            failures.append(status)
+        time.sleep(0.05)
+
+
+def run(name, command, port, args, body, content_type):
+    env = dict(os.environ, MAX_CONCURRENT_ANALYSES=str(args.workers * 2), MAX_ANALYSIS_QUEUE=str(args.clients * 2))
+    server = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if not wait_for_port(port):
+            print(f"{name}: server did not start")
+            return
+        uploads, latencies, failures = [], [], []
+        stop = threading.Event()
+        reader = threading.Thread(target=poll_reads, args=(port, stop, latencies, failures))
+        clients = [threading.Thread(target=slow_upload, args=(port, body, content_type, args.trickle, uploads))
+                   for _ in range(args.clients)]
+        start = time.perf_counter()
+        reader.start()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - start
+        stop.set()
+        reader.join()
+
+        ok = sum(1 for status in uploads if status == 200)
+        p50 = statistics.median(latencies) if latencies else float("nan")
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) >= 2 else float("nan")
+        print(f"{name:<22} uploads ok {ok}/{args.clients} in {elapsed:5.1f} s | "
+              f"reads {len(latencies)} ok, {len(failures)} failed, p50 {p50:7.1f} ms, p95 {p95:7.1f} ms")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the ASGI entry point with gunicorn sync workers.")
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent slow uploads")
+    parser.add_argument("--workers", type=int, default=2, help="Processes per server")
+    parser.add_argument("--trickle", type=float, default=3.0, help="Seconds each upload body takes to arrive")
+    args = parser.parse_args()
+
+    pdfs = sorted(glob.glob(os.path.join(BACKEND_DIR, "uploads", "*.pdf")))
+    if not pdfs:
+        print("No sample PDFs in backend/uploads")
+        return 1
+    with open(pdfs[0], "rb") as f:
+        body, content_type = multipart("Software Engineer", "resume.pdf", f.read())
+
+    port = free_port()
+    run(f"gunicorn sync x{args.workers}",
+        [sys.executable, "-m", "gunicorn", "-w", str(args.workers), "--chdir", BACKEND_DIR,
+         "-b", f"127.0.0.1:{port}", "--timeout", "120", "app:app"], port, args, body, content_type)
+
+    if importlib.util.find_spec("uvicorn") is None:
+        print("uvicorn is not installed; skipping the ASGI run (pip install uvicorn)")
+        return 0
+    port = free_port()
+    run(f"uvicorn asgi x{args.workers}",
+        [sys.executable, "-m", "uvicorn", "--app-dir", BACKEND_DIR, "--port", str(port),
+         "--workers", str(args.workers), "--log-level", "warning", "asgi:application"], port, args, body, content_type)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Extraction Benchmark — Wall-clock PDF text extraction, serial versus page ranges
+in a process pool, for synthetic resume PDFs of increasing length.
+
+For each PDF size it times the serial path and the pool with each --workers
+count (best of --repeat runs, after one warm-up run that starts the pool),
+and checks that every run returns exactly the serial text. Speedup is
+bounded by the cores actually available (reported at the top).
+
+Usage (from the project root):
+    python benchmarks/bench_extract.py [--pages 10,100,500] [--workers 2,4] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from pdfgen import synthetic_resume_pdf
+
+import pdf_extract
+
+
+def best_time(path, repeat):
+    """(best wall time in ms, text) of extract_pdf_text over repeat runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = pdf_extract.extract_pdf_text(path)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, text
+
+
+def configure(workers):
+    """Use a pool of `workers` processes for every size (1: always serial)."""
+    if pdf_extract._pool is not None:
+        pdf_extract._discard_pool(pdf_extract._pool)
+    pdf_extract.PDF_WORKERS = workers
+    pdf_extract.PARALLEL_MIN_PAGES = 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serial vs parallel PDF text extraction.")
+    parser.add_argument("--pages", default="10,100,500", help="Comma-separated PDF sizes in pages")
+    parser.add_argument("--workers", default="2,4", help="Comma-separated pool sizes to compare with serial")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pool_sizes = [int(w) for w in args.workers.split(",")]
+    print(f"{os.cpu_count()} CPU(s); parallel by default from {pdf_extract.PARALLEL_MIN_PAGES} pages")
+    print(f"{'pages':>6} {'workers':>8} {'ms':>10} {'speedup':>8}  same text")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_pages in (int(p) for p in args.pages.split(",")):
+            path = os.path.join(tmp, f"resume-{n_pages}.pdf")
+            with open(path, "wb") as f:
+                f.write(synthetic_resume_pdf(n_pages, seed=n_pages))
+
+            configure(1)
+            serial_ms, expected = best_time(path, args.repeat)
+            print(f"{n_pages:>6} {'serial':>8} {serial_ms:>10.1f} {1.0:>8.2f}")
+            for workers in pool_sizes:
+                configure(workers)
+                best_time(path, 1)  # start the pool
+                ms, text = best_time(path, args.repeat)
+                print(f"{n_pages:>6} {workers:>8} {ms:>10.1f} {serial_ms / ms:>8.2f}  {text == expected}")
+            configure(1)
+
+
+if __name__ == "__main__":
+    main()
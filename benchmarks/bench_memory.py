@@ -0,0 +1,239 @@
+"""
+Memory Benchmark — Peak and retained memory of the upload pipeline, per stage and
+per stored session, for synthetic resume PDFs from one page to hundreds.
+
+For every PDF size it reports:
+  * the full POST /upload-resume path (Flask test client) and, averaged over
+    --sessions uploads, what one stored session keeps alive (the analysis
+    record plus the editable resume state);
+  * each parser and analyzer stage run on its own, on that PDF's text;
+  * with --sites N, the N largest allocation sites while every intermediate
+    of one upload (file bytes, PyPDF2 reader and pages, raw, cleaned and
+    normalized text, parsed data, analysis, session) is alive at once, which
+    is what the pipeline's high-water mark is made of.
+
+Peak and retained bytes come from tracemalloc (Python allocations only).
+RSS is sampled from /proc every few milliseconds; its peak growth also
+counts tracemalloc's own bookkeeping and memory the allocator keeps. Times
+are inflated by tracing (PyPDF2 extraction most of all); use them only to
+compare stages within a run.
+
+Usage (from the project root):
+    python benchmarks/bench_memory.py [--pages 1,10,100,500] [--sessions 3] [--sites 15]
+"""
+
+import argparse
+import gc
+import io
+import os
+import resource
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from pdfgen import synthetic_resume_pdf
+
+import app as webapp
+from analyzer import ANALYSIS_STAGES
+from compact import compact_analysis
+from courses import get_recommended_courses
+from incremental import IncrementalResume, StoredResume
+from matcher import get_role_matcher
+from pipeline import analyze_parsed
+from resume_parser import (detect_experience_level, detect_sections, detect_skills, extract_text, normalize_text,
+                           parse_text)
+from text_cleanup import clean_text
+from timeline import extract_timeline
+
+ROLE = "Software Engineer"
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+try:
+    # Kept open and read unbuffered, so sampling does not allocate file buffers inside a measurement
+    _STATM = os.open("/proc/self/statm", os.O_RDONLY)
+except OSError:
+    _STATM = None
+
+
+def rss_bytes():
+    if _STATM is None:
+        # Peak (not current) RSS, in KB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return int(os.pread(_STATM, 128, 0).split()[1]) * PAGE_SIZE
+
+
+class RssSampler:
+    """Samples RSS on a background thread; peak_growth is the largest increase seen."""
+
+    def __init__(self, interval=0.002):
+        self.interval = interval
+        self.base = rss_bytes()
+        self.peak = self.base
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, rss_bytes())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss_bytes())
+
+    @property
+    def peak_growth(self):
+        return self.peak - self.base
+
+
+def measure(fn, *args):
+    """Run fn(*args); returns (result, row) with time, tracemalloc peak/retained and RSS peak growth."""
+    gc.collect()
+    with RssSampler() as rss:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    return result, {"ms": elapsed * 1000, "peak": peak - before, "retained": current - before,
+                    "rss": rss.peak_growth}
+
+
+def print_row(name, row):
+    print(f"    {name:<28} {row['ms']:9.1f} {row['peak'] / 1024:10.0f} {row['retained'] / 1024:12.0f} "
+          f"{row['rss'] / 1024:12.0f}")
+
+
+def upload(client, data):
+    response = client.post("/upload-resume", data={"jobRole": ROLE, "resume": (io.BytesIO(data), "resume.pdf")})
+    if response.status_code != 200:
+        raise RuntimeError(f"upload failed: {response.status_code} {response.get_json()}")
+    return response.get_json()["session_id"]
+
+
+def run_upload(client, data, sessions):
+    _, row = measure(upload, client, data)
+    print_row("upload_resume (full path)", row)
+    _, row = measure(lambda: [upload(client, data) for _ in range(sessions)])
+    for key in ("ms", "peak", "retained", "rss"):
+        row[key] /= sessions
+    print_row(f"per stored session (x{sessions})", row)
+
+
+def run_stages(path):
+    text, row = measure(extract_text, path)
+    print_row("extract", row)
+    cleaned, row = measure(clean_text, text)
+    print_row("clean_text", row)
+    _, row = measure(normalize_text, cleaned)
+    print_row("normalize_text", row)
+    matcher = get_role_matcher(ROLE)
+    (found, _, _), row = measure(detect_skills, cleaned, ROLE)
+    print_row("detect_skills", row)
+    _, row = measure(detect_sections, cleaned)
+    print_row("detect_sections", row)
+    timeline, row = measure(extract_timeline, cleaned, matcher, found)
+    print_row("extract_timeline", row)
+    _, row = measure(detect_experience_level, cleaned, timeline)
+    print_row("detect_experience_level", row)
+    parsed, row = measure(parse_text, text, ROLE)
+    print_row("parse_text (all of the above)", row)
+
+    analysis = {}
+    for name, _, compute in ANALYSIS_STAGES:
+        outputs, row = measure(compute, parsed, analysis)
+        analysis.update(outputs)
+        print_row("stage." + name, row)
+    analysis["courses"], row = measure(get_recommended_courses, parsed)
+    print_row("stage.courses", row)
+    _, row = measure(compact_analysis, analysis)
+    print_row("compact_analysis", row)
+
+
+def _site(stat):
+    frame = stat.traceback[0]
+    filename = frame.filename
+    marker = filename.rfind("site-packages" + os.sep)
+    if marker >= 0:
+        filename = filename[marker + len("site-packages") + 1:]
+    else:
+        filename = os.path.basename(filename)
+    return f"{filename}:{frame.lineno}"
+
+
+def run_sites(path, data, top):
+    """Allocation sites with one upload's intermediates all alive at the same time."""
+    import PyPDF2
+
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    page_texts = [page.extract_text() for page in reader.pages]
+    raw_text = extract_text(path)
+    cleaned = clean_text(raw_text)
+    normalized = normalize_text(cleaned)
+    parsed = parse_text(raw_text, ROLE)
+    analysis = analyze_parsed(parsed)
+    session = (compact_analysis(analysis), StoredResume.from_resume(IncrementalResume(parsed["raw_text"], ROLE, parsed_data=parsed)))
+    after = tracemalloc.take_snapshot()
+
+    stats = [s for s in after.compare_to(before, "lineno") if s.size_diff > 0]
+    total = sum(s.size_diff for s in stats)
+    print(f"    largest allocation sites (all intermediates alive: {total / 1024:.0f} KB)")
+    for stat in stats[:top]:
+        print(f"      {stat.size_diff / 1024:9.0f} KB {stat.count_diff:8d} blocks  {_site(stat)}")
+
+    by_module = {}
+    for stat in stats:
+        module = _site(stat).split(":")[0].split(os.sep)[0]
+        by_module[module] = by_module.get(module, 0) + stat.size_diff
+    print("    by module: " + ", ".join(f"{module} {size / 1024:.0f} KB" for module, size in
+                                         sorted(by_module.items(), key=lambda item: -item[1])[:8]))
+    del reader, page_texts, cleaned, normalized, session
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory profile of the upload pipeline.")
+    parser.add_argument("--pages", default="1,10,100,500", help="Comma-separated PDF sizes in pages")
+    parser.add_argument("--sessions", type=int, default=3, help="Uploads averaged for the per-session cost")
+    parser.add_argument("--sites", type=int, default=15, help="Allocation sites to list (0 to skip)")
+    args = parser.parse_args()
+
+    client = webapp.app.test_client()
+    with tempfile.TemporaryDirectory() as tmp:
+        # Warm the taxonomy caches so they are not charged to the first stage
+        warm = synthetic_resume_pdf(1, seed=99)
+        upload(client, warm)
+
+        tracemalloc.start()
+        for n_pages in (int(p) for p in args.pages.split(",")):
+            data = synthetic_resume_pdf(n_pages, seed=n_pages)
+            path = os.path.join(tmp, f"resume-{n_pages}.pdf")
+            with open(path, "wb") as f:
+                f.write(data)
+
+            print(f"\n{n_pages} pages ({len(data) / 1024:.0f} KB PDF)")
+            print(f"    {'stage':<28} {'time ms':>9} {'peak KB':>10} {'retained KB':>12} {'RSS peak KB':>12}")
+            run_upload(client, data, args.sessions)
+            run_stages(path)
+            if args.sites:
+                run_sites(path, data, args.sites)
+
+            webapp.sessions.clear()
+            webapp.resume_states.clear()
+            webapp.working_states.clear()
+            webapp.session_expiry.clear()
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+PDF Backend Benchmark — Throughput and skill recall of each installed PDF
+text-extraction engine (see backend/pdf_extract.py) on the same synthetic corpus.
+
+Every engine extracts the same --docs PDFs, built with pdfgen from known CV
+text. Recall is the share of the skills found in the source text (by the
+role's matcher, after clean_text and normalize_text, as in parse_text) that
+are still found in the extracted text. Throughput is pages per second for
+the serial extraction path.
+
+Usage (from the project root):
+    python benchmarks/bench_pdf_backends.py [--docs 20] [--pages 5] [--seed 0] [--backends pypdf2,pypdfium2]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from pdfgen import LINES_PER_PAGE, make_pdf, resume_lines
+
+from matcher import get_role_matcher
+import pdf_extract
+from pdf_extract import BACKENDS, available_backends, extract_pdf_text
+from resume_parser import normalize_text
+from skills_db import JOB_ROLES
+from text_cleanup import clean_text
+
+
+def detected_skills(text, role):
+    return get_role_matcher(role).match(normalize_text(clean_text(text)))[0]
+
+
+def build_corpus(directory, docs, pages, seed):
+    """[(path, role, skills in the source text)] for `docs` PDFs of `pages` pages each."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(docs):
+        role = rng.choice(sorted(JOB_ROLES))
+        lines = resume_lines(pages * LINES_PER_PAGE, rng, role)
+        path = os.path.join(directory, f"resume-{i}.pdf")
+        with open(path, "wb") as f:
+            f.write(make_pdf([lines[j:j + LINES_PER_PAGE] for j in range(0, len(lines), LINES_PER_PAGE)]))
+        corpus.append((path, role, detected_skills("\n".join(lines), role)))
+    return corpus
+
+
+def run_backend(name, corpus, pages):
+    found = total = failed = 0
+    start = time.perf_counter()
+    texts = []
+    for path, _, _ in corpus:
+        try:
+            texts.append(extract_pdf_text(path, [name]))
+        except Exception:
+            texts.append("")
+            failed += 1
+    elapsed = time.perf_counter() - start
+    for text, (_, role, truth) in zip(texts, corpus):
+        found += len(truth & detected_skills(text, role))
+        total += len(truth)
+    return {
+        "pages_per_s": len(corpus) * pages / elapsed,
+        "ms_per_doc": elapsed * 1000 / len(corpus),
+        "recall": found / total if total else 1.0,
+        "failed": failed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare PDF text-extraction backends.")
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5, help="Pages per PDF")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backends", default=",".join(BACKENDS), help="Comma-separated engines (installed ones run)")
+    args = parser.parse_args()
+
+    pdf_extract.PDF_WORKERS = 1  # compare the engines themselves, not the process pool
+    backends = available_backends(args.backends)
+    missing = [name for name in args.backends.split(",") if name not in {b.name for b in backends}]
+    if missing:
+        print(f"Not installed (skipped): {', '.join(missing)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = build_corpus(tmp, args.docs, args.pages, args.seed)
+        print(f"{args.docs} PDFs x {args.pages} pages")
+        print(f"{'backend':<11} {'pages/s':>9} {'ms/doc':>9} {'recall':>8} {'failed':>7}")
+        for backend in backends:
+            row = run_backend(backend.name, corpus, args.pages)
+            print(f"{backend.name:<11} {row['pages_per_s']:>9.1f} {row['ms_per_doc']:>9.1f} "
+                  f"{row['recall']:>8.3f} {row['failed']:>7}")
+
+
+if __name__ == "__main__":
+    main()
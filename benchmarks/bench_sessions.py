@@ -0,0 +1,87 @@
+"""
+Session Memory Benchmark — Bytes retained per stored session: the analysis plus
+the resume state kept for edits, stored as plain dicts and an IncrementalResume
+versus a CompactAnalysis record and a StoredResume, measured with tracemalloc.
+
+The taxonomy caches are warmed up front; what is measured is everything
+parsing and analyzing a resume leaves allocated once the session is stored
+(strings included), the way the session store holds it, both right after
+the upload and after one edit (when an IncrementalResume also holds its line
+index). Compact runs start from an empty sharing table, so its entries count.
+Also checks that each record reads back exactly as the dict it was built
+from, and each stored resume as the parsed_data it was built from.
+
+Usage (from the project root):
+    python benchmarks/bench_sessions.py [--docs 1000] [--seed 0]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from corpus import generate_corpus
+
+import compact
+from compact import compact_analysis
+from incremental import IncrementalResume, StoredResume
+from pipeline import analyze_parsed
+from resume_parser import parse_text
+
+EDIT = [{"section": "Skills", "content": "Python, Docker, Kubernetes"}]
+
+
+def plain_session(text, role, edited=False):
+    parsed_data = parse_text(text, role)
+    resume = IncrementalResume(parsed_data["raw_text"], parsed_data["job_role"], parsed_data=parsed_data)
+    if edited:
+        resume.apply_edits(edits=EDIT)
+    return analyze_parsed(resume.parsed_data()), resume
+
+
+def compact_session(text, role, edited=False):
+    analysis, resume = plain_session(text, role, edited)
+    return compact_analysis(analysis), StoredResume.from_resume(resume)
+
+
+def retained(store, corpus):
+    """Bytes still allocated after keeping store(text, role) for every resume."""
+    compact._shared.clear()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [store(text, role) for role, text, _, _ in corpus]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-session memory of stored analyses.")
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.docs, seed=args.seed)
+    parsed = [parse_text(text, role) for role, text, _, _ in corpus]
+    analyses = [analyze_parsed(parsed_data) for parsed_data in parsed]  # also warms the taxonomy caches
+
+    n = len(analyses)
+    print(f"{n} sessions (analysis + resume state)")
+    for label, edited in (("uploaded", False), ("edited once", True)):
+        plain_bytes, _ = retained(lambda text, role: plain_session(text, role, edited), corpus)
+        compact_bytes, _ = retained(lambda text, role: compact_session(text, role, edited), corpus)
+        print(f"  {label}:")
+        print(f"    plain:   {plain_bytes / n:9.0f} bytes/session")
+        print(f"    compact: {compact_bytes / n:9.0f} bytes/session  ({plain_bytes / max(compact_bytes, 1):.1f}x smaller)")
+
+    _, stored = retained(compact_session, corpus)
+    mismatches = sum(json.dumps(dict(record)) != json.dumps(analysis)
+                     for (record, _), analysis in zip(stored, analyses))
+    reparse_mismatches = sum(resume.parsed_data() != parsed_data for (_, resume), parsed_data in zip(stored, parsed))
+    print(f"  round-trip mismatches: {mismatches} records, {reparse_mismatches} re-parsed resumes")
+
+
+if __name__ == "__main__":
+    main()
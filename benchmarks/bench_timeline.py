@@ -0,0 +1,71 @@
+"""
+Experience Timeline Benchmark — Time to extract the date-range timeline and the
+experience level from long CVs, next to the original three-regex year scan.
+
+Usage (from the project root):
+    python benchmarks/bench_timeline.py [--roles 10 25 50] [--docs 50]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from corpus import make_long_cv
+
+from matcher import get_role_matcher
+from resume_parser import detect_experience_level, normalize_text
+from timeline import extract_timeline
+
+ROLE = "Software Engineer"
+
+
+def legacy_year_scan(text):
+    """The year-phrase part of detect_experience_level before the timeline: three findall passes."""
+    normalized = text.lower()
+    max_years = 0
+    for pattern in [
+        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)',
+        r'(?:experience|exp)\s*(?:of)?\s*(\d+)\+?\s*(?:years?|yrs?)',
+        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:in|of|working)',
+    ]:
+        for match in re.findall(pattern, normalized):
+            max_years = max(max_years, int(match))
+    return max_years
+
+
+def per_doc_ms(func, texts):
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    return (time.perf_counter() - start) * 1000 / len(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark experience timeline extraction on long CVs.")
+    parser.add_argument("--roles", type=int, nargs="+", default=[10, 25, 50])
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    matcher = get_role_matcher(ROLE)
+    print(f"{'roles':>6} {'chars':>8} {'legacy scan':>12} {'timeline':>10} {'+recency':>10} {'level':>10}   (ms per CV)")
+    for n_roles in args.roles:
+        rng = random.Random(args.seed)
+        texts = [make_long_cv(rng, ROLE, n_roles) for _ in range(args.docs)]
+        chars = sum(len(t) for t in texts) // len(texts)
+        legacy = per_doc_ms(legacy_year_scan, texts)
+        bare = per_doc_ms(extract_timeline, texts)
+        # As in parse_text, the recency scan is narrowed to the skills found in the whole text
+        found = {t: matcher.match(normalize_text(t))[0] for t in texts}
+        full = per_doc_ms(lambda t: extract_timeline(t, matcher, skills=found[t]), texts)
+        level = per_doc_ms(lambda t: detect_experience_level(t, extract_timeline(t, matcher, skills=found[t])), texts)
+        print(f"{n_roles:>6} {chars:>8} {legacy:>12.3f} {bare:>10.3f} {full:>10.3f} {level:>10.3f}")
+
+    timeline = extract_timeline(texts[0], matcher, skills=found[texts[0]])
+    print(f"\nSample: {len(timeline['roles'])} roles, {timeline['total_years']} years, "
+          f"level {detect_experience_level(texts[0], timeline)!r}")
+
+
+if __name__ == "__main__":
+    main()
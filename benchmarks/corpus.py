@@ -0,0 +1,149 @@
+"""
+Synthetic Resume Corpus — Deterministic resumes with known skills, optionally
+damaged the way PyPDF2 output typically is (ligatures, soft hyphens, words
+hyphenated across line breaks, interleaved two-column layouts).
+
+Used by the scripts in this directory; nothing here is imported by the app.
+"""
+
+import os
+import random
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+sys.path.insert(0, BACKEND_DIR)
+
+from skills_db import JOB_ROLES
+
+FILLER = [
+    "Designed and shipped features used by thousands of customers every day.",
+    "Collaborated with product and design to define requirements and milestones.",
+    "Improved reliability of the platform and reduced incident response time.",
+    "Mentored junior engineers and led weekly knowledge sharing sessions.",
+    "Automated repetitive workflows, saving the team several hours per week.",
+    "Profiled and optimized critical paths for a significant speedup.",
+    "Wrote clear documentation and onboarding guides for new team members.",
+    "Presented findings to stakeholders and drove decisions with data.",
+]
+
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Analytics"]
+SCHOOLS = ["State University", "Institute of Technology", "City College"]
+
+_LIGATURES = [("ffi", "\ufb03"), ("ffl", "\ufb04"), ("ff", "\ufb00"), ("fi", "\ufb01"), ("fl", "\ufb02")]
+
+
+def make_resume(rng, role):
+    """Return (clean_text, true_skills) for one synthetic resume for a JOB_ROLES role."""
+    role_data = JOB_ROLES[role]
+    technical = rng.sample(role_data["technical_skills"], k=min(len(role_data["technical_skills"]), rng.randint(4, 10)))
+    soft = rng.sample(role_data["soft_skills"], k=min(len(role_data["soft_skills"]), rng.randint(1, 3)))
+    years = rng.randint(0, 12)
+
+    lines = [
+        "Alex Example",
+        "Summary",
+        f"{role} with {years} years of experience building reliable software.",
+        "Skills",
+        ", ".join(technical),
+        ", ".join(soft),
+        "Experience",
+    ]
+    for _ in range(rng.randint(1, 4)):
+        start = rng.randint(2008, 2022)
+        lines.append(f"{role} at {rng.choice(COMPANIES)} ({start} - {start + rng.randint(1, 4)})")
+        lines += rng.sample(FILLER, k=3)
+        lines.append(f"Used {rng.choice(technical)} and {rng.choice(technical)} in production.")
+    lines += [
+        "Projects",
+        f"Built an internal tool with {rng.choice(technical)}. " + rng.choice(FILLER),
+        "Education",
+        f"Bachelor of Science, {rng.choice(SCHOOLS)}",
+    ]
+    return "\n".join(lines), set(technical) | set(soft)
+
+
+def _wrap(line, width, hyphenate):
+    """Wrap one line at width characters; words crossing the edge are hyphenated like a PDF would."""
+    out, current = [], ""
+    for word in line.split(" "):
+        candidate = (current + " " + word).strip()
+        if len(candidate) <= width:
+            current = candidate
+            continue
+        room = width - len(current) - 2
+        if hyphenate and len(word) >= 6 and room >= 3 and word[:room].isalpha():
+            out.append((current + " " + word[:room]).strip() + "-")
+            current = word[room:]
+        else:
+            out.append(current)
+            current = word
+    if current:
+        out.append(current)
+    return out
+
+
+def damage(text, rng, columns=False):
+    """Apply PDF-style extraction artifacts to clean resume text."""
+    for plain, ligature in _LIGATURES:
+        text = text.replace(plain, ligature)
+
+    # Soft hyphens inside a few long words
+    words = text.split(" ")
+    for i, word in enumerate(words):
+        if len(word) > 8 and word.isalpha() and rng.random() < 0.1:
+            words[i] = word[:4] + "\u00ad" + word[4:]
+    text = " ".join(words)
+
+    width = 34 if columns else rng.randint(40, 70)
+    wrapped = []
+    for line in text.split("\n"):
+        wrapped += _wrap(line, width, hyphenate=True)
+
+    if not columns:
+        return "\n".join(wrapped)
+
+    # Two columns: first half on the left, second half on the right, printed side by side
+    half = (len(wrapped) + 1) // 2
+    left, right = wrapped[:half], wrapped[half:]
+    rows = []
+    for i in range(half):
+        r = right[i] if i < len(right) else ""
+        rows.append((left[i].ljust(width) + "    " + r).rstrip())
+    return "\n".join(rows)
+
+
+_MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def make_long_cv(rng, role, n_roles=40):
+    """A long CV (about n_roles dated positions plus education) in a mix of date formats."""
+    role_data = JOB_ROLES[role]
+    lines = ["Alex Example", "Summary", f"{role} with a long career.", "Experience"]
+    year, month = 2024, 6
+    for k in range(n_roles):
+        months = rng.randint(4, 30)
+        end_y, end_m = year, month
+        start_index = end_y * 12 + end_m - 1 - months
+        start_y, start_m = divmod(start_index, 12)
+        start = f"{_MONTH_NAMES[start_m]} {start_y}"
+        end = "Present" if k == 0 else rng.choice([f"{_MONTH_NAMES[end_m - 1]} {end_y}", f"{end_m:02d}/{end_y}"])
+        lines.append(f"{role} at {rng.choice(COMPANIES)} | {start} – {end}")
+        lines += rng.sample(FILLER, k=4)
+        lines.append("Tools: " + ", ".join(rng.sample(role_data["technical_skills"], k=3)))
+        year, month = divmod(start_index - rng.randint(0, 3), 12)
+        month += 1
+    lines += ["Education", f"Bachelor of Science, {rng.choice(SCHOOLS)}, 1990 - 1994"]
+    return "\n".join(lines)
+
+
+def generate_corpus(n=200, seed=0, column_share=0.3):
+    """List of (role, damaged_text, clean_text, true_skills), reproducible for a given seed."""
+    rng = random.Random(seed)
+    roles = sorted(JOB_ROLES)
+    corpus = []
+    for _ in range(n):
+        role = rng.choice(roles)
+        clean, truth = make_resume(rng, role)
+        damaged = damage(clean, rng, columns=rng.random() < column_share)
+        corpus.append((role, damaged, clean, truth))
+    return corpus
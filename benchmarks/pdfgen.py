@@ -0,0 +1,79 @@
+"""
+Synthetic PDF Generator — Writes text-only PDFs of any page count without a PDF
+library, for the memory and extraction benchmarks.
+
+Each page is a content stream of Helvetica text lines (one Tj per line), the
+simplest layout PyPDF2 and other extractors read back line by line. Text is
+taken from corpus.make_long_cv, so skills, sections and dated positions look
+like a real (very long) CV.
+
+Used by the scripts in this directory; nothing here is imported by the app.
+"""
+
+import random
+
+from corpus import make_long_cv
+from skills_db import JOB_ROLES
+
+LINES_PER_PAGE = 50
+MAX_LINE_CHARS = 95
+
+
+def _escape(line):
+    line = line.encode("cp1252", "replace").decode("latin-1")
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages):
+    """PDF bytes for pages, a list of pages each given as a list of text lines."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    page_refs = []
+    for lines in pages:
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+        ops += [f"({_escape(line)}) Tj T*" for line in lines]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_ref = len(objects)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref)
+        page_refs.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_refs)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def resume_lines(n_lines, rng, role=None):
+    """n_lines of CV text (long CVs concatenated as needed), wrapped to MAX_LINE_CHARS."""
+    role = role or rng.choice(sorted(JOB_ROLES))
+    lines = []
+    while len(lines) < n_lines:
+        for line in make_long_cv(rng, role).split("\n"):
+            while len(line) > MAX_LINE_CHARS:
+                cut = line.rfind(" ", 0, MAX_LINE_CHARS)
+                cut = cut if cut > 0 else MAX_LINE_CHARS
+                lines.append(line[:cut])
+                line = line[cut:].lstrip()
+            lines.append(line)
+    return lines[:n_lines]
+
+
+def synthetic_resume_pdf(n_pages, seed=0, role=None):
+    """PDF bytes of an n_pages-long synthetic resume, reproducible for a given seed."""
+    rng = random.Random(seed)
+    lines = resume_lines(n_pages * LINES_PER_PAGE, rng, role)
+    return make_pdf([lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)])
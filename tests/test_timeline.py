@@ -0,0 +1,42 @@
+"""
+Timeline regression cases: job lines that name schools or degrees, and prose that mentions them,
+must not be mistaken for education entries.
+"""
+
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from timeline import extract_timeline  # noqa: E402
+
+TODAY = date(2024, 1, 1)
+
+
+def total_years(text):
+    return extract_timeline(text, today=TODAY)["total_years"]
+
+
+def test_job_titles_with_degree_words_are_counted():
+    assert total_years("Experience\nScrum Master, Acme Corp  Jan 2018 - Present") == 6.1
+    assert total_years("Experience\nWeb Developer, School District 5  Jan 2018 - Present") == 6.1
+    assert total_years("Experience\nTeacher, Lincoln High School  Aug 2012 - Jun 2020") == 7.9
+
+
+def test_bullet_mentioning_a_university_is_not_a_heading():
+    text = ("Experience\n"
+            "Analyst, Foo  Jan 2012 - Dec 2015\n"
+            "- Recruited interns from the local university for the analytics team\n"
+            "Engineer, Bar  Jan 2016 - Present")
+    assert total_years(text) == 12.1
+
+
+def test_education_ranges_are_skipped():
+    assert total_years("Education\nBSc Computer Science  2010 - 2014\n"
+                       "Experience\nEngineer, Bar  Jan 2016 - Present") == 8.1
+
+
+def test_degree_lines_under_a_mixed_heading_are_skipped():
+    assert total_years("Education & Experience\nBachelor of Science, State University  2010 - 2014\n"
+                       "Engineer, Bar  Jan 2016 - Present") == 8.1